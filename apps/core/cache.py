@@ -0,0 +1,56 @@
+# apps/core/cache.py
+from django_redis.cache import RedisCache
+
+from . import timing
+
+
+class TimedCacheMixin:
+    """
+    Reports every cache call to the per-request timing collector.
+    Mix in front of any Django cache backend.
+    """
+
+    TIMED_METHODS = (
+        "add",
+        "get",
+        "set",
+        "touch",
+        "delete",
+        "get_many",
+        "set_many",
+        "delete_many",
+        "has_key",
+        "incr",
+        "decr",
+        "clear",
+    )
+
+
+def _timed(name):
+    def method(self, *args, **kwargs):
+        with timing.measure("cache"):
+            return getattr(super(TimedCacheMixin, self), name)(*args, **kwargs)
+
+    method.__name__ = name
+    return method
+
+
+for _name in TimedCacheMixin.TIMED_METHODS:
+    setattr(TimedCacheMixin, _name, _timed(_name))
+
+
+class InstrumentedRedisCache(TimedCacheMixin, RedisCache):
+    """django_redis cache backend with per-request timing."""
+
+
+def get_redis_client(alias="default"):
+    """
+    Returns the raw Redis client behind a cache alias, or None when the
+    backend is not django_redis (e.g. local memory cache in tests).
+    """
+    from django_redis import get_redis_connection
+
+    try:
+        return get_redis_connection(alias)
+    except NotImplementedError:
+        return None
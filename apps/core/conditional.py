@@ -0,0 +1,39 @@
+# apps/core/conditional.py
+from django.utils.cache import get_conditional_response, quote_etag
+
+
+class ConditionalGetMixin:
+    """
+    ETag-based conditional GET for list/retrieve actions.
+
+    Subclasses return a cheap validator from `get_etag_token` (e.g. a
+    content version kept in the cache). When it matches If-None-Match the
+    view answers 304 before touching the queryset or the serializer.
+    A handler that knows the exact version it rendered may set the ETag
+    itself; it is kept.
+    """
+
+    def get_etag_token(self):
+        return None
+
+    def conditional(self, request, handler, *args, **kwargs):
+        token = self.get_etag_token()
+        if token is None:
+            return handler(request, *args, **kwargs)
+
+        etag = quote_etag(token)
+        not_modified = get_conditional_response(request, etag=etag)
+        if not_modified is not None:
+            not_modified["ETag"] = etag
+            return not_modified
+
+        response = handler(request, *args, **kwargs)
+        if response.status_code == 200:
+            response.setdefault("ETag", etag)
+        return response
+
+    def list(self, request, *args, **kwargs):
+        return self.conditional(request, super().list, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.conditional(request, super().retrieve, *args, **kwargs)
@@ -0,0 +1,61 @@
+# apps/core/importing.py
+import json
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+# (line number, parsed record or None, parse error or None)
+ParsedRecord = Tuple[int, Optional[dict], Optional[str]]
+
+
+@dataclass
+class ImportResult:
+    """
+    Outcome of a bulk import. Only the first MAX_REPORTED_REJECTIONS
+    rejections are kept, so memory stays bounded on very dirty files.
+    """
+
+    MAX_REPORTED_REJECTIONS = 100
+
+    imported: int = 0
+    rejected: int = 0
+    elapsed: float = 0.0
+    rejections: List[dict] = field(default_factory=list)
+
+    @property
+    def rows_per_second(self) -> float:
+        processed = self.imported + self.rejected
+        return round(processed / self.elapsed, 1) if self.elapsed else 0.0
+
+    def reject(self, line_number, errors) -> dict:
+        rejection = {"line": line_number, "errors": errors}
+        self.rejected += 1
+        if len(self.rejections) < self.MAX_REPORTED_REJECTIONS:
+            self.rejections.append(rejection)
+        return rejection
+
+    def as_dict(self) -> dict:
+        return {
+            "imported": self.imported,
+            "rejected": self.rejected,
+            "elapsed_seconds": round(self.elapsed, 3),
+            "rows_per_second": self.rows_per_second,
+            "rejections": self.rejections,
+        }
+
+
+def parse_jsonl(lines: Iterable[str]) -> Iterator[ParsedRecord]:
+    """
+    Parses one JSON object per line; blank lines are skipped.
+    """
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as exc:
+            yield line_number, None, f"Invalid JSON: {exc}"
+            continue
+        if not isinstance(record, dict):
+            yield line_number, None, "Each line must be a JSON object."
+            continue
+        yield line_number, record, None
@@ -0,0 +1,76 @@
+# apps/core/metrics.py
+"""
+Prometheus metrics of the API hot paths.
+
+Under gunicorn every worker is a separate process, so PROMETHEUS_MULTIPROC_DIR
+must point to a writable (ideally tmpfs) directory that is emptied before the
+server starts; each worker then writes its samples there and the /metrics
+view aggregates all of them. Without the variable metrics are per process,
+which is what runserver and tests use.
+"""
+import os
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "Request latency by route.",
+    ["method", "route", "status"],
+)
+REQUEST_DB_QUERIES = Histogram(
+    "http_request_db_queries",
+    "SQL statements issued per request, by route.",
+    ["route"],
+    buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100, float("inf")),
+)
+ANSWERS_SUBMITTED = Counter(
+    "trivia_answers_submitted_total",
+    "Answers accepted, by submission mode.",
+    ["mode"],
+)
+ANSWER_OUTCOMES = Counter(
+    "trivia_answer_outcomes_total",
+    "Scoring outcome of submitted answers.",
+    ["outcome"],
+)
+CACHE_REQUESTS = Counter(
+    "app_cache_requests_total",
+    "Application cache lookups by cache and result.",
+    ["cache", "result"],
+)
+
+LEADERBOARD_FALLBACKS = Counter(
+    "trivia_leaderboard_sql_fallbacks_total",
+    "Ranking reads served from SQL because the Redis board was cold.",
+    ["read"],
+)
+LOGIN_QUEUE_DEPTH = Gauge(
+    "auth_login_queue_depth",
+    "Logins waiting for or running password verification.",
+    multiprocess_mode="livesum",
+)
+LOGIN_REJECTED = Counter(
+    "auth_login_rejected_total",
+    "Logins refused because the verification queue was full or timed out.",
+)
+
+
+def render():
+    """
+    Returns (payload, content_type) for the scrape endpoint.
+    """
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
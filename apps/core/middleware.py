@@ -0,0 +1,185 @@
+# apps/core/middleware.py
+import json
+import logging
+import time
+from contextlib import ExitStack
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+
+from . import metrics, timing
+
+logger = logging.getLogger(__name__)
+
+
+class RequestTimingMiddleware:
+    """
+    Per-request performance breakdown.
+
+    Counts and times SQL (through connection.execute_wrapper) and cache
+    calls (through TimedCacheMixin), splits view and rendering time, and
+    reports them as a Server-Timing header and one JSON log line.
+    Disabled entirely (removed from the chain) by REQUEST_TIMING["ENABLED"].
+
+    Async-capable so async views stay on the event loop. Connections are
+    per thread, so SQL run from sync_to_async threads is not attributed
+    on that path.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.config = settings.REQUEST_TIMING
+        if not self.config["ENABLED"]:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        request_timing = timing.start()
+        try:
+            with ExitStack() as stack:
+                for alias in connections:
+                    stack.enter_context(
+                        connections[alias].execute_wrapper(self._time_query)
+                    )
+                response = self.get_response(request)
+        finally:
+            timing.stop()
+        return self._report(request, response, request_timing)
+
+    async def __acall__(self, request):
+        request_timing = timing.start()
+        try:
+            response = await self.get_response(request)
+        finally:
+            timing.stop()
+        return self._report(request, response, request_timing)
+
+    def _report(self, request, response, request_timing):
+        metrics = self._metrics(request_timing)
+        if self.config["HEADER"]:
+            response["Server-Timing"] = self._header(request_timing, metrics)
+        if self.config["LOG"]:
+            self._log(request, response, request_timing, metrics)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        request_timing = timing.current()
+        if request_timing is not None:
+            request_timing.view_started = time.perf_counter()
+
+    def process_template_response(self, request, response):
+        # DRF responses are rendered after this hook
+        request_timing = timing.current()
+        if request_timing is not None:
+            request_timing.view_ended = time.perf_counter()
+        return response
+
+    @staticmethod
+    def _time_query(execute, sql, params, many, context):
+        with timing.measure("db"):
+            return execute(sql, params, many, context)
+
+    @staticmethod
+    def _metrics(request_timing):
+        """Returns durations in milliseconds."""
+        ended = time.perf_counter()
+        view_started = request_timing.view_started or request_timing.started
+        view_ended = request_timing.view_ended or ended
+        return {
+            "db": request_timing.durations.get("db", 0.0) * 1000,
+            "cache": request_timing.durations.get("cache", 0.0) * 1000,
+            "view": (view_ended - view_started) * 1000,
+            "render": (ended - view_ended) * 1000,
+            "total": (ended - request_timing.started) * 1000,
+        }
+
+    @staticmethod
+    def _header(request_timing, metrics):
+        queries = request_timing.counts.get("db", 0)
+        cache_calls = request_timing.counts.get("cache", 0)
+        return ", ".join(
+            [
+                f'db;dur={metrics["db"]:.2f};desc="{queries} queries"',
+                f'cache;dur={metrics["cache"]:.2f};desc="{cache_calls} calls"',
+                f'view;dur={metrics["view"]:.2f}',
+                f'render;dur={metrics["render"]:.2f}',
+                f'total;dur={metrics["total"]:.2f}',
+            ]
+        )
+
+    @staticmethod
+    def _log(request, response, request_timing, metrics):
+        match = getattr(request, "resolver_match", None)
+        logger.info(
+            json.dumps(
+                {
+                    "event": "request_timing",
+                    "method": request.method,
+                    "route": match.view_name if match else None,
+                    "path": request.path,
+                    "status": response.status_code,
+                    "db_queries": request_timing.counts.get("db", 0),
+                    "cache_calls": request_timing.counts.get("cache", 0),
+                    **{
+                        f"{name}_ms": round(value, 2) for name, value in metrics.items()
+                    },
+                }
+            )
+        )
+
+
+class MetricsMiddleware:
+    """
+    Records request latency and per-request SQL count as Prometheus metrics.
+
+    Routes are labelled by URL name, never by raw path, to keep label
+    cardinality bounded. The SQL count comes from RequestTimingMiddleware,
+    which must sit before this middleware for it to be recorded.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not settings.METRICS["ENABLED"]:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        started = time.perf_counter()
+        response = self.get_response(request)
+        return self._record(request, response, time.perf_counter() - started)
+
+    async def __acall__(self, request):
+        started = time.perf_counter()
+        response = await self.get_response(request)
+        return self._record(request, response, time.perf_counter() - started)
+
+    @staticmethod
+    def _record(request, response, elapsed):
+        match = getattr(request, "resolver_match", None)
+        route = match.view_name if match else "unmatched"
+        metrics.REQUEST_LATENCY.labels(
+            request.method, route, response.status_code
+        ).observe(elapsed)
+
+        request_timing = timing.current()
+        if request_timing is not None:
+            metrics.REQUEST_DB_QUERIES.labels(route).observe(
+                request_timing.counts.get("db", 0)
+            )
+        return response
@@ -0,0 +1,21 @@
+# apps/core/pagination.py
+from django.conf import settings
+from rest_framework.pagination import CursorPagination
+
+
+class StableCursorPagination(CursorPagination):
+    """
+    Project-wide cursor pagination.
+
+    DRF's CursorPagination filters on the first ordering field only
+    (WHERE created_at < cursor position ... LIMIT n); rows sharing that
+    value across a page boundary are skipped with a small OFFSET kept in
+    the cursor. `-id` only makes ORDER BY deterministic, it never reaches
+    the WHERE clause. Page cost therefore stays independent of depth as
+    long as timestamps are mostly distinct, and no COUNT(*) is issued.
+    Views whose model has no `created_at` declare their own `ordering`.
+    """
+
+    ordering = ("-created_at", "-id")
+    page_size_query_param = "page_size"
+    max_page_size = settings.API_MAX_PAGE_SIZE
@@ -0,0 +1,111 @@
+# apps/core/readiness.py
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections, transaction
+
+logger = logging.getLogger(__name__)
+
+
+class ReadinessService:
+    """
+    Dependency checks for the readiness probe.
+
+    Every configured database alias gets a SELECT 1 under a statement
+    timeout and the cache gets a PING. Checks run in order and stop at the
+    first failure. A check slower than its budget counts as failed, so a
+    worker with saturated connections is taken out of rotation.
+    The outcome is memoized per process for RESULT_TTL seconds so probes
+    cannot become load themselves.
+    """
+
+    _result = None
+    _expires_at = 0.0
+    _lock = threading.Lock()
+
+    @staticmethod
+    def _config(name):
+        return settings.READINESS[name]
+
+    @staticmethod
+    def check() -> dict:
+        now = time.monotonic()
+        with ReadinessService._lock:
+            if ReadinessService._result is not None and (
+                ReadinessService._expires_at > now
+            ):
+                return dict(ReadinessService._result, cached=True)
+
+            result = ReadinessService._run()
+            ReadinessService._result = result
+            ReadinessService._expires_at = now + ReadinessService._config("RESULT_TTL")
+            return dict(result, cached=False)
+
+    @staticmethod
+    def reset() -> None:
+        with ReadinessService._lock:
+            ReadinessService._result = None
+
+    @staticmethod
+    def _run() -> dict:
+        checks = [
+            (f"database:{alias}", ReadinessService._check_database, alias)
+            for alias in connections
+        ]
+        checks.append(("cache", ReadinessService._check_cache, None))
+
+        results = {}
+        ready = True
+        for name, probe, arg in checks:
+            if not ready:
+                results[name] = {"status": "skipped"}
+                continue
+
+            budget_ms = ReadinessService._config("TIMEOUT_MS")
+            started = time.perf_counter()
+            try:
+                probe(arg, budget_ms)
+                error = None
+            except Exception as exc:
+                error = f"{exc.__class__.__name__}: {exc}"
+            latency_ms = round((time.perf_counter() - started) * 1000, 2)
+
+            if error is None and latency_ms > budget_ms:
+                error = f"Slower than {budget_ms} ms"
+            results[name] = {
+                "status": "ok" if error is None else "error",
+                "latency_ms": latency_ms,
+            }
+            if error is not None:
+                ready = False
+                results[name]["error"] = error
+                logger.warning("Readiness check %s failed: %s", name, error)
+
+        return {"status": "ready" if ready else "unavailable", "checks": results}
+
+    @staticmethod
+    def _check_database(alias, budget_ms) -> None:
+        connection = connections[alias]
+        with transaction.atomic(using=alias), connection.cursor() as cursor:
+            if connection.vendor == "postgresql":
+                cursor.execute(f"SET LOCAL statement_timeout = {int(budget_ms)}")
+            cursor.execute("SELECT 1")
+            cursor.fetchone()
+
+    @staticmethod
+    def _check_cache(_, budget_ms) -> None:
+        """
+        PINGs Redis; other backends (e.g. local memory) get a read.
+        Socket timeouts come from the cache OPTIONS.
+        """
+        try:
+            from django_redis import get_redis_connection
+
+            client = get_redis_connection("default")
+        except NotImplementedError:
+            cache.get("readiness:probe")
+            return
+        client.ping()
@@ -0,0 +1,152 @@
+# apps/core/tests/test_middleware.py
+"""
+Tests for the per-request timing middleware and cache instrumentation.
+"""
+import json
+import logging
+
+import pytest
+from asgiref.sync import async_to_sync, iscoroutinefunction
+from django.core.cache import cache
+from django.core.cache.backends.locmem import LocMemCache
+from django.http import HttpResponse
+from django.test import RequestFactory
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from apps.core import timing
+from apps.core.cache import TimedCacheMixin
+from apps.core.middleware import MetricsMiddleware, RequestTimingMiddleware
+
+
+class TimedLocMemCache(TimedCacheMixin, LocMemCache):
+    pass
+
+
+@pytest.mark.django_db
+class TestRequestTimingMiddleware:
+    """Tests for RequestTimingMiddleware."""
+
+    def test_server_timing_header_and_log_line(self, user, caplog):
+        """
+        Test that an API request reports its breakdown.
+        Expected: Server-Timing with db/cache/view/render/total entries and a
+        JSON log line carrying the route name and query count.
+        """
+        client = APIClient()
+        client.force_authenticate(user=user)
+
+        with caplog.at_level(logging.INFO, logger="apps.core.middleware"):
+            response = client.get(reverse("v1:trivia-list"))
+
+        header = response["Server-Timing"]
+        for name in ("db;dur=", "cache;dur=", "view;dur=", "render;dur=", "total;"):
+            assert name in header
+
+        record = json.loads(caplog.records[-1].getMessage())
+        assert record["route"] == "v1:trivia-list"
+        assert record["status"] == 200
+        assert record["db_queries"] >= 1
+
+    def test_middleware_can_be_disabled(self, settings, user):
+        """
+        Test the per-environment toggle.
+        Expected: No Server-Timing header when REQUEST_TIMING is disabled.
+        """
+        settings.REQUEST_TIMING = dict(settings.REQUEST_TIMING, ENABLED=False)
+        client = APIClient()
+        client.force_authenticate(user=user)
+
+        response = client.get(reverse("v1:trivia-list"))
+
+        assert "Server-Timing" not in response
+
+    def test_async_chain_stays_async(self):
+        """
+        Test that both middlewares wrap an async view without a thread hop.
+        Expected: The chain is a coroutine function and still reports timings.
+        """
+
+        async def view(request):
+            return HttpResponse("ok")
+
+        chain = RequestTimingMiddleware(MetricsMiddleware(view))
+
+        response = async_to_sync(chain)(RequestFactory().get("/"))
+
+        assert iscoroutinefunction(chain)
+        assert "total;dur=" in response["Server-Timing"]
+
+
+class TestTimedCache:
+    """Tests for TimedCacheMixin."""
+
+    def test_cache_calls_are_counted_once(self):
+        """
+        Test that cache calls are recorded, nested calls included once.
+        Expected: set + get_many (built on get) count as two calls.
+        """
+        cache = TimedLocMemCache("timing-test", {})
+        request_timing = timing.start()
+        try:
+            cache.set("a", 1)
+            cache.get_many(["a", "b"])
+        finally:
+            timing.stop()
+
+        assert request_timing.counts["cache"] == 2
+        assert request_timing.durations["cache"] > 0
+
+
+@pytest.mark.django_db
+class TestMetricsEndpoint:
+    """Tests for the Prometheus scrape endpoint."""
+
+    def test_metrics_exposes_request_and_cache_series(self, user):
+        """
+        Test that hot-path metrics are exported in the Prometheus format.
+        Expected: Latency histogram labelled by route name, per-request SQL
+        count and cache hit/miss counters; no authentication required.
+        """
+        client = APIClient()
+        client.force_authenticate(user=user)
+        client.get(reverse("v1:trivia-list"))
+
+        response = APIClient().get(reverse("metrics"))
+        body = response.content.decode()
+
+        assert response.status_code == 200
+        assert response["Content-Type"].startswith("text/plain")
+        assert 'http_request_duration_seconds_bucket{le="0.005",method="GET"' in body
+        assert 'route="v1:trivia-list"' in body
+        assert "http_request_db_queries_count" in body
+        assert "app_cache_requests_total" in body
+
+    def test_metrics_requires_configured_token(self, settings):
+        """
+        Test that a configured METRICS token is enforced.
+        Expected: 401 without or with a wrong bearer token, 200 with it.
+        """
+        settings.METRICS = dict(settings.METRICS, TOKEN="s3cret")
+        client = APIClient()
+
+        missing = client.get(reverse("metrics"))
+        wrong = client.get(reverse("metrics"), HTTP_AUTHORIZATION="Bearer nope")
+        valid = client.get(reverse("metrics"), HTTP_AUTHORIZATION="Bearer s3cret")
+
+        assert missing.status_code == 401
+        assert missing["WWW-Authenticate"] == "Bearer"
+        assert wrong.status_code == 401
+        assert valid.status_code == 200
+
+    def test_metrics_is_not_throttled(self):
+        """
+        Test that scrapes are not refused by the anon throttle (100/hour).
+        Expected: 200 OK for every one of 120 scrapes.
+        """
+        cache.clear()
+        client = APIClient()
+
+        codes = {client.get(reverse("metrics")).status_code for _ in range(120)}
+
+        assert codes == {200}
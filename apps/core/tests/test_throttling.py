@@ -0,0 +1,98 @@
+# apps/core/tests/test_throttling.py
+"""
+Tests for the sliding-window throttles.
+"""
+import pytest
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from apps.core import throttling
+from apps.core.throttling import ScopedRateThrottle
+
+# (offset ms, expected allowed) against a 3 requests / 1000 ms window
+SEQUENCE = [
+    (0, True),
+    (100, True),
+    (200, True),
+    (300, False),
+    (1500, True),  # previous window weighs 3 * 0.5 = 1.5
+    (1600, False),  # 1.2 + 1 + 1 > 3
+    (2000, True),  # previous window (1 request) fully weighted: 1 + 1 <= 3
+]
+
+
+def _run(hit):
+    base = 10_000_000
+    return [hit(base + offset)[0] for offset, _ in SEQUENCE]
+
+
+class TestSlidingWindow:
+    """Tests for the sliding-window counter."""
+
+    def setup_method(self):
+        cache.clear()
+
+    def test_cache_algorithm(self):
+        """
+        Test the Python implementation used with non-Redis caches.
+        Expected: Requests allowed/refused according to the weighted estimate.
+        """
+        results = _run(lambda now: throttling._hit_cache("t", now, 1000, 3))
+
+        assert results == [allowed for _, allowed in SEQUENCE]
+
+    def test_lua_script_matches_cache_algorithm(self):
+        """
+        Test the Lua script against the same sequence.
+        Expected: Identical decisions to the Python implementation.
+        """
+        fakeredis = pytest.importorskip("fakeredis")
+        pytest.importorskip("lupa")
+        client = fakeredis.FakeRedis()
+        throttling._script = None
+
+        results = _run(lambda now: throttling._hit_redis(client, "t", now, 1000, 3))
+
+        assert results == [allowed for _, allowed in SEQUENCE]
+        assert client.hlen(next(iter(client.keys()))) == 3
+
+    def test_refusal_reports_wait(self):
+        """
+        Test the wait hint returned on refusal.
+        Expected: Within the window length and positive.
+        """
+        for _ in range(3):
+            throttling._hit_cache("w", 10_000_000, 1000, 3)
+
+        allowed, wait_ms = throttling._hit_cache("w", 10_000_100, 1000, 3)
+
+        assert allowed is False
+        assert 0 < wait_ms <= 2000
+
+
+@pytest.mark.django_db
+class TestScopedRateThrottle:
+    """Tests for the per-endpoint scopes."""
+
+    def test_login_scope_is_enforced(self, monkeypatch):
+        """
+        Test that the login scope refuses requests over its rate.
+        Expected: 429 with Retry-After once the limit is spent.
+        """
+        cache.clear()
+        monkeypatch.setattr(
+            ScopedRateThrottle,
+            "THROTTLE_RATES",
+            dict(ScopedRateThrottle.THROTTLE_RATES, login="2/minute"),
+        )
+        client = APIClient()
+        payload = {"email": "nobody@example.com", "password": "x"}
+
+        codes = [
+            client.post(reverse("v1:auth-login"), payload).status_code for _ in range(3)
+        ]
+        response = client.post(reverse("v1:auth-login"), payload)
+
+        assert codes == [401, 401, 429]
+        assert int(response["Retry-After"]) >= 1
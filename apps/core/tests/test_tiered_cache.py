@@ -0,0 +1,162 @@
+# apps/core/tests/test_tiered_cache.py
+"""
+Tests for the two-tier (in-process + shared) cache.
+"""
+import json
+
+import pytest
+from django.core.cache import cache
+
+from apps.core import tiered_cache
+from apps.core.tiered_cache import TieredCache
+
+tier = TieredCache("test_tier", "TEST_TIERED_CACHE")
+
+
+@pytest.fixture(autouse=True)
+def tier_settings(settings):
+    settings.CACHES = {
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+    }
+    settings.TEST_TIERED_CACHE = {"MAX_ENTRIES": 2, "LOCAL_TTL": 60, "TIMEOUT": 60}
+    cache.clear()
+    tier.clear_local()
+    tier._counts = {"local_hit": 0, "hit": 0, "miss": 0}
+    yield settings.TEST_TIERED_CACHE
+    tier.clear_local()
+
+
+class TestTieredCache:
+    """Tests for lookups through the local and shared tiers."""
+
+    def test_lookup_falls_through_tiers(self):
+        """
+        Test a miss, a local hit, and a shared hit after the local tier
+        was emptied.
+        Expected: One build, and hits counted per tier.
+        """
+        builds = []
+
+        def build():
+            builds.append(1)
+            return "value"
+
+        assert tier.get_or_set("k", build) == "value"
+        assert tier.get_or_set("k", build) == "value"
+        tier.clear_local()
+        assert tier.get_or_set("k", build) == "value"
+
+        stats = tier.stats()
+        assert len(builds) == 1
+        assert stats["hits"] == 2
+        assert stats["misses"] == 1
+        assert stats["local"] == {"hits": 1, "misses": 2, "hit_ratio": 0.3333}
+        assert stats["shared"] == {"hits": 1, "misses": 1, "hit_ratio": 0.5}
+
+    def test_local_tier_is_bounded_lru(self):
+        """
+        Test that the local tier evicts the least recently used key.
+        Expected: Only the two most recently used keys stay local.
+        """
+        for key in ("a", "b"):
+            tier.get_or_set(key, lambda: key)
+        tier.get_or_set("a", lambda: "a")  # refreshes "a"
+        tier.get_or_set("c", lambda: "c")
+
+        assert set(tier._local) == {"a", "c"}
+        assert tier.stats()["entries"] == 2
+
+    def test_local_entries_expire(self, tier_settings):
+        """
+        Test that local entries are not served past LOCAL_TTL.
+        Expected: The second lookup goes to the shared tier.
+        """
+        tier_settings["LOCAL_TTL"] = 0
+        tier.get_or_set("k", lambda: "value")
+        tier.get_or_set("k", lambda: "value")
+
+        assert tier.stats()["shared"]["hits"] == 1
+
+    def test_none_is_not_cached(self):
+        """
+        Test that a builder returning None runs again next time.
+        Expected: Two builds.
+        """
+        builds = []
+        tier.get_or_set("k", lambda: builds.append(1))
+        tier.get_or_set("k", lambda: builds.append(1))
+
+        assert len(builds) == 2
+
+    def test_cached_decorator_and_invalidate(self):
+        """
+        Test the decorator keys on arguments and its invalidate helper
+        deletes the entry from both tiers.
+        Expected: The function runs again only for the invalidated key.
+        """
+        calls = []
+
+        @tier.cached()
+        def square(number):
+            calls.append(number)
+            return number * number
+
+        assert square(3) == 9
+        assert square(3) == 9
+        assert square(4) == 16
+        square.invalidate(3)
+        assert square(3) == 9
+
+        assert calls == [3, 4, 3]
+        assert cache.get(tier.shared_key("4")) == 16
+
+
+class TestInvalidationMessages:
+    """Tests for the cross-process invalidation broadcast."""
+
+    def test_message_from_peer_drops_local_keys(self):
+        """
+        Test applying an invalidation published by another process.
+        Expected: Named keys dropped locally, the shared tier untouched.
+        """
+        tier.get_or_set("a", lambda: "a")
+        tier.get_or_set("b", lambda: "b")
+
+        tiered_cache._apply(
+            json.dumps({"origin": "peer", "cache": "test_tier", "keys": ["a"]})
+        )
+
+        assert set(tier._local) == {"b"}
+        assert cache.get(tier.shared_key("a")) == "a"
+
+    def test_own_messages_are_ignored(self):
+        """
+        Test that a process does not re-apply its own broadcast.
+        Expected: Local entry kept.
+        """
+        tier.get_or_set("a", lambda: "a")
+        message = {"origin": tiered_cache._origin(), "cache": "test_tier", "keys": None}
+
+        tiered_cache._apply(json.dumps(message))
+
+        assert set(tier._local) == {"a"}
+
+    def test_delete_is_published(self, monkeypatch):
+        """
+        Test that deletes are broadcast on the invalidation channel.
+        Expected: A message naming the cache and keys reaches subscribers.
+        """
+        fakeredis = pytest.importorskip("fakeredis")
+        client = fakeredis.FakeRedis()
+        monkeypatch.setattr(tiered_cache, "get_redis_client", lambda: client)
+        pubsub = client.pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(tiered_cache._channel())
+
+        tier.delete("a", "b")
+
+        # The first read consumes (and hides) the subscribe confirmation
+        message = pubsub.get_message(timeout=1) or pubsub.get_message(timeout=1)
+        payload = json.loads(message["data"])
+        assert payload["cache"] == "test_tier"
+        assert payload["keys"] == ["a", "b"]
+        assert payload["origin"] == tiered_cache._origin()
@@ -0,0 +1,77 @@
+# apps/core/tests/test_views.py
+"""
+Tests for infrastructure endpoints (health, readiness).
+"""
+import pytest
+from django.core.cache import cache
+from django.db import OperationalError
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.core.readiness import ReadinessService
+
+
+@pytest.fixture(autouse=True)
+def fresh_readiness():
+    ReadinessService.reset()
+    yield
+    ReadinessService.reset()
+
+
+@pytest.mark.django_db
+class TestReadinessView:
+    """Tests for the /ready/ probe."""
+
+    def test_ready_reports_each_dependency(self):
+        """
+        Test that every database alias and the cache are checked.
+        Expected: 200 OK with an 'ok' status and latency per dependency;
+        a second probe within the TTL is served from memory.
+        """
+        client = APIClient()
+
+        first = client.get(reverse("readiness-check"))
+        second = client.get(reverse("readiness-check"))
+
+        assert first.status_code == status.HTTP_200_OK
+        assert first.data["status"] == "ready"
+        assert first.data["cached"] is False
+        for name in ("database:default", "cache"):
+            assert first.data["checks"][name]["status"] == "ok"
+            assert first.data["checks"][name]["latency_ms"] >= 0
+        assert second.data["cached"] is True
+
+    def test_failing_database_returns_503_and_skips_the_rest(self, monkeypatch):
+        """
+        Test that the probe fails fast on the first broken dependency.
+        Expected: 503 with the error reported and later checks skipped.
+        """
+
+        def broken(alias, budget_ms):
+            raise OperationalError("too many connections")
+
+        monkeypatch.setattr(ReadinessService, "_check_database", broken)
+
+        response = APIClient().get(reverse("readiness-check"))
+
+        assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+        assert response.data["status"] == "unavailable"
+        assert (
+            "too many connections"
+            in response.data["checks"]["database:default"]["error"]
+        )
+        assert response.data["checks"]["cache"] == {"status": "skipped"}
+
+    def test_probe_is_not_throttled(self):
+        """
+        Test that frequent probes are not refused by the anon throttle
+        (100/hour).
+        Expected: 200 OK for every one of 120 probes.
+        """
+        cache.clear()
+        client = APIClient()
+
+        codes = {client.get(reverse("readiness-check")).status_code for _ in range(120)}
+
+        assert codes == {status.HTTP_200_OK}
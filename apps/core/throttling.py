@@ -0,0 +1,163 @@
+# apps/core/throttling.py
+"""
+Sliding-window throttles updated in one atomic Redis round trip.
+
+DRF's SimpleRateThrottle keeps the full list of request timestamps in the
+cache and rewrites it on every request, so its cost grows with the rate.
+These throttles store three integers per client and scope instead: the
+index of the current fixed window, its count and the previous window's
+count. The request rate is estimated as
+
+    previous * (unelapsed share of the current window) + current
+
+(the usual sliding-window-counter approximation) and checked/updated by a
+Lua script, so overhead is constant whatever the configured rate. Caches
+that are not Redis (local memory in tests) run the same algorithm in
+Python, without atomicity.
+"""
+import logging
+import math
+
+from django.conf import settings
+from django.core.cache import cache
+from redis.exceptions import RedisError
+from rest_framework import throttling
+
+from .cache import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+# KEYS[1]: state hash. ARGV: now_ms, window_ms, limit.
+# Returns {allowed (0/1), wait_ms}.
+SLIDING_WINDOW_LUA = """
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local limit = tonumber(ARGV[3])
+local index = math.floor(now / window)
+local state = redis.call("HMGET", KEYS[1], "w", "c", "p")
+local stored = tonumber(state[1])
+local current = tonumber(state[2]) or 0
+local previous = tonumber(state[3]) or 0
+if stored ~= index then
+  if stored == index - 1 then previous = current else previous = 0 end
+  current = 0
+end
+local elapsed = now - index * window
+if previous * (window - elapsed) / window + current + 1 > limit then
+  local wait
+  if current + 1 > limit then
+    wait = window - elapsed + window * (1 - (limit - 1) / math.max(current, 1))
+  else
+    wait = window * (1 - (limit - 1 - current) / previous) - elapsed
+  end
+  return {0, math.max(math.ceil(wait), 1)}
+end
+redis.call("HSET", KEYS[1], "w", index, "c", current + 1, "p", previous)
+redis.call("PEXPIRE", KEYS[1], window * 2)
+return {1, 0}
+"""
+
+_script = None
+
+
+def _hit_redis(client, key, now_ms, window_ms, limit):
+    global _script
+    if _script is None:
+        _script = client.register_script(SLIDING_WINDOW_LUA)
+    prefix = settings.CACHES["default"].get("KEY_PREFIX", "")
+    allowed, wait_ms = _script(
+        keys=[f"{prefix}:{key}"], args=[now_ms, window_ms, limit], client=client
+    )
+    return bool(allowed), int(wait_ms)
+
+
+def _hit_cache(key, now_ms, window_ms, limit):
+    """Same algorithm as SLIDING_WINDOW_LUA on the Django cache API."""
+    index = now_ms // window_ms
+    stored, current, previous = cache.get(key, (None, 0, 0))
+    if stored != index:
+        previous = current if stored == index - 1 else 0
+        current = 0
+
+    elapsed = now_ms - index * window_ms
+    if previous * (window_ms - elapsed) / window_ms + current + 1 > limit:
+        if current + 1 > limit:
+            wait = window_ms - elapsed + window_ms * (1 - (limit - 1) / max(current, 1))
+        else:
+            wait = window_ms * (1 - (limit - 1 - current) / previous) - elapsed
+        return False, max(math.ceil(wait), 1)
+
+    cache.set(key, (index, current + 1, previous), window_ms * 2 / 1000)
+    return True, 0
+
+
+def hit(key, now_ms, window_ms, limit):
+    """
+    Records one request against `key` if it fits the window.
+    Returns (allowed, milliseconds to wait when refused). Fails open when
+    Redis is unreachable: throttling must never take the API down.
+    """
+    client = get_redis_client()
+    if client is None:
+        return _hit_cache(key, now_ms, window_ms, limit)
+    try:
+        return _hit_redis(client, key, now_ms, window_ms, limit)
+    except RedisError:
+        logger.warning("Throttle backend unavailable, allowing request %s", key)
+        return True, 0
+
+
+class SlidingWindowThrottleMixin:
+    """
+    Replaces SimpleRateThrottle's timestamp history with hit().
+    """
+
+    wait_seconds = None
+
+    def allow_request(self, request, view):
+        if self.rate is None:
+            return True
+
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+
+        allowed, wait_ms = hit(
+            self.key,
+            int(self.timer() * 1000),
+            self.duration * 1000,
+            self.num_requests,
+        )
+        self.wait_seconds = wait_ms / 1000
+        return allowed
+
+    def wait(self):
+        return self.wait_seconds
+
+
+class UserRateThrottle(SlidingWindowThrottleMixin, throttling.UserRateThrottle):
+    pass
+
+
+class AnonRateThrottle(SlidingWindowThrottleMixin, throttling.AnonRateThrottle):
+    pass
+
+
+class ScopedRateThrottle(SlidingWindowThrottleMixin, throttling.ScopedRateThrottle):
+    """
+    Per-endpoint rates from DEFAULT_THROTTLE_RATES. Views name their scope
+    with `throttle_scope`, viewsets per action with `throttle_scopes`.
+    Views without a scope are not limited by this throttle.
+    """
+
+    def allow_request(self, request, view):
+        scope = getattr(view, "throttle_scopes", {}).get(
+            getattr(view, "action", None), getattr(view, "throttle_scope", None)
+        )
+        if not scope:
+            return True
+
+        self.scope = scope
+        self.rate = self.get_rate()
+        self.num_requests, self.duration = self.parse_rate(self.rate)
+        return super().allow_request(request, view)
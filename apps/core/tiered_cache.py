@@ -0,0 +1,321 @@
+# apps/core/tiered_cache.py
+"""
+Two-tier cache: a bounded in-process LRU in front of the shared Redis cache.
+
+Reads try the local tier first (no network), then the shared tier, then
+the builder. Deletes and overwrites are broadcast on a Redis pub/sub
+channel, and every process drops the named keys from its local tier when
+the message arrives. One listener thread per process consumes the channel.
+After a (re)connect it empties the local tiers, because messages published
+while it was away are lost. Local entries also expire after LOCAL_TTL,
+which bounds staleness whenever pub/sub is unavailable.
+
+Without the Redis backend (local memory in tests) invalidations only
+reach the current process.
+
+Every lookup is counted in app_cache_requests_total with result
+local_hit / hit (shared tier) / miss, and per process in stats().
+"""
+import functools
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+from redis.exceptions import RedisError
+
+from . import metrics
+from .cache import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+_registry: Dict[str, "TieredCache"] = {}
+_listener_lock = threading.Lock()
+_listener_pid = None
+_instance_id = uuid.uuid4().hex
+
+
+def _channel() -> str:
+    prefix = settings.CACHES["default"].get("KEY_PREFIX", "")
+    return f"{prefix}:tiered-cache:invalidate"
+
+
+def _origin() -> str:
+    # The pid keeps forked workers distinct even if the module was preloaded
+    return f"{os.getpid()}:{_instance_id}"
+
+
+def _ratio(hits, misses) -> float:
+    total = hits + misses
+    return round(hits / total, 4) if total else 0.0
+
+
+def _publish(name, keys) -> None:
+    client = get_redis_client()
+    if client is None:
+        return
+    message = {"origin": _origin(), "cache": name, "keys": keys}
+    try:
+        client.publish(_channel(), json.dumps(message))
+    except RedisError:
+        logger.warning(
+            "Could not broadcast invalidation of %s; peers converge within "
+            "LOCAL_TTL",
+            name,
+        )
+
+
+def _apply(raw) -> None:
+    """
+    Applies one invalidation message coming from another process.
+    """
+    message = json.loads(raw)
+    if message["origin"] == _origin():
+        return
+    tier = _registry.get(message["cache"])
+    if tier is None:
+        return
+    if message["keys"] is None:
+        tier.clear_local()
+    else:
+        tier.drop_local(*message["keys"])
+
+
+def _listen(client) -> None:
+    backoff = 1
+    while True:
+        try:
+            pubsub = client.pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(_channel())
+            clear_local_tiers()
+            backoff = 1
+            for message in pubsub.listen():
+                if message["type"] == "message":
+                    _apply(message["data"])
+        except RedisError:
+            logger.warning("Cache invalidation channel lost, retrying in %ss", backoff)
+        except Exception:
+            logger.exception("Cache invalidation listener failed")
+        time.sleep(backoff)
+        backoff = min(backoff * 2, 30)
+
+
+def _ensure_listener() -> None:
+    """
+    Starts this process' invalidation listener on first use (and again in
+    forked children, whose copy of the thread does not run).
+    """
+    global _listener_pid
+    if _listener_pid == os.getpid():
+        return
+    with _listener_lock:
+        if _listener_pid == os.getpid():
+            return
+        _listener_pid = os.getpid()
+        client = get_redis_client()
+        if client is None:
+            return
+        threading.Thread(
+            target=_listen, args=(client,), name="tiered-cache", daemon=True
+        ).start()
+
+
+def clear_local_tiers() -> None:
+    for tier in list(_registry.values()):
+        tier.clear_local()
+
+
+def tiered_cache_stats() -> Dict[str, dict]:
+    return {name: tier.stats() for name, tier in _registry.items()}
+
+
+class TieredCache:
+    """
+    One named two-tier cache. Sizes and lifetimes are read from the
+    settings dict `setting` (MAX_ENTRIES, LOCAL_TTL, TIMEOUT).
+
+    Keys must be str or int (they travel as JSON). None is never cached.
+    """
+
+    def __init__(self, name: str, setting: str):
+        if name in _registry:
+            raise ValueError(f"Tiered cache {name!r} already exists.")
+        self.name = name
+        self.setting = setting
+        self._local: "OrderedDict[object, Tuple[float, object]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._counts = {"local_hit": 0, "hit": 0, "miss": 0}
+        _registry[name] = self
+
+    def _config(self, name):
+        return getattr(settings, self.setting)[name]
+
+    def shared_key(self, key) -> str:
+        return f"{self.name}:{key}"
+
+    # ------------------------------------------------------------------
+    # Local tier
+    # ------------------------------------------------------------------
+    def _get_local(self, key) -> Tuple[bool, object]:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._local.get(key)
+            if entry is None:
+                return False, None
+            if entry[0] <= now:
+                del self._local[key]
+                return False, None
+            self._local.move_to_end(key)
+            return True, entry[1]
+
+    def _set_local(self, key, value) -> None:
+        expires_at = time.monotonic() + self._config("LOCAL_TTL")
+        with self._lock:
+            self._local[key] = (expires_at, value)
+            self._local.move_to_end(key)
+            while len(self._local) > self._config("MAX_ENTRIES"):
+                self._local.popitem(last=False)
+
+    def drop_local(self, *keys) -> None:
+        """Forgets keys in this process only."""
+        with self._lock:
+            for key in keys:
+                self._local.pop(key, None)
+
+    def clear_local(self) -> None:
+        with self._lock:
+            self._local.clear()
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+    def get_or_load(self, key, load: Callable[[], Tuple[object, bool]]):
+        """
+        Local tier in front of a custom shared lookup (e.g. a versioned
+        one). `load()` returns (value, found in the shared tier).
+        Returns (value, tier served from: "local", "shared" or None).
+        """
+        _ensure_listener()
+        found, value = self._get_local(key)
+        if found:
+            self._count("local_hit")
+            return value, "local"
+
+        value, shared_hit = load()
+        self._count("hit" if shared_hit else "miss")
+        if value is not None:
+            self._set_local(key, value)
+        return value, "shared" if shared_hit else None
+
+    def get_or_set(self, key, build: Callable[[], object], timeout=None):
+        def load():
+            shared_key = self.shared_key(key)
+            value = cache.get(shared_key)
+            if value is not None:
+                return value, True
+            value = build()
+            if value is not None:
+                cache.set(
+                    shared_key,
+                    value,
+                    self._config("TIMEOUT") if timeout is None else timeout,
+                )
+            return value, False
+
+        return self.get_or_load(key, load)[0]
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+    def set(self, key, value, timeout=None) -> None:
+        cache.set(
+            self.shared_key(key),
+            value,
+            self._config("TIMEOUT") if timeout is None else timeout,
+        )
+        self.invalidate(key)
+        self._set_local(key, value)
+
+    def delete(self, *keys) -> None:
+        """Removes keys from the shared tier and every local tier."""
+        cache.delete_many([self.shared_key(key) for key in keys])
+        self.invalidate(*keys)
+
+    def invalidate(self, *keys) -> None:
+        """
+        Drops keys from every process' local tier, leaving the shared tier
+        alone (for entries already orphaned by a version bump).
+        """
+        if not keys:
+            return
+        self.drop_local(*keys)
+        _publish(self.name, list(keys))
+
+    # ------------------------------------------------------------------
+    # Decorator / stats
+    # ------------------------------------------------------------------
+    def cached(self, key: Optional[Callable[..., object]] = None, timeout=None):
+        """
+        Caches a function's result under key(*args, **kwargs), by default
+        its stringified arguments. The wrapper gains
+        .invalidate(*args, **kwargs), deleting that entry in both tiers.
+        """
+
+        def make_key(args, kwargs):
+            if key is not None:
+                return key(*args, **kwargs)
+            parts = [str(arg) for arg in args]
+            parts += [f"{name}={kwargs[name]}" for name in sorted(kwargs)]
+            return ":".join(parts)
+
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                return self.get_or_set(
+                    make_key(args, kwargs), lambda: func(*args, **kwargs), timeout
+                )
+
+            wrapper.invalidate = lambda *args, **kwargs: self.delete(
+                make_key(args, kwargs)
+            )
+            return wrapper
+
+        return decorator
+
+    def _count(self, result) -> None:
+        metrics.CACHE_REQUESTS.labels(self.name, result).inc()
+        with self._lock:
+            self._counts[result] += 1
+
+    def stats(self) -> dict:
+        """
+        Per-process counters. "shared" covers only local-tier misses;
+        top-level hits/misses are end to end (misses = builds).
+        """
+        with self._lock:
+            local_hits = self._counts["local_hit"]
+            shared_hits = self._counts["hit"]
+            misses = self._counts["miss"]
+            entries = len(self._local)
+        return {
+            "hits": local_hits + shared_hits,
+            "misses": misses,
+            "hit_ratio": _ratio(local_hits + shared_hits, misses),
+            "entries": entries,
+            "local": {
+                "hits": local_hits,
+                "misses": shared_hits + misses,
+                "hit_ratio": _ratio(local_hits, shared_hits + misses),
+            },
+            "shared": {
+                "hits": shared_hits,
+                "misses": misses,
+                "hit_ratio": _ratio(shared_hits, misses),
+            },
+        }
@@ -0,0 +1,77 @@
+# apps/core/timing.py
+"""
+Per-request performance counters.
+
+The collector lives in a context variable, so it works for both WSGI and
+ASGI requests, and recording outside a request is a no-op.
+"""
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+
+
+class RequestTiming:
+    """
+    Accumulates call counts and elapsed seconds per kind ("db", "cache").
+    """
+
+    __slots__ = (
+        "started",
+        "view_started",
+        "view_ended",
+        "counts",
+        "durations",
+        "_active",
+    )
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.view_started = None
+        self.view_ended = None
+        self.counts = {}
+        self.durations = {}
+        self._active = set()
+
+    def add(self, kind: str, elapsed: float) -> None:
+        self.counts[kind] = self.counts.get(kind, 0) + 1
+        self.durations[kind] = self.durations.get(kind, 0.0) + elapsed
+
+
+_current: ContextVar[Optional[RequestTiming]] = ContextVar(
+    "request_timing", default=None
+)
+
+
+def start() -> RequestTiming:
+    timing = RequestTiming()
+    _current.set(timing)
+    return timing
+
+
+def stop() -> None:
+    _current.set(None)
+
+
+def current() -> Optional[RequestTiming]:
+    return _current.get()
+
+
+@contextmanager
+def measure(kind: str):
+    """
+    Times the enclosed call into the current request. Nested measurements
+    of the same kind (e.g. get_many implemented with get) count once.
+    """
+    timing = _current.get()
+    if timing is None or kind in timing._active:
+        yield
+        return
+
+    timing._active.add(kind)
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timing._active.discard(kind)
+        timing.add(kind, time.perf_counter() - started)
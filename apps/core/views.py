@@ -1,9 +1,17 @@
 # apps/core/views.py
+import hmac
+
+from django.conf import settings
+from django.http import HttpResponse
 from drf_spectacular.utils import extend_schema
+from rest_framework import status
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from . import metrics
+from .readiness import ReadinessService
+
 
 class HealthCheckView(APIView):
     """
@@ -13,7 +21,7 @@ class HealthCheckView(APIView):
         - Used by Docker, Kubernetes, load balancers, and uptime monitoring
           to verify that the Django process is alive and responsive.
         - Does NOT perform database or cache checks
-          (that's handled in readiness probes).
+          (that's handled by ReadinessView at /ready/).
 
     Access:
         - Public (AllowAny)
@@ -28,3 +36,57 @@ class HealthCheckView(APIView):
     @extend_schema(responses={200})
     def get(self, request):
         return Response({"status": "ok"})
+
+
+class ReadinessView(APIView):
+    """
+    Readiness probe for load balancers and Kubernetes.
+
+    Runs SELECT 1 on every database alias and PINGs the cache, reporting
+    each dependency's latency. Answers 503 as soon as one check fails or
+    exceeds its budget. Results are memoized for a couple of seconds.
+    Never throttled: probes poll it far more often than the anon rate.
+    """
+
+    authentication_classes = []
+    permission_classes = [AllowAny]
+    throttle_classes = []
+
+    @extend_schema(responses={200: dict, 503: dict})
+    def get(self, request):
+        result = ReadinessService.check()
+        code = (
+            status.HTTP_200_OK
+            if result["status"] == "ready"
+            else status.HTTP_503_SERVICE_UNAVAILABLE
+        )
+        return Response(result, status=code)
+
+
+class MetricsView(APIView):
+    """
+    Prometheus scrape endpoint.
+
+    Aggregates the samples of every gunicorn worker when
+    PROMETHEUS_MULTIPROC_DIR is set. With METRICS["TOKEN"] set, scrapers
+    must send it as a bearer token; otherwise restrict it at the ingress /
+    network level. Never throttled, since scrapers poll it continuously.
+    """
+
+    authentication_classes = []
+    permission_classes = [AllowAny]
+    throttle_classes = []
+
+    @extend_schema(exclude=True)
+    def get(self, request):
+        token = settings.METRICS["TOKEN"]
+        if token and not hmac.compare_digest(
+            request.headers.get("Authorization", "").encode(),
+            f"Bearer {token}".encode(),
+        ):
+            return HttpResponse(
+                status=status.HTTP_401_UNAUTHORIZED,
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        payload, content_type = metrics.render()
+        return HttpResponse(payload, content_type=content_type)
@@ -7,3 +7,6 @@ class QuestionsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.questions"
     verbose_name = _("Questions")
+
+    def ready(self):
+        from . import signals  # noqa: F401
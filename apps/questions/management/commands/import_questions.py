@@ -0,0 +1,68 @@
+# apps/questions/management/commands/import_questions.py
+import json
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.questions.services.question_import_service import QuestionImportService
+
+
+class Command(BaseCommand):
+    """
+    Streams a JSONL or CSV question bank into the database in batches.
+    Invalid records are reported on stderr and skipped.
+    """
+
+    help = "Bulk import questions (with choices) from a JSONL or CSV file."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Input file, or '-' for stdin.")
+        parser.add_argument(
+            "--format",
+            dest="file_format",
+            choices=QuestionImportService.FORMATS,
+            help="Input format. Defaults to the file extension.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=QuestionImportService.DEFAULT_BATCH_SIZE,
+            help="Questions inserted per bulk_create.",
+        )
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        file_format = options["file_format"] or (
+            "csv" if path.lower().endswith(".csv") else "jsonl"
+        )
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be positive.")
+
+        def on_reject(rejection):
+            self.stderr.write(
+                f"Line {rejection['line']}: {json.dumps(rejection['errors'])}"
+            )
+
+        if path == "-":
+            result = self._import(sys.stdin, file_format, options, on_reject)
+        else:
+            try:
+                with open(path, encoding="utf-8", newline="") as stream:
+                    result = self._import(stream, file_format, options, on_reject)
+            except OSError as exc:
+                raise CommandError(str(exc)) from exc
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Imported {result.imported} question(s), "
+                f"rejected {result.rejected} in {result.elapsed:.2f}s "
+                f"({result.rows_per_second} rows/sec)."
+            )
+        )
+
+    def _import(self, stream, file_format, options, on_reject):
+        return QuestionImportService.run(
+            QuestionImportService.parse(stream, file_format),
+            batch_size=options["batch_size"],
+            on_reject=on_reject,
+        )
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-18 06:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("questions", "0003_remove_choice_questions_c_questio_2d835e_idx_and_more"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="question",
+            index=models.Index(
+                fields=["-created_at", "-id"], name="questions_q_created_79cadc_idx"
+            ),
+        ),
+    ]
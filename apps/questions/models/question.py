@@ -29,6 +29,9 @@ class Question(models.Model):
         verbose_name = _("Question")
         verbose_name_plural = _("Questions")
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["-created_at", "-id"]),
+        ]
 
     def __str__(self):
         return f"{self.text[:50]} ({self.difficulty})"
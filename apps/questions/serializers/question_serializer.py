@@ -67,3 +67,16 @@ class QuestionPlayerSerializer(serializers.ModelSerializer):
     class Meta:
         model = Question
         fields = ["id", "text", "choices"]
+
+
+class QuestionImportSerializer(serializers.Serializer):
+    """
+    DTO for the bulk import upload (JSONL or CSV question bank).
+    """
+
+    file = serializers.FileField()
+    file_format = serializers.ChoiceField(
+        choices=["jsonl", "csv"],
+        required=False,
+        help_text="Defaults to the uploaded file extension.",
+    )
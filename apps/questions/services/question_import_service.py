@@ -0,0 +1,179 @@
+# apps/questions/services/question_import_service.py
+import csv
+import logging
+import time
+from typing import Callable, Iterable, Iterator, Optional
+
+from django.db import DatabaseError, transaction
+
+from apps.core.importing import ImportResult, ParsedRecord, parse_jsonl
+
+from ..models.choice import Choice
+from ..models.question import Question
+from ..serializers.question_serializer import QuestionSerializer
+from .question_version_service import QuestionVersionService
+
+logger = logging.getLogger(__name__)
+
+
+class QuestionImportService:
+    """
+    Streaming bulk import of question banks (JSONL or CSV).
+
+    Records are parsed one line at a time, validated with the same rules
+    as QuestionSerializer and inserted in batches with bulk_create, so
+    memory does not grow with the file size. Invalid records are reported
+    and skipped; they never abort the import.
+
+    JSONL: {"text": ..., "difficulty": ..., "choices": [{"text", "is_correct"}]}
+    CSV: text, difficulty, correct (1-based choice index), choice_1..choice_n
+    """
+
+    FORMATS = ("jsonl", "csv")
+    DEFAULT_BATCH_SIZE = 500
+
+    # ------------------------------------------------------------------
+    # Parsing
+    # ------------------------------------------------------------------
+    @staticmethod
+    def parse_jsonl(lines: Iterable[str]) -> Iterator[ParsedRecord]:
+        return parse_jsonl(lines)
+
+    @staticmethod
+    def parse_csv(lines: Iterable[str]) -> Iterator[ParsedRecord]:
+        reader = csv.DictReader(lines)
+        choice_columns = [
+            name for name in reader.fieldnames or [] if name.startswith("choice")
+        ]
+        for row in reader:
+            choices = [
+                {"text": row[column], "is_correct": False}
+                for column in choice_columns
+                if row.get(column)
+            ]
+            try:
+                correct = int(row.get("correct") or 0)
+            except ValueError:
+                yield reader.line_num, None, "'correct' must be a choice number."
+                continue
+            if 1 <= correct <= len(choices):
+                choices[correct - 1]["is_correct"] = True
+
+            record = {"text": row.get("text"), "choices": choices}
+            if row.get("difficulty"):
+                record["difficulty"] = row["difficulty"]
+            yield reader.line_num, record, None
+
+    @staticmethod
+    def parse(lines: Iterable[str], file_format: str) -> Iterator[ParsedRecord]:
+        if file_format == "csv":
+            return QuestionImportService.parse_csv(lines)
+        return QuestionImportService.parse_jsonl(lines)
+
+    # ------------------------------------------------------------------
+    # Validation
+    # ------------------------------------------------------------------
+    @staticmethod
+    def validate(record: dict):
+        """
+        Returns (validated_data, None) or (None, errors).
+        """
+        serializer = QuestionSerializer(data=record)
+        if not serializer.is_valid():
+            return None, serializer.errors
+
+        texts = [choice["text"] for choice in serializer.validated_data["choices"]]
+        if len(texts) != len(set(texts)):
+            return None, {"choices": ["Choice texts must be unique."]}
+        return serializer.validated_data, None
+
+    # ------------------------------------------------------------------
+    # Import
+    # ------------------------------------------------------------------
+    @staticmethod
+    def run(
+        records: Iterable[ParsedRecord],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        on_reject: Optional[Callable[[dict], None]] = None,
+    ) -> ImportResult:
+        result = ImportResult()
+        started = time.monotonic()
+
+        def reject(line_number, errors):
+            rejection = result.reject(line_number, errors)
+            if on_reject is not None:
+                on_reject(rejection)
+
+        batch = []
+        for line_number, record, error in records:
+            if error is not None:
+                reject(line_number, error)
+                continue
+
+            data, errors = QuestionImportService.validate(record)
+            if errors is not None:
+                reject(line_number, errors)
+                continue
+
+            batch.append((line_number, data))
+            if len(batch) >= batch_size:
+                result.imported += QuestionImportService._flush(batch, reject)
+                batch = []
+
+        if batch:
+            result.imported += QuestionImportService._flush(batch, reject)
+
+        if result.imported:
+            # bulk_create sends no post_save, so invalidate the catalog once
+            QuestionVersionService.bump()
+
+        result.elapsed = time.monotonic() - started
+        logger.info(
+            "Question import: %s imported, %s rejected in %.2fs (%s rows/sec)",
+            result.imported,
+            result.rejected,
+            result.elapsed,
+            result.rows_per_second,
+        )
+        return result
+
+    @staticmethod
+    def _flush(batch, reject) -> int:
+        """
+        Inserts one batch in a transaction. If the database refuses it,
+        records are retried one by one so only the offending ones are lost.
+        """
+        try:
+            with transaction.atomic():
+                QuestionImportService._insert([data for _, data in batch])
+            return len(batch)
+        except DatabaseError:
+            logger.warning("Import batch failed, retrying record by record")
+
+        inserted = 0
+        for line_number, data in batch:
+            try:
+                with transaction.atomic():
+                    QuestionImportService._insert([data])
+                inserted += 1
+            except DatabaseError as exc:
+                reject(line_number, str(exc))
+        return inserted
+
+    @staticmethod
+    def _insert(items) -> None:
+        questions = Question.objects.bulk_create(
+            [
+                Question(
+                    **{key: value for key, value in data.items() if key != "choices"}
+                )
+                for data in items
+            ]
+        )
+        Choice.objects.bulk_create(
+            [
+                Choice(question=question, **choice)
+                for question, data in zip(questions, items)
+                for choice in data["choices"]
+            ]
+        )
@@ -0,0 +1,27 @@
+# apps/questions/services/question_version_service.py
+import uuid
+
+from django.core.cache import cache
+
+
+class QuestionVersionService:
+    """
+    Version token of the whole question catalog, kept in the shared cache.
+
+    Bumped on every Question/Choice write (see signals) and used as the
+    ETag validator of the question endpoints.
+    """
+
+    KEY = "questions:version"
+
+    @staticmethod
+    def get() -> str:
+        version = cache.get(QuestionVersionService.KEY)
+        if version is None:
+            cache.add(QuestionVersionService.KEY, uuid.uuid4().hex, None)
+            version = cache.get(QuestionVersionService.KEY)
+        return version
+
+    @staticmethod
+    def bump() -> None:
+        cache.set(QuestionVersionService.KEY, uuid.uuid4().hex, None)
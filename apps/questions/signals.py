@@ -0,0 +1,21 @@
+# apps/questions/signals.py
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models.choice import Choice
+from .models.question import Question
+from .services.question_version_service import QuestionVersionService
+
+
+@receiver(post_save, sender=Question)
+@receiver(post_delete, sender=Question)
+@receiver(post_save, sender=Choice)
+@receiver(post_delete, sender=Choice)
+def bump_question_catalog_version(sender, instance, **kwargs):
+    """
+    Bumps right away and again after commit, so no client can keep an ETag
+    issued for pre-commit data.
+    """
+    QuestionVersionService.bump()
+    transaction.on_commit(QuestionVersionService.bump)
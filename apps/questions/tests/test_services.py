@@ -0,0 +1,112 @@
+# apps/questions/tests/test_services.py
+"""
+Tests for question services: streaming bulk import.
+"""
+import io
+import json
+
+import pytest
+from django.core.management import call_command
+
+from apps.questions.models.choice import Choice
+from apps.questions.models.question import Question
+from apps.questions.services.question_import_service import QuestionImportService
+
+
+def _jsonl(*records):
+    return io.StringIO("\n".join(json.dumps(record) for record in records))
+
+
+VALID = {
+    "text": "Capital of France?",
+    "difficulty": "HARD",
+    "choices": [
+        {"text": "Paris", "is_correct": True},
+        {"text": "Lyon", "is_correct": False},
+    ],
+}
+
+
+@pytest.mark.django_db
+class TestQuestionImportService:
+    """Tests for QuestionImportService."""
+
+    def test_jsonl_import_inserts_in_batches(self):
+        """
+        Test that valid JSONL records are inserted with their choices.
+        Expected: All questions imported across several batches.
+        """
+        records = [dict(VALID, text=f"Question {i}?") for i in range(5)]
+
+        result = QuestionImportService.run(
+            QuestionImportService.parse(_jsonl(*records), "jsonl"), batch_size=2
+        )
+
+        assert result.imported == 5
+        assert result.rejected == 0
+        assert Question.objects.count() == 5
+        assert Choice.objects.filter(is_correct=True).count() == 5
+        assert Question.objects.get(text="Question 0?").difficulty == "HARD"
+
+    def test_invalid_records_are_rejected_without_aborting(self):
+        """
+        Test that records breaking the choice rules are reported per line.
+        Expected: Valid records imported; bad JSON, a single choice and two
+        correct answers rejected with their line numbers.
+        """
+        stream = io.StringIO(
+            "\n".join(
+                [
+                    json.dumps(VALID),
+                    "{not json",
+                    json.dumps(dict(VALID, choices=VALID["choices"][:1])),
+                    json.dumps(
+                        dict(
+                            VALID,
+                            choices=[
+                                {"text": "A", "is_correct": True},
+                                {"text": "B", "is_correct": True},
+                            ],
+                        )
+                    ),
+                ]
+            )
+        )
+
+        result = QuestionImportService.run(QuestionImportService.parse(stream, "jsonl"))
+
+        assert result.imported == 1
+        assert result.rejected == 3
+        assert [r["line"] for r in result.rejections] == [2, 3, 4]
+
+    def test_csv_import_marks_correct_choice(self):
+        """
+        Test the CSV layout: 'correct' is the 1-based index of the right choice.
+        Expected: One question with the second choice marked correct.
+        """
+        stream = io.StringIO(
+            "text,difficulty,correct,choice_1,choice_2,choice_3\n"
+            "2 + 2?,EASY,2,3,4,5\n"
+        )
+
+        result = QuestionImportService.run(QuestionImportService.parse(stream, "csv"))
+
+        assert result.imported == 1
+        correct = Choice.objects.get(is_correct=True)
+        assert correct.text == "4"
+        assert correct.question.choices.count() == 3
+
+    def test_import_questions_command_reports_throughput(self, tmp_path):
+        """
+        Test the management command end to end.
+        Expected: Summary line with imported/rejected counts and rows/sec.
+        """
+        path = tmp_path / "bank.jsonl"
+        path.write_text(json.dumps(VALID) + "\n{}\n")
+        stdout, stderr = io.StringIO(), io.StringIO()
+
+        call_command("import_questions", str(path), stdout=stdout, stderr=stderr)
+
+        assert "Imported 1 question(s), rejected 1" in stdout.getvalue()
+        assert "rows/sec" in stdout.getvalue()
+        assert "Line 2" in stderr.getvalue()
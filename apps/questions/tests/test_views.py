@@ -3,12 +3,15 @@
 Integration tests for Question and Choice API views.
 Verifies endpoint accessibility, response structures, and list data.
 """
+import json
+
 import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APIClient
 
-from apps.questions.tests.factories import QuestionFactory
+from apps.questions.tests.factories import ChoiceFactory, QuestionFactory
 
 
 @pytest.mark.django_db
@@ -64,3 +67,59 @@ class TestQuestionViews:
 
         assert response.status_code == status.HTTP_200_OK
         assert response.data["text"] == "Specific Question?"
+
+    def test_question_list_conditional_get(self, user):
+        """
+        Test that the question list honours If-None-Match.
+        Expected: 304 with the same ETag while unchanged; 200 with a new
+        ETag after a choice is edited.
+        """
+        choice = ChoiceFactory()
+        client = APIClient()
+        client.force_authenticate(user=user)
+        url = reverse("v1:question-list")
+
+        first = client.get(url)
+        etag = first["ETag"]
+        cached = client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert first.status_code == status.HTTP_200_OK
+        assert cached.status_code == status.HTTP_304_NOT_MODIFIED
+        assert cached["ETag"] == etag
+        assert not cached.content
+
+        choice.text = "Edited"
+        choice.save()
+        refreshed = client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert refreshed.status_code == status.HTTP_200_OK
+        assert refreshed["ETag"] != etag
+
+    def test_bulk_import_endpoint(self, admin_user):
+        """
+        Test that an admin can upload a JSONL question bank.
+        Expected: 200 OK with import counters; the question is created.
+        """
+        record = {
+            "text": "Imported?",
+            "choices": [
+                {"text": "Yes", "is_correct": True},
+                {"text": "No", "is_correct": False},
+            ],
+        }
+        upload = SimpleUploadedFile(
+            "bank.jsonl", (json.dumps(record) + "\n").encode(), "application/jsonl"
+        )
+        client = APIClient()
+        client.force_authenticate(user=admin_user)
+
+        response = client.post(
+            reverse("v1:question-import-questions"),
+            {"file": upload},
+            format="multipart",
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["imported"] == 1
+        assert response.data["rejected"] == 0
+        assert "rows_per_second" in response.data
@@ -1,16 +1,24 @@
 # apps/questions/views/question_viewset.py
+import codecs
 import logging
 
 from drf_spectacular.utils import extend_schema, extend_schema_view
 from rest_framework import permissions, viewsets
+from rest_framework.decorators import action
+from rest_framework.parsers import MultiPartParser
+from rest_framework.response import Response
 
+from apps.core.conditional import ConditionalGetMixin
 from apps.users.enums.user_role import UserRole
 
 from ..models.question import Question
 from ..serializers.question_serializer import (
+    QuestionImportSerializer,
     QuestionPlayerSerializer,
     QuestionSerializer,
 )
+from ..services.question_import_service import QuestionImportService
+from ..services.question_version_service import QuestionVersionService
 
 logger = logging.getLogger(__name__)
 
@@ -19,20 +27,33 @@ logger = logging.getLogger(__name__)
     list=extend_schema(summary="List questions with role-based visibility"),
     retrieve=extend_schema(summary="Get question details"),
     create=extend_schema(summary="Create question with choices (Admin only)"),
+    import_questions=extend_schema(
+        summary="Bulk import a JSONL/CSV question bank (Admin only)"
+    ),
 )
-class QuestionViewSet(viewsets.ModelViewSet):
+class QuestionViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     """
     Handles Question lifecycle.
     Admins: Full CRUD with correct answer visibility.
     Players: Read-only access to text and options (answers hidden).
+    Reads support If-None-Match against the catalog version.
     """
 
     queryset = Question.objects.prefetch_related("choices").all()
 
+    def get_etag_token(self):
+        """
+        Admin and player representations differ, so they get distinct tags.
+        """
+        variant = self.get_serializer_class().__name__
+        return f"{QuestionVersionService.get()}-{variant}"
+
     def get_serializer_class(self):
         """
         Ensures players never receive the 'is_correct' field.
         """
+        if self.action == "import_questions":
+            return QuestionImportSerializer
         user = self.request.user
         if user.is_staff or (hasattr(user, "role") and user.role == UserRole.ADMIN):
             return QuestionSerializer
@@ -61,3 +82,36 @@ class QuestionViewSet(viewsets.ModelViewSet):
             f"Question ID {instance.id} deleted by Admin: {self.request.user.email}"
         )
         instance.delete()
+
+    @action(
+        detail=False,
+        methods=["post"],
+        url_path="import",
+        parser_classes=[MultiPartParser],
+    )
+    def import_questions(self, request):
+        """
+        Streams an uploaded question bank into the database in batches.
+        Invalid records are reported in the response and skipped.
+        """
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        upload = serializer.validated_data["file"]
+        file_format = serializer.validated_data.get("file_format") or (
+            "csv" if upload.name.lower().endswith(".csv") else "jsonl"
+        )
+        result = QuestionImportService.run(
+            QuestionImportService.parse(
+                codecs.iterdecode(upload, "utf-8-sig"), file_format
+            )
+        )
+
+        logger.info(
+            "Question bank %s imported by Admin %s: %s imported, %s rejected",
+            upload.name,
+            request.user.email,
+            result.imported,
+            result.rejected,
+        )
+        return Response(result.as_dict())
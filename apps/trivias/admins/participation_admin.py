@@ -33,7 +33,7 @@ class ParticipationAdmin(admin.ModelAdmin):
     )
     list_filter = ("trivia", "end_time")
     search_fields = ("user__email", "trivia__name")
-    readonly_fields = ("start_time", "created_at", "updated_at")
+    readonly_fields = ("start_time", "duration", "created_at", "updated_at")
     inlines = [UserAnswerInline]
 
     def is_finished(self, obj):
@@ -7,3 +7,6 @@ class TriviasConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.trivias"
     verbose_name = _("Trivias")
+
+    def ready(self):
+        from . import signals  # noqa: F401
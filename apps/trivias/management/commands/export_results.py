@@ -0,0 +1,65 @@
+# apps/trivias/management/commands/export_results.py
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from apps.trivias.services.export_service import ExportService
+
+
+class Command(BaseCommand):
+    """
+    Streams participations or answers to a file (or stdout) as CSV/JSONL.
+    Memory stays flat regardless of the number of exported rows.
+    """
+
+    help = "Export participations or answers for a trivia and/or date range."
+
+    def add_arguments(self, parser):
+        parser.add_argument("dataset", choices=sorted(ExportService.DATASETS))
+        parser.add_argument("--trivia", type=int, dest="trivia_id")
+        parser.add_argument("--since", help="ISO datetime, inclusive.")
+        parser.add_argument("--until", help="ISO datetime, exclusive.")
+        parser.add_argument(
+            "--format",
+            dest="file_format",
+            choices=ExportService.FORMATS,
+            default="csv",
+        )
+        parser.add_argument(
+            "--output", default="-", help="Output file, or '-' for stdout."
+        )
+        parser.add_argument(
+            "--chunk-size", type=int, default=ExportService.DEFAULT_CHUNK_SIZE
+        )
+
+    def _parse_datetime(self, value, name):
+        if value is None:
+            return None
+        parsed = parse_datetime(value)
+        if parsed is None:
+            raise CommandError(f"--{name} must be an ISO datetime.")
+        if timezone.is_naive(parsed):
+            parsed = timezone.make_aware(parsed)
+        return parsed
+
+    def handle(self, *args, **options):
+        chunks = ExportService.stream(
+            options["dataset"],
+            file_format=options["file_format"],
+            chunk_size=options["chunk_size"],
+            trivia_id=options["trivia_id"],
+            since=self._parse_datetime(options["since"], "since"),
+            until=self._parse_datetime(options["until"], "until"),
+        )
+
+        if options["output"] == "-":
+            for chunk in chunks:
+                self.stdout.write(chunk, ending="")
+            return
+
+        with open(options["output"], "w", encoding="utf-8", newline="") as output:
+            for chunk in chunks:
+                output.write(chunk)
+        self.stderr.write(
+            self.style.SUCCESS(f"{options['dataset']} exported to {options['output']}")
+        )
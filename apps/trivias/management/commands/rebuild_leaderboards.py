@@ -0,0 +1,39 @@
+# apps/trivias/management/commands/rebuild_leaderboards.py
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.trivias.models.trivia import Trivia
+from apps.trivias.services.leaderboard_service import LeaderboardService
+
+
+class Command(BaseCommand):
+    """
+    Rebuilds the Redis leaderboards from finished participations.
+    Safe to run while serving traffic: each board is swapped in atomically.
+    """
+
+    help = "Rebuild Redis trivia leaderboards from the database."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--trivia",
+            type=int,
+            action="append",
+            dest="trivia_ids",
+            help="Trivia id to rebuild (repeatable). Defaults to all trivias.",
+        )
+
+    def handle(self, *args, **options):
+        trivia_ids = options["trivia_ids"] or list(
+            Trivia.objects.values_list("id", flat=True)
+        )
+
+        for trivia_id in trivia_ids:
+            try:
+                count = LeaderboardService.rebuild(trivia_id)
+            except RuntimeError as exc:
+                raise CommandError(str(exc)) from exc
+            self.stdout.write(f"Trivia {trivia_id}: {count} entries")
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Rebuilt {len(trivia_ids)} leaderboard(s).")
+        )
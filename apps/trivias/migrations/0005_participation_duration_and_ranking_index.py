@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-18 06:27
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("trivias", "0004_alter_participation_options_and_more"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="participation",
+            name="duration",
+            field=models.DurationField(
+                blank=True,
+                help_text="Time between start and end, persisted on finish so rankings can be served from an index.",
+                null=True,
+                verbose_name="Duration",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="participation",
+            index=models.Index(
+                condition=models.Q(("end_time__isnull", False)),
+                fields=["trivia", "-total_score", "duration"],
+                name="participation_ranking_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.2.18 on 2026-10-18 06:30
+
+from django.db import migrations, models
+
+BATCH_SIZE = 1000
+
+
+def backfill_duration(apps, schema_editor):
+    """
+    Persists end_time - start_time for finished participations.
+    Runs in small primary-key batches, each committed on its own, so the
+    table is never locked for the whole backfill.
+    """
+    Participation = apps.get_model("trivias", "Participation")
+    pending = Participation.objects.filter(
+        end_time__isnull=False, duration__isnull=True
+    ).order_by("pk")
+
+    while True:
+        batch = list(pending.values_list("pk", flat=True)[:BATCH_SIZE])
+        if not batch:
+            break
+        Participation.objects.filter(pk__in=batch).update(
+            duration=models.ExpressionWrapper(
+                models.F("end_time") - models.F("start_time"),
+                output_field=models.DurationField(),
+            )
+        )
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ("trivias", "0005_participation_duration_and_ranking_index"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_duration, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.18 on 2026-10-18 06:42
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("questions", "0004_pagination_indexes"),
+        ("trivias", "0006_backfill_participation_duration"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="participation",
+            index=models.Index(
+                fields=["user", "-created_at", "-id"],
+                name="trivias_par_user_id_e7ee4e_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="trivia",
+            index=models.Index(
+                fields=["-created_at", "-id"], name="trivias_tri_created_8eb737_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="useranswer",
+            index=models.Index(
+                fields=["-created_at", "-id"], name="trivias_use_created_4048ee_idx"
+            ),
+        ),
+    ]
@@ -29,6 +29,15 @@ class Participation(models.Model):
         default=timezone.now, verbose_name=_("Start Time")
     )
     end_time = models.DateTimeField(verbose_name=_("End Time"), null=True, blank=True)
+    duration = models.DurationField(
+        null=True,
+        blank=True,
+        verbose_name=_("Duration"),
+        help_text=_(
+            "Time between start and end, persisted on finish so rankings "
+            "can be served from an index."
+        ),
+    )
     total_score = models.PositiveIntegerField(
         default=0,
         verbose_name=_("Total Score"),
@@ -44,11 +53,30 @@ class Participation(models.Model):
         unique_together = [["user", "trivia"]]
         indexes = [
             models.Index(fields=["trivia", "total_score"]),
+            # Keyset pagination of a player's history
+            models.Index(fields=["user", "-created_at", "-id"]),
+            # Serves ORDER BY -total_score, duration for finished sessions only
+            models.Index(
+                fields=["trivia", "-total_score", "duration"],
+                condition=models.Q(end_time__isnull=False),
+                name="participation_ranking_idx",
+            ),
         ]
 
     def __str__(self):
         return f"{self.user.email} in {self.trivia.name} ({self.total_score})"
 
+    def save(self, *args, **kwargs):
+        """
+        Keeps duration in step with end_time, whichever path wrote it
+        (finish_participation, an API PATCH or the admin).
+        """
+        self.duration = self.end_time - self.start_time if self.end_time else None
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "end_time" in update_fields:
+            kwargs["update_fields"] = {*update_fields, "duration"}
+        super().save(*args, **kwargs)
+
     @property
     def is_finished(self) -> bool:
         return self.end_time is not None
@@ -56,6 +84,8 @@ class Participation(models.Model):
     @property
     def duration_seconds(self) -> float:
         """Calculates duration in seconds for ranking purposes."""
+        if self.duration is not None:
+            return self.duration.total_seconds()
         if self.end_time:
             delta = self.end_time - self.start_time
             return delta.total_seconds()
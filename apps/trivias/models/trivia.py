@@ -33,6 +33,9 @@ class Trivia(models.Model):
         verbose_name = _("Trivia")
         verbose_name_plural = _("Trivias")
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["-created_at", "-id"]),
+        ]
 
     def __str__(self):
         return self.name
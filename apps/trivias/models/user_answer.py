@@ -48,6 +48,7 @@ class UserAnswer(models.Model):
         unique_together = [["participation", "question"]]
         indexes = [
             models.Index(fields=["participation", "question"]),
+            models.Index(fields=["-created_at", "-id"]),
         ]
 
     def __str__(self):
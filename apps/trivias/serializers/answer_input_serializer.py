@@ -10,3 +10,15 @@ class AnswerInputSerializer(serializers.Serializer):
 
     question_id = serializers.IntegerField(required=True)
     choice_id = serializers.IntegerField(required=True)
+
+
+class BatchAnswerInputSerializer(serializers.Serializer):
+    """
+    DTO for submitting several answers of one participation at once.
+    """
+
+    answers = AnswerInputSerializer(many=True, allow_empty=False, max_length=500)
+    finish = serializers.BooleanField(
+        default=False,
+        help_text="Close the participation in the same transaction.",
+    )
@@ -0,0 +1,23 @@
+# apps/trivias/serializers/export_serializer.py
+from rest_framework import serializers
+
+
+class ExportQuerySerializer(serializers.Serializer):
+    """
+    Query parameters shared by the export endpoints.
+    """
+
+    trivia = serializers.IntegerField(required=False, min_value=1)
+    since = serializers.DateTimeField(
+        required=False, help_text="Rows created at or after this instant."
+    )
+    until = serializers.DateTimeField(
+        required=False, help_text="Rows created before this instant."
+    )
+    file_format = serializers.ChoiceField(choices=["csv", "jsonl"], default="csv")
+
+    def validate(self, attrs):
+        since, until = attrs.get("since"), attrs.get("until")
+        if since and until and since >= until:
+            raise serializers.ValidationError("'since' must be before 'until'.")
+        return attrs
@@ -2,11 +2,14 @@
 from rest_framework import serializers
 
 from ..models.participation import Participation
-from .user_answer_serializer import UserAnswerSerializer
 
 
 class ParticipationSerializer(serializers.ModelSerializer):
-    answers = UserAnswerSerializer(many=True, read_only=True)
+    """
+    Participation data. The retrieve action appends a paginated page of
+    answers under 'answers'.
+    """
+
     trivia_name = serializers.ReadOnlyField(source="trivia.name")
     duration = serializers.ReadOnlyField(source="duration_seconds")
 
@@ -21,12 +24,47 @@ class ParticipationSerializer(serializers.ModelSerializer):
             "end_time",
             "duration",
             "total_score",
-            "answers",
         ]
         read_only_fields = [
             "id",
             "user",
             "start_time",
             "total_score",
-            "answers",
         ]
+
+
+class ParticipationSummarySerializer(serializers.ModelSerializer):
+    """
+    Compact row used by the list action.
+    Counters are annotated by the queryset, so no answers are loaded.
+    """
+
+    trivia_name = serializers.ReadOnlyField(source="trivia.name")
+    duration = serializers.ReadOnlyField(source="duration_seconds")
+    answered_count = serializers.IntegerField(read_only=True)
+    correct_count = serializers.IntegerField(read_only=True)
+
+    class Meta:
+        model = Participation
+        fields = [
+            "id",
+            "user",
+            "trivia",
+            "trivia_name",
+            "start_time",
+            "end_time",
+            "duration",
+            "total_score",
+            "answered_count",
+            "correct_count",
+        ]
+        read_only_fields = fields
+
+    def to_representation(self, instance):
+        """
+        Like UserAnswerSerializer, correctness is hidden until the end.
+        """
+        representation = super().to_representation(instance)
+        if not instance.end_time:
+            representation.pop("correct_count", None)
+        return representation
@@ -20,11 +20,20 @@ class RankingSerializer(serializers.ModelSerializer):
 
     def get_duration_seconds(self, obj) -> float:
         """
-        Formats the timedelta duration into total seconds.
-        Note: 'duration' attribute is injected by ParticipationService.get_ranking
+        Formats the persisted timedelta duration into total seconds.
         """
-        # We check if 'duration' was annotated in the queryset
-        duration = getattr(obj, "duration", None)
-        if duration:
-            return duration.total_seconds()
-        return 0.0
+        return obj.duration_seconds
+
+
+class RankingWindowSerializer(serializers.Serializer):
+    """
+    Query parameters for the "my rank" endpoint.
+    """
+
+    window = serializers.IntegerField(
+        required=False,
+        default=5,
+        min_value=0,
+        max_value=50,
+        help_text="Number of neighbours returned above and below the caller.",
+    )
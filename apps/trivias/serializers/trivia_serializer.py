@@ -1,10 +1,13 @@
 # apps/trivias/serializers/trivia_serializer.py
+from django.db import transaction
 from rest_framework import serializers
 
+from apps.questions.models.question import Question
 from apps.questions.serializers.question_serializer import QuestionPlayerSerializer
 
 from ..models.trivia import Trivia
 from ..models.trivia_question import TriviaQuestion
+from ..services.trivia_question_service import TriviaQuestionService
 
 
 class TriviaQuestionSerializer(serializers.ModelSerializer):
@@ -19,6 +22,47 @@ class TriviaQuestionSerializer(serializers.ModelSerializer):
         fields = ["question", "order"]
 
 
+class TriviaQuestionInputSerializer(serializers.Serializer):
+    """
+    DTO for one entry of the question set written with a trivia.
+    """
+
+    question = serializers.IntegerField()
+    order = serializers.IntegerField(min_value=0)
+
+
+class TriviaReorderSerializer(serializers.Serializer):
+    """
+    DTO for reordering: every question id of the trivia, in the new order.
+    """
+
+    question_ids = serializers.ListField(
+        child=serializers.IntegerField(), allow_empty=False
+    )
+
+
+class TriviaSummarySerializer(serializers.ModelSerializer):
+    """
+    Flat catalog representation used by the list action.
+    Counters are annotated by the queryset, so no questions are loaded.
+    """
+
+    question_count = serializers.IntegerField(read_only=True)
+    max_possible_score = serializers.IntegerField(read_only=True)
+
+    class Meta:
+        model = Trivia
+        fields = [
+            "id",
+            "name",
+            "description",
+            "question_count",
+            "max_possible_score",
+            "updated_at",
+        ]
+        read_only_fields = fields
+
+
 class TriviaSerializer(serializers.ModelSerializer):
     """
     Main Trivia serializer.
@@ -30,8 +74,8 @@ class TriviaSerializer(serializers.ModelSerializer):
         source="trivia_questions", many=True, read_only=True
     )
 
-    write_questions = serializers.ListField(
-        child=serializers.DictField(), write_only=True, required=False
+    write_questions = TriviaQuestionInputSerializer(
+        many=True, write_only=True, required=False
     )
 
     class Meta:
@@ -47,15 +91,23 @@ class TriviaSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ["id", "created_at", "updated_at"]
 
+    def validate_write_questions(self, value):
+        question_ids = [item["question"] for item in value]
+        if len(question_ids) != len(set(question_ids)):
+            raise serializers.ValidationError("A question can only appear once.")
+
+        found = Question.objects.filter(id__in=question_ids).count()
+        if found != len(question_ids):
+            raise serializers.ValidationError("One or more questions do not exist.")
+        return value
+
+    @transaction.atomic
     def update(self, instance, validated_data):
         questions_data = validated_data.pop("write_questions", None)
         instance = super().update(instance, validated_data)
 
         if questions_data is not None:
-            instance.trivia_questions.all().delete()
-
-            for item in questions_data:
-                TriviaQuestion.objects.create(
-                    trivia=instance, question_id=item["question"], order=item["order"]
-                )
+            TriviaQuestionService.sync(
+                instance, {item["question"]: item["order"] for item in questions_data}
+            )
         return instance
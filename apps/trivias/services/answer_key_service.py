@@ -0,0 +1,128 @@
+# apps/trivias/services/answer_key_service.py
+import logging
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+
+from apps.core.tiered_cache import TieredCache
+from apps.questions.enums.difficulty_level import DifficultyLevel
+
+from ..models.trivia_question import TriviaQuestion
+from .trivia_version_service import TriviaVersionService
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class AnswerKey:
+    """
+    Compact scoring facts for one trivia.
+
+    - questions: question_id -> (correct_choice_id, points)
+    - choices: choice_id -> question_id (ownership of every valid choice)
+    """
+
+    trivia_id: int
+    questions: Dict[int, Tuple[Optional[int], int]] = field(default_factory=dict)
+    choices: Dict[int, int] = field(default_factory=dict)
+
+    def __contains__(self, question_id) -> bool:
+        return question_id in self.questions
+
+    def grade(self, question_id, choice_id) -> Tuple[bool, int]:
+        """Returns (is_correct, points awarded) for a validated answer."""
+        correct_choice_id, points = self.questions[question_id]
+        if choice_id == correct_choice_id:
+            return True, points
+        return False, 0
+
+
+class AnswerKeyService:
+    """
+    Two-level cache of per-trivia answer keys.
+
+    Level 1 is a bounded in-process LRU with a short TTL, so scoring is a
+    dictionary lookup. Level 2 is the shared Redis cache, tagged with the
+    trivia's content version (see TriviaVersionService). A version bump is
+    broadcast to every worker (see apps.core.tiered_cache); LOCAL_TTL
+    bounds staleness if the broadcast is lost.
+    """
+
+    # Mapping business rules: Difficulty to Points
+    DIFFICULTY_POINTS = {
+        DifficultyLevel.EASY: 1,
+        DifficultyLevel.MEDIUM: 2,
+        DifficultyLevel.HARD: 3,
+    }
+
+    _tier = TieredCache("answer_key", "ANSWER_KEY_CACHE")
+
+    @staticmethod
+    def _config(name):
+        return settings.ANSWER_KEY_CACHE[name]
+
+    @staticmethod
+    def build(trivia_id) -> AnswerKey:
+        """
+        Loads the answer key of a trivia from the database in one query.
+        """
+        rows = TriviaQuestion.objects.filter(trivia_id=trivia_id).values(
+            "question_id",
+            "question__difficulty",
+            "question__choices__id",
+            "question__choices__is_correct",
+        )
+
+        questions = {}
+        choices = {}
+        for row in rows:
+            question_id = row["question_id"]
+            correct_choice_id, points = questions.get(
+                question_id,
+                (
+                    None,
+                    AnswerKeyService.DIFFICULTY_POINTS.get(
+                        row["question__difficulty"], 0
+                    ),
+                ),
+            )
+            choice_id = row["question__choices__id"]
+            if choice_id is not None:
+                choices[choice_id] = question_id
+                if row["question__choices__is_correct"]:
+                    correct_choice_id = choice_id
+            questions[question_id] = (correct_choice_id, points)
+
+        return AnswerKey(trivia_id=trivia_id, questions=questions, choices=choices)
+
+    @staticmethod
+    def get(trivia_id) -> AnswerKey:
+        """
+        Returns the answer key of a trivia, loading it on a miss.
+        """
+
+        def load():
+            version = TriviaVersionService.get(trivia_id)
+            shared_key = f"answer_key:{trivia_id}:{version}"
+            answer_key = cache.get(shared_key)
+            if answer_key is not None:
+                return answer_key, True
+            answer_key = AnswerKeyService.build(trivia_id)
+            cache.set(shared_key, answer_key, AnswerKeyService._config("TIMEOUT"))
+            return answer_key, False
+
+        return AnswerKeyService._tier.get_or_load(trivia_id, load)[0]
+
+    @staticmethod
+    def invalidate(*trivia_ids) -> None:
+        """
+        Drops the local copies in every worker; the shared copies are
+        orphaned by bumping the trivia version.
+        """
+        AnswerKeyService._tier.invalidate(*trivia_ids)
+
+    @staticmethod
+    def clear_local() -> None:
+        AnswerKeyService._tier.clear_local()
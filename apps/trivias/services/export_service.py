@@ -0,0 +1,117 @@
+# apps/trivias/services/export_service.py
+import csv
+import json
+from datetime import date, datetime, timedelta
+
+from ..models.participation import Participation
+from ..models.user_answer import UserAnswer
+
+
+class _Echo:
+    """File-like object whose write() returns the value, for csv.writer."""
+
+    def write(self, value):
+        return value
+
+
+class ExportService:
+    """
+    Streams participation and answer rows as CSV or JSONL.
+
+    Rows are read with values() projections through QuerySet.iterator(),
+    so no model instances are built and memory stays flat however many
+    rows are exported; output starts with the first fetched chunk.
+    """
+
+    FORMATS = ("csv", "jsonl")
+    CONTENT_TYPES = {"csv": "text/csv", "jsonl": "application/x-ndjson"}
+    DEFAULT_CHUNK_SIZE = 2000
+
+    DATASETS = {
+        "participations": (
+            Participation,
+            "trivia_id",
+            [
+                "id",
+                "trivia_id",
+                "user_id",
+                "user__email",
+                "start_time",
+                "end_time",
+                "duration",
+                "total_score",
+                "created_at",
+            ],
+        ),
+        "answers": (
+            UserAnswer,
+            "participation__trivia_id",
+            [
+                "id",
+                "participation_id",
+                "participation__trivia_id",
+                "participation__user_id",
+                "question_id",
+                "chosen_choice_id",
+                "is_correct",
+                "created_at",
+            ],
+        ),
+    }
+
+    @staticmethod
+    def get_queryset(dataset, trivia_id=None, since=None, until=None):
+        """
+        Returns the values() queryset of a dataset, filtered by trivia and
+        by a [since, until) created_at range.
+        """
+        model, trivia_lookup, fields = ExportService.DATASETS[dataset]
+        queryset = model.objects.all()
+        if trivia_id is not None:
+            queryset = queryset.filter(**{trivia_lookup: trivia_id})
+        if since is not None:
+            queryset = queryset.filter(created_at__gte=since)
+        if until is not None:
+            queryset = queryset.filter(created_at__lt=until)
+        return queryset.order_by("id").values_list(*fields)
+
+    @staticmethod
+    def _encode(value):
+        if isinstance(value, timedelta):
+            return value.total_seconds()
+        if isinstance(value, (datetime, date)):
+            return value.isoformat()
+        return value
+
+    @staticmethod
+    def stream(dataset, file_format="csv", chunk_size=DEFAULT_CHUNK_SIZE, **filters):
+        """
+        Yields the export as text chunks (one per fetched chunk of rows).
+        """
+        fields = ExportService.DATASETS[dataset][2]
+        rows = ExportService.get_queryset(dataset, **filters).iterator(
+            chunk_size=chunk_size
+        )
+        encode = ExportService._encode
+
+        if file_format == "csv":
+            writer = csv.writer(_Echo())
+            yield writer.writerow(fields)
+
+            def format_row(row):
+                return writer.writerow([encode(value) for value in row])
+
+        else:
+
+            def format_row(row):
+                record = {name: encode(value) for name, value in zip(fields, row)}
+                return json.dumps(record) + "\n"
+
+        buffer = []
+        for row in rows:
+            buffer.append(format_row(row))
+            if len(buffer) >= chunk_size:
+                yield "".join(buffer)
+                buffer = []
+        if buffer:
+            yield "".join(buffer)
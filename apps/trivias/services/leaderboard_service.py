@@ -0,0 +1,468 @@
+# apps/trivias/services/leaderboard_service.py
+import json
+import logging
+import threading
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connection
+from redis.exceptions import RedisError
+
+from apps.core import metrics
+from apps.core.cache import get_redis_client
+
+from ..models.participation import Participation
+from ..serializers.ranking_serializer import RankingSerializer
+
+logger = logging.getLogger(__name__)
+
+# Upserts one participation (replacing its previous member, whose duration
+# may differ) into a board given as KEYS scores, entries, members.
+_PUT_LUA = """
+local function put(scores, entries, members, id, member, score, row)
+  local old = redis.call("HGET", members, id)
+  if old and old ~= member then redis.call("ZREM", scores, old) end
+  redis.call("ZADD", scores, score, member)
+  redis.call("HSET", entries, id, row)
+  redis.call("HSET", members, id, member)
+end
+"""
+
+# KEYS: scores, entries, members, rebuilding, tmp scores/entries/members,
+# tmp removed. ARGV: id, member, score, row.
+# While a rebuild is in flight the write also lands in the rebuild keys.
+RECORD_LUA = (
+    _PUT_LUA
+    + """
+put(KEYS[1], KEYS[2], KEYS[3], ARGV[1], ARGV[2], ARGV[3], ARGV[4])
+if redis.call("EXISTS", KEYS[4]) == 1 then
+  redis.call("SREM", KEYS[8], ARGV[1])
+  put(KEYS[5], KEYS[6], KEYS[7], ARGV[1], ARGV[2], ARGV[3], ARGV[4])
+end
+"""
+)
+
+# Same KEYS as RECORD_LUA. ARGV: id. Removals during a rebuild are
+# remembered so rows scanned before the delete are not resurrected.
+REMOVE_LUA = """
+local function del(scores, entries, members, id)
+  local old = redis.call("HGET", members, id)
+  if old then redis.call("ZREM", scores, old) end
+  redis.call("HDEL", entries, id)
+  redis.call("HDEL", members, id)
+end
+del(KEYS[1], KEYS[2], KEYS[3], ARGV[1])
+if redis.call("EXISTS", KEYS[4]) == 1 then
+  del(KEYS[5], KEYS[6], KEYS[7], ARGV[1])
+  redis.call("SADD", KEYS[8], ARGV[1])
+end
+"""
+
+# KEYS: tmp scores/entries/members, tmp removed. ARGV: (id, member, score,
+# row) repeated. Rows already written by a concurrent record() are newer
+# than the scan and are kept.
+FILL_LUA = """
+for i = 1, #ARGV, 4 do
+  if redis.call("HEXISTS", KEYS[3], ARGV[i]) == 0
+      and redis.call("SISMEMBER", KEYS[4], ARGV[i]) == 0 then
+    redis.call("ZADD", KEYS[1], ARGV[i + 2], ARGV[i + 1])
+    redis.call("HSET", KEYS[2], ARGV[i], ARGV[i + 3])
+    redis.call("HSET", KEYS[3], ARGV[i], ARGV[i + 1])
+  end
+end
+"""
+
+# KEYS: scores, entries, members, tmp scores/entries/members, rebuilding,
+# tmp removed. Swaps the rebuilt board in and ends the rebuild.
+SWAP_LUA = """
+for i = 1, 3 do
+  if redis.call("EXISTS", KEYS[i + 3]) == 1 then
+    redis.call("RENAME", KEYS[i + 3], KEYS[i])
+  else
+    redis.call("DEL", KEYS[i])
+  end
+end
+redis.call("DEL", KEYS[7], KEYS[8])
+"""
+
+_scripts = {}
+
+
+def _run(source, client, keys, args):
+    script = _scripts.get(source)
+    if script is None:
+        script = _scripts[source] = client.register_script(source)
+    return script(keys=keys, args=args, client=client)
+
+
+class LeaderboardService:
+    """
+    Redis-backed leaderboard engine.
+
+    Keeps one sorted set per trivia plus a hash holding the pre-serialized
+    ranking row of every participation, so top-N reads never touch
+    Postgres. A board is only served once it holds the READY sentinel
+    (added by a full rebuild or on trivia creation), which lives in the
+    sorted set itself: if Redis evicts the set, the board reads as cold and
+    callers fall back to the SQL ranking.
+    """
+
+    # Members sort like the SQL ranking (-total_score, duration, id): the
+    # score is total_score and, on equal scores, ZREVRANGE orders members
+    # in reverse lexicographic order, so both tie-breakers are stored
+    # inverted and zero-padded (exact to the microsecond).
+    DURATION_MAX_US = 10**17 - 1
+    ID_MAX = 10**19 - 1
+    READY = "ready"
+    REBUILD_BATCH_SIZE = 2000
+    # Bounds how long an aborted rebuild keeps mirroring writes
+    REBUILD_TIMEOUT = 60 * 60
+    # At most one background rebuild per board per interval (seconds)
+    REBUILD_INTERVAL = 60
+
+    # ------------------------------------------------------------------
+    # Keys / encoding
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _key(trivia_id, suffix="scores") -> str:
+        prefix = settings.CACHES["default"].get("KEY_PREFIX", "")
+        return f"{prefix}:leaderboard:{trivia_id}:{suffix}"
+
+    @staticmethod
+    def _keys(trivia_id) -> list:
+        """Board keys, rebuild marker and rebuild keys (see the scripts)."""
+        board = [
+            LeaderboardService._key(trivia_id, suffix)
+            for suffix in ("scores", "entries", "members")
+        ]
+        return [
+            *board,
+            LeaderboardService._key(trivia_id, "rebuilding"),
+            *[f"{key}:rebuild" for key in board],
+            LeaderboardService._key(trivia_id, "removed:rebuild"),
+        ]
+
+    @staticmethod
+    def encode_member(participation_id: int, duration: timedelta) -> str:
+        """
+        Encodes the tie-breakers so that a higher member ranks first.
+        """
+        duration_us = duration // timedelta(microseconds=1)
+        duration_us = min(max(duration_us, 0), LeaderboardService.DURATION_MAX_US)
+        return (
+            f"{LeaderboardService.DURATION_MAX_US - duration_us:017d}:"
+            f"{LeaderboardService.ID_MAX - participation_id:019d}"
+        )
+
+    @staticmethod
+    def decode_member(member) -> int:
+        """Returns the participation id of a member."""
+        if isinstance(member, bytes):
+            member = member.decode()
+        return LeaderboardService.ID_MAX - int(member.split(":")[1])
+
+    @staticmethod
+    def _fields(participation) -> list:
+        duration = participation.duration or (
+            participation.end_time - participation.start_time
+        )
+        return [
+            participation.id,
+            LeaderboardService.encode_member(participation.id, duration),
+            participation.total_score,
+            json.dumps(RankingSerializer(participation).data),
+        ]
+
+    @staticmethod
+    def _members(client, trivia_id, start, stop) -> list:
+        sentinel = LeaderboardService.READY.encode()
+        members = client.zrevrange(LeaderboardService._key(trivia_id), start, stop)
+        return [member for member in members if member != sentinel]
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+    @staticmethod
+    def record(participation) -> None:
+        """
+        Incrementally upserts a finished participation into its trivia board.
+        On failure the board is dropped so reads fall back to SQL until the
+        next rebuild, instead of serving it without this participation.
+        """
+        if not participation.is_finished:
+            return
+
+        client = get_redis_client()
+        if client is None:
+            return
+
+        trivia_id = participation.trivia_id
+        try:
+            _run(
+                RECORD_LUA,
+                client,
+                LeaderboardService._keys(trivia_id),
+                LeaderboardService._fields(participation),
+            )
+        except RedisError:
+            logger.warning(
+                "Could not record participation %s in leaderboard %s",
+                participation.id,
+                trivia_id,
+                exc_info=True,
+            )
+            LeaderboardService.drop(trivia_id)
+
+    @staticmethod
+    def remove(trivia_id, participation_id) -> None:
+        client = get_redis_client()
+        if client is None:
+            return
+        try:
+            _run(
+                REMOVE_LUA,
+                client,
+                LeaderboardService._keys(trivia_id),
+                [participation_id],
+            )
+        except RedisError:
+            logger.warning(
+                "Could not remove participation %s from leaderboard %s",
+                participation_id,
+                trivia_id,
+                exc_info=True,
+            )
+            LeaderboardService.drop(trivia_id)
+
+    @staticmethod
+    def sync(trivia_id, participation_id) -> None:
+        """
+        Re-reads a participation and records it, or removes it from the
+        board when it no longer exists or is no longer finished.
+        """
+        participation = (
+            Participation.objects.filter(pk=participation_id)
+            .select_related("user")
+            .first()
+        )
+        if participation is None or not participation.is_finished:
+            LeaderboardService.remove(trivia_id, participation_id)
+        else:
+            LeaderboardService.record(participation)
+
+    @staticmethod
+    def mark_ready(trivia_id) -> None:
+        """
+        Flags a board as authoritative. Used for brand-new trivias, whose
+        empty board is already exact.
+        """
+        client = get_redis_client()
+        if client is None:
+            return
+        try:
+            client.zadd(
+                LeaderboardService._key(trivia_id),
+                {LeaderboardService.READY: "-inf"},
+            )
+        except RedisError:
+            logger.warning("Could not mark leaderboard %s as ready", trivia_id)
+
+    @staticmethod
+    def drop(trivia_id) -> None:
+        client = get_redis_client()
+        if client is None:
+            return
+        try:
+            client.delete(*LeaderboardService._keys(trivia_id)[:3])
+        except RedisError:
+            logger.warning("Could not drop leaderboard %s", trivia_id)
+
+    @staticmethod
+    def rebuild(trivia_id) -> int:
+        """
+        Rebuilds a trivia board from the database.
+
+        Rows are streamed into temporary keys and swapped in atomically,
+        so readers never observe a half-built board. Participations
+        recorded or removed while the scan runs are mirrored into the
+        temporary keys, so none is lost by the swap.
+        Returns the number of entries written.
+        """
+        client = get_redis_client()
+        if client is None:
+            raise RuntimeError("Leaderboards require the django_redis cache backend.")
+
+        keys = LeaderboardService._keys(trivia_id)
+        board, rebuilding, tmp_board, tmp_removed = (
+            keys[:3],
+            keys[3],
+            keys[4:7],
+            keys[7],
+        )
+
+        # The marker goes up before the scan, so every write committed
+        # after the scan's snapshot is mirrored
+        start = client.pipeline(transaction=True)
+        start.delete(*tmp_board, tmp_removed)
+        start.zadd(tmp_board[0], {LeaderboardService.READY: "-inf"})
+        start.set(rebuilding, 1, ex=LeaderboardService.REBUILD_TIMEOUT)
+        start.execute()
+
+        queryset = Participation.objects.filter(
+            trivia_id=trivia_id, end_time__isnull=False
+        ).select_related("user")
+
+        count = 0
+        batch = []
+        for participation in queryset.iterator(
+            chunk_size=LeaderboardService.REBUILD_BATCH_SIZE
+        ):
+            batch.extend(LeaderboardService._fields(participation))
+            count += 1
+            if count % LeaderboardService.REBUILD_BATCH_SIZE == 0:
+                _run(FILL_LUA, client, [*tmp_board, tmp_removed], batch)
+                batch = []
+        if batch:
+            _run(FILL_LUA, client, [*tmp_board, tmp_removed], batch)
+
+        _run(SWAP_LUA, client, [*board, *tmp_board, rebuilding, tmp_removed], [])
+
+        logger.info("Leaderboard %s rebuilt with %s entries", trivia_id, count)
+        return count
+
+    @staticmethod
+    def _rebuild_in_background(trivia_id) -> None:
+        try:
+            LeaderboardService.rebuild(trivia_id)
+        except Exception:
+            logger.exception("Background rebuild of leaderboard %s failed", trivia_id)
+        finally:
+            # Threads outside the request cycle must release their connection
+            connection.close()
+
+    @staticmethod
+    def report_cold(trivia_id, read) -> bool:
+        """
+        Called when a `read` ("top" or "around") had to be served from SQL.
+        Counts the fallback and starts a background rebuild, at most once
+        per REBUILD_INTERVAL per board across all processes, so the
+        O(rank) SQL path does not stay hot after one Redis error.
+        Returns whether a rebuild was started.
+        """
+        metrics.LEADERBOARD_FALLBACKS.labels(read).inc()
+        client = get_redis_client()
+        if client is None:
+            return False
+
+        try:
+            claimed = client.set(
+                LeaderboardService._key(trivia_id, "rebuild:scheduled"),
+                1,
+                nx=True,
+                ex=LeaderboardService.REBUILD_INTERVAL,
+            )
+        except RedisError:
+            return False
+        if not claimed:
+            return False
+
+        logger.warning(
+            "Leaderboard %s is cold, serving from SQL; rebuilding in background",
+            trivia_id,
+        )
+        threading.Thread(
+            target=LeaderboardService._rebuild_in_background,
+            args=(trivia_id,),
+            name=f"leaderboard-rebuild-{trivia_id}",
+            daemon=True,
+        ).start()
+        return True
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+    @staticmethod
+    def get_top(trivia_id, limit=10):
+        """
+        Returns the top-N serialized ranking rows, or None when the board
+        is cold (not built yet, Redis unavailable or evicted).
+        """
+        client = get_redis_client()
+        if client is None:
+            return None
+
+        try:
+            ready = client.zscore(
+                LeaderboardService._key(trivia_id), LeaderboardService.READY
+            )
+            if ready is None:
+                return None
+
+            members = LeaderboardService._members(client, trivia_id, 0, limit - 1)
+            if not members:
+                return []
+
+            rows = client.hmget(
+                LeaderboardService._key(trivia_id, "entries"),
+                [LeaderboardService.decode_member(member) for member in members],
+            )
+        except RedisError:
+            logger.warning("Leaderboard %s unavailable, falling back to SQL", trivia_id)
+            return None
+
+        if any(row is None for row in rows):
+            # Scores and entries drifted apart; let the SQL path answer.
+            return None
+
+        return [json.loads(row) for row in rows]
+
+    @staticmethod
+    def get_around(trivia_id, participation_id, window=5):
+        """
+        Returns the participation's 1-based rank, the board size and the
+        serialized rows `window` positions above and below it.
+
+        ZREVRANK/ZREVRANGE are O(log n), so this stays cheap at any position.
+        Returns None when the board is cold or the member is missing.
+        """
+        client = get_redis_client()
+        if client is None:
+            return None
+
+        scores_key = LeaderboardService._key(trivia_id)
+        try:
+            pipe = client.pipeline(transaction=False)
+            pipe.zscore(scores_key, LeaderboardService.READY)
+            pipe.hget(LeaderboardService._key(trivia_id, "members"), participation_id)
+            pipe.zcard(scores_key)
+            ready, member, size = pipe.execute()
+            if ready is None or member is None:
+                return None
+
+            position = client.zrevrank(scores_key, member)
+            if position is None:
+                return None
+
+            start = max(position - window, 0)
+            members = LeaderboardService._members(
+                client, trivia_id, start, position + window
+            )
+            rows = client.hmget(
+                LeaderboardService._key(trivia_id, "entries"),
+                [LeaderboardService.decode_member(member) for member in members],
+            )
+        except RedisError:
+            logger.warning("Leaderboard %s unavailable, falling back to SQL", trivia_id)
+            return None
+
+        if any(row is None for row in rows):
+            return None
+
+        entries = []
+        for offset, row in enumerate(rows):
+            entry = json.loads(row)
+            entry["rank"] = start + offset + 1
+            entries.append(entry)
+
+        # The READY sentinel is not a participation
+        return {"rank": position + 1, "total": size - 1, "entries": entries}
@@ -2,14 +2,16 @@
 import logging
 
 from django.core.exceptions import ValidationError
-from django.db import transaction
-from django.db.models import ExpressionWrapper, F, fields
+from django.db import IntegrityError, transaction
+from django.db.models import F, Q
 from django.utils import timezone
 
-from apps.questions.enums.difficulty_level import DifficultyLevel
+from apps.core import metrics
 
 from ..models.participation import Participation
 from ..models.user_answer import UserAnswer
+from .answer_key_service import AnswerKeyService
+from .leaderboard_service import LeaderboardService
 
 logger = logging.getLogger(__name__)
 
@@ -21,64 +23,194 @@ class ParticipationService:
     """
 
     # Mapping business rules: Difficulty to Points
-    DIFFICULTY_POINTS = {
-        DifficultyLevel.EASY: 1,
-        DifficultyLevel.MEDIUM: 2,
-        DifficultyLevel.HARD: 3,
-    }
+    DIFFICULTY_POINTS = AnswerKeyService.DIFFICULTY_POINTS
+
+    @staticmethod
+    def _record_metrics(mode, outcomes) -> None:
+        """
+        Counts accepted answers once the transaction commits.
+        """
+
+        def record():
+            metrics.ANSWERS_SUBMITTED.labels(mode).inc(len(outcomes))
+            correct = sum(outcomes)
+            if correct:
+                metrics.ANSWER_OUTCOMES.labels("correct").inc(correct)
+            if len(outcomes) - correct:
+                metrics.ANSWER_OUTCOMES.labels("incorrect").inc(len(outcomes) - correct)
+
+        transaction.on_commit(record)
+
+    @staticmethod
+    def _grade(answer_key, question_id, choice_id):
+        """
+        Validates one answer against the trivia's answer key.
+        Returns (is_correct, points).
+        """
+        # Validation: Does the question belong to the trivia?
+        if question_id not in answer_key:
+            raise ValidationError("Question does not belong to this trivia.")
+
+        # Validation: Does the choice belong to the question?
+        if answer_key.choices.get(choice_id) != question_id:
+            raise ValidationError("Invalid choice for this question.")
+
+        return answer_key.grade(question_id, choice_id)
+
+    @staticmethod
+    def _apply_score(participation, points, **changes) -> None:
+        """
+        Adds points with a single UPDATE ... SET total_score = total_score + N,
+        guarded so a session finished concurrently is never modified.
+        """
+        updated = Participation.objects.filter(
+            pk=participation.pk, end_time__isnull=True
+        ).update(
+            total_score=F("total_score") + points, updated_at=timezone.now(), **changes
+        )
+        if not updated:
+            # Finished concurrently; the atomic block rolls the answers back.
+            raise ValidationError("This participation has already ended.")
+
+        # Local view only: the database row is the source of truth.
+        participation.total_score += points
 
     @staticmethod
     @transaction.atomic
-    def submit_answer(participation, question, chosen_choice) -> UserAnswer:
+    def submit_answer(participation, question_id, choice_id) -> UserAnswer:
         """
         Processes a user's answer, calculates points, and updates participation.
+
+        Correctness, difficulty and trivia membership come from the cached
+        answer key (a dictionary lookup); the answer is then written with one
+        INSERT and one guarded UPDATE.
+
+        Race-free under concurrent submissions: duplicates are rejected by the
+        (participation, question) unique constraint and points are added with
+        a single UPDATE ... SET total_score = total_score + N.
         """
         # Validation: Is the trivia already finished?
         if participation.is_finished:
             raise ValidationError("This participation has already ended.")
 
+        answer_key = AnswerKeyService.get(participation.trivia_id)
+        is_correct, points = ParticipationService._grade(
+            answer_key, question_id, choice_id
+        )
+
+        # Create UserAnswer (is_correct is cached here).
         # Validation: Has this question already been answered in this session?
-        if UserAnswer.objects.filter(
-            participation=participation, question=question
-        ).exists():
+        # No savepoint around the INSERT itself, so the IntegrityError must
+        # not be handled inside this block. The ValidationError leaves it
+        # instead, rolling back to the savepoint @transaction.atomic opened
+        # (the whole transaction at top level). A caller in an enclosing
+        # atomic block can catch it and keep using that transaction.
+        try:
+            user_answer = UserAnswer.objects.create(
+                participation=participation,
+                question_id=question_id,
+                chosen_choice_id=choice_id,
+                is_correct=is_correct,
+            )
+        except IntegrityError:
             raise ValidationError("Question already answered.")
 
-        # Validation: Does the choice belong to the question?
-        if chosen_choice.question_id != question.id:
-            raise ValidationError("Invalid choice for this question.")
+        # Scoring Logic: If correct, add points based on difficulty.
+        # Always executed: it also re-checks that the session is still open.
+        ParticipationService._apply_score(participation, points)
+        ParticipationService._record_metrics("single", [is_correct])
 
-        # Validation: Does the question belong to the trivia?
-        if not participation.trivia.questions.filter(id=question.id).exists():
-            raise ValidationError("Question does not belong to this trivia.")
+        if is_correct:
+            logger.info(
+                "User %s scored %s points in Trivia %s",
+                participation.user_id,
+                points,
+                participation.trivia_id,
+            )
 
-        # Create UserAnswer (is_correct is cached here)
-        user_answer = UserAnswer.objects.create(
-            participation=participation,
-            question=question,
-            chosen_choice=chosen_choice,
-            is_correct=chosen_choice.is_correct,
-        )
+        return user_answer
 
-        # Scoring Logic: If correct, add points based on difficulty
-        if user_answer.is_correct:
-            points = ParticipationService.DIFFICULTY_POINTS.get(question.difficulty, 0)
-            participation.total_score += points
-            participation.save(update_fields=["total_score", "updated_at"])
+    @staticmethod
+    @transaction.atomic
+    def submit_answers(participation, answers, finish=False) -> list:
+        """
+        Processes a batch of (question_id, choice_id) answers for one
+        participation, all-or-nothing.
 
-            logger.info(
-                f"User {participation.user.email} scored {points} points "
-                f"in Trivia {participation.trivia.id}"
+        Every pair is graded against the cached answer key, one bulk INSERT
+        stores the answers and one UPDATE applies the score delta (and closes
+        the session when `finish` is set).
+        """
+        if participation.is_finished:
+            raise ValidationError("This participation has already ended.")
+
+        question_ids = [question_id for question_id, _ in answers]
+        if len(set(question_ids)) != len(question_ids):
+            raise ValidationError("Each question can only be answered once.")
+
+        answer_key = AnswerKeyService.get(participation.trivia_id)
+
+        user_answers = []
+        points = 0
+        for question_id, choice_id in answers:
+            try:
+                is_correct, awarded = ParticipationService._grade(
+                    answer_key, question_id, choice_id
+                )
+            except ValidationError as e:
+                raise ValidationError(f"Question {question_id}: {e.messages[0]}")
+
+            points += awarded
+            user_answers.append(
+                UserAnswer(
+                    participation=participation,
+                    question_id=question_id,
+                    chosen_choice_id=choice_id,
+                    is_correct=is_correct,
+                )
             )
 
-        return user_answer
+        try:
+            UserAnswer.objects.bulk_create(user_answers)
+        except IntegrityError:
+            raise ValidationError("One or more questions were already answered.")
+
+        changes = {}
+        if finish:
+            now = timezone.now()
+            changes = {"end_time": now, "duration": now - participation.start_time}
+        ParticipationService._apply_score(participation, points, **changes)
+
+        if finish:
+            participation.end_time = changes["end_time"]
+            participation.duration = changes["duration"]
+            # The UPDATE added a delta: points committed by concurrent single
+            # submits are only in the row, which is now closed and locked.
+            participation.refresh_from_db(fields=["total_score"])
+            transaction.on_commit(lambda: LeaderboardService.record(participation))
+        ParticipationService._record_metrics(
+            "batch", [answer.is_correct for answer in user_answers]
+        )
+
+        logger.info(
+            "Participation %s submitted %s answers (%s points, finished: %s)",
+            participation.pk,
+            len(user_answers),
+            points,
+            finish,
+        )
+        return user_answers
 
     @staticmethod
     def finish_participation(participation):
         """
         Closes the participation session and records the end time.
+        The trivia leaderboard is updated once the transaction commits
+        (see signals).
         """
         if not participation.is_finished:
             participation.end_time = timezone.now()
+            # save() also writes the matching duration
             participation.save(update_fields=["end_time", "updated_at"])
             logger.info(
                 f"Participation {participation.id} finished at {participation.end_time}"
@@ -90,26 +222,58 @@ class ParticipationService:
         """
         Calculates the leaderboard.
         Primary sort: Highest total_score.
-        Secondary sort (Tie-breaker): Shortest duration.
+        Secondary sort (Tie-breaker): Shortest duration, then lowest id.
+
+        Filtered by trivia, this is an ordered scan of the partial
+        participation_ranking_idx index stopped at LIMIT.
         """
         queryset = Participation.objects.filter(end_time__isnull=False)
 
         if trivia_id:
             queryset = queryset.filter(trivia_id=trivia_id)
 
-        # ExpressionWrapper to perform the duration calculation.
-        # Duration = end_time - start_time
-        ranking = (
-            queryset.select_related("user")
-            .annotate(
-                duration=ExpressionWrapper(
-                    F("end_time") - F("start_time"), output_field=fields.DurationField()
-                )
-            )
-            .order_by(
-                "-total_score",  # Primary: More points is better
-                "duration",  # Secondary (Tie-breaker): Less time is better
-            )[:limit]
-        )
+        ranking = queryset.select_related("user").order_by(
+            "-total_score",  # Primary: More points is better
+            "duration",  # Secondary (Tie-breaker): Less time is better
+            "id",  # Stable order for exact ties, as on the Redis board
+        )[:limit]
 
         return ranking
+
+    @staticmethod
+    def get_rank_window(participation, window=5):
+        """
+        SQL fallback for "my rank": the participation's 1-based rank, the
+        number of finished participations and up to `window` neighbours on
+        each side. Used only while the Redis leaderboard is cold.
+
+        Returns a tuple (rank, total, first_rank, participations).
+        """
+        queryset = Participation.objects.filter(
+            trivia_id=participation.trivia_id, end_time__isnull=False
+        ).select_related("user")
+
+        duration = participation.duration or (
+            participation.end_time - participation.start_time
+        )
+        score = participation.total_score
+        better = (
+            Q(total_score__gt=score)
+            | Q(total_score=score, duration__lt=duration)
+            | Q(total_score=score, duration=duration, id__lt=participation.id)
+        )
+
+        rank = queryset.filter(better).count() + 1
+        total = queryset.count()
+
+        above = list(
+            queryset.filter(better).order_by("total_score", "-duration", "-id")[:window]
+        )
+        above.reverse()
+        current_and_below = list(
+            queryset.exclude(better).order_by("-total_score", "duration", "id")[
+                : window + 1
+            ]
+        )
+
+        return rank, total, rank - len(above), above + current_and_below
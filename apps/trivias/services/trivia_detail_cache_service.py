@@ -0,0 +1,76 @@
+# apps/trivias/services/trivia_detail_cache_service.py
+import logging
+
+from django.conf import settings
+from django.core.cache import cache
+
+from apps.core.tiered_cache import TieredCache
+
+from .trivia_version_service import TriviaVersionService
+
+logger = logging.getLogger(__name__)
+
+
+class TriviaDetailCacheService:
+    """
+    Caches the rendered, player-safe JSON of a trivia detail.
+
+    Bodies are kept in a short-lived in-process LRU in front of the shared
+    cache (see apps.core.tiered_cache). Both tiers store (version, bytes),
+    so callers always learn which version they are serving. The shared
+    payload is fetched together with the trivia's current version
+    in a single MGET, so a shared hit costs one cache round trip and no
+    database or serializer work. Per-tier hit ratios are kept per process
+    (see `stats`).
+    """
+
+    _tier = TieredCache("trivia_detail", "TRIVIA_DETAIL_CACHE")
+
+    @staticmethod
+    def payload_key(trivia_id) -> str:
+        return f"trivia:{trivia_id}:detail"
+
+    @staticmethod
+    def get_or_build(trivia_id, build):
+        """
+        Returns (version, body, hit), where version is the one the body was
+        built from (a local copy may lag the current one by LOCAL_TTL).
+        On a miss `build()` renders the payload, which is stored under the
+        version read *before* building.
+        """
+
+        def load():
+            version_key = TriviaVersionService.key(trivia_id)
+            payload_key = TriviaDetailCacheService.payload_key(trivia_id)
+            values = cache.get_many([version_key, payload_key])
+
+            version = values.get(version_key)
+            stored = values.get(payload_key)
+            if version is not None and stored is not None and stored[0] == version:
+                return stored, True
+
+            if version is None:
+                version = TriviaVersionService.get(trivia_id)
+            payload = (version, build())
+            cache.set(payload_key, payload, settings.TRIVIA_DETAIL_CACHE["TIMEOUT"])
+            return payload, False
+
+        payload, tier = TriviaDetailCacheService._tier.get_or_load(int(trivia_id), load)
+        version, body = payload
+        return version, body, tier is not None
+
+    @staticmethod
+    def invalidate(*trivia_ids) -> None:
+        """
+        Drops the local copies in every worker; shared payloads are
+        orphaned by the version bump.
+        """
+        TriviaDetailCacheService._tier.invalidate(*trivia_ids)
+
+    @staticmethod
+    def clear_local() -> None:
+        TriviaDetailCacheService._tier.clear_local()
+
+    @staticmethod
+    def stats() -> dict:
+        return TriviaDetailCacheService._tier.stats()
@@ -0,0 +1,104 @@
+# apps/trivias/services/trivia_question_service.py
+import logging
+
+from django.core.exceptions import ValidationError
+from django.db import transaction
+
+from ..models.trivia_question import TriviaQuestion
+from ..signals import trivia_questions_changed
+
+logger = logging.getLogger(__name__)
+
+
+class TriviaQuestionService:
+    """
+    Maintains the ordered question set of a trivia.
+
+    Changes are applied as a diff against the existing rows (one bulk
+    insert, one delete and one bulk update), so reordering a single
+    question does not rewrite the whole set.
+    """
+
+    @staticmethod
+    @transaction.atomic
+    def sync(trivia, orders) -> dict:
+        """
+        Makes the trivia contain exactly the given questions.
+
+        `orders` maps question_id -> order.
+        Returns the number of created, deleted and reordered rows.
+        """
+        existing = {
+            row.question_id: row
+            for row in TriviaQuestion.objects.select_for_update()
+            .filter(trivia=trivia)
+            .only("id", "question_id", "order")
+        }
+
+        to_create = [
+            TriviaQuestion(trivia=trivia, question_id=question_id, order=order)
+            for question_id, order in orders.items()
+            if question_id not in existing
+        ]
+        to_delete = [
+            row.id for question_id, row in existing.items() if question_id not in orders
+        ]
+        to_update = []
+        for question_id, row in existing.items():
+            order = orders.get(question_id)
+            if order is not None and row.order != order:
+                row.order = order
+                to_update.append(row)
+
+        if to_delete:
+            # Nothing references these rows, so the deletion collector (and
+            # its post_delete per row, each bumping the version) is skipped
+            deleted = TriviaQuestion.objects.filter(id__in=to_delete)
+            deleted._raw_delete(deleted.db)
+        if to_create:
+            TriviaQuestion.objects.bulk_create(to_create)
+        if to_update:
+            TriviaQuestion.objects.bulk_update(to_update, ["order"])
+
+        if to_create or to_update or to_delete:
+            # Bulk operations send no model signals
+            trivia_questions_changed.send(sender=TriviaQuestion, trivia_id=trivia.id)
+
+        logger.info(
+            "Trivia %s questions synced: %s created, %s deleted, %s reordered",
+            trivia.id,
+            len(to_create),
+            len(to_delete),
+            len(to_update),
+        )
+        return {
+            "created": len(to_create),
+            "deleted": len(to_delete),
+            "reordered": len(to_update),
+        }
+
+    @staticmethod
+    @transaction.atomic
+    def reorder(trivia, question_ids) -> int:
+        """
+        Renumbers the trivia questions following `question_ids`, which must
+        list every current question exactly once.
+        Returns the number of rows whose order changed.
+        """
+        current = set(
+            TriviaQuestion.objects.select_for_update()
+            .filter(trivia=trivia)
+            .values_list("question_id", flat=True)
+        )
+        if len(question_ids) != len(set(question_ids)):
+            raise ValidationError("Question ids must not repeat.")
+        if set(question_ids) != current:
+            raise ValidationError(
+                "Question ids must match the questions of this trivia."
+            )
+
+        orders = {
+            question_id: position
+            for position, question_id in enumerate(question_ids, start=1)
+        }
+        return TriviaQuestionService.sync(trivia, orders)["reordered"]
@@ -0,0 +1,49 @@
+# apps/trivias/services/trivia_version_service.py
+import uuid
+
+from django.core.cache import cache
+
+
+class TriviaVersionService:
+    """
+    Per-trivia content version tokens kept in the shared cache.
+
+    Every cached derivative of a trivia (answer key, detail payload) is
+    stored together with the token it was built from. Bumping the token
+    orphans all of them at once, and a writer that raced an invalidation
+    can only ever store data tagged with the old token.
+    """
+
+    @staticmethod
+    def key(trivia_id) -> str:
+        return f"trivia:{trivia_id}:version"
+
+    @staticmethod
+    def peek(trivia_id):
+        """
+        Returns the current token without creating one (None if missing).
+        """
+        return cache.get(TriviaVersionService.key(trivia_id))
+
+    @staticmethod
+    def get(trivia_id) -> str:
+        """
+        Returns the current token, creating one if missing or evicted.
+        Tokens never expire: only mint them for trivias known to exist.
+        """
+        version_key = TriviaVersionService.key(trivia_id)
+        version = cache.get(version_key)
+        if version is None:
+            cache.add(version_key, uuid.uuid4().hex, None)
+            version = cache.get(version_key)
+        return version
+
+    @staticmethod
+    def bump(*trivia_ids) -> None:
+        cache.set_many(
+            {
+                TriviaVersionService.key(trivia_id): uuid.uuid4().hex
+                for trivia_id in trivia_ids
+            },
+            None,
+        )
@@ -0,0 +1,109 @@
+# apps/trivias/signals.py
+"""
+Signal receivers keeping derived read models (leaderboards, answer keys,
+cached trivia payloads) in sync with the relational source of truth.
+"""
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import Signal, receiver
+
+from apps.questions.models.choice import Choice
+from apps.questions.models.question import Question
+
+from .models.participation import Participation
+from .models.trivia import Trivia
+from .models.trivia_question import TriviaQuestion
+from .services.answer_key_service import AnswerKeyService
+from .services.leaderboard_service import LeaderboardService
+from .services.trivia_detail_cache_service import TriviaDetailCacheService
+from .services.trivia_version_service import TriviaVersionService
+
+# Sent after bulk writes to TriviaQuestion, which bypass post_save.
+# Arguments: trivia_id.
+trivia_questions_changed = Signal()
+
+
+def _bump_trivia_versions(trivia_ids):
+    """
+    Invalidates right away (so this process sees its own writes) and again
+    after commit, so no worker can re-cache pre-commit data.
+    """
+    trivia_ids = list(trivia_ids)
+    if not trivia_ids:
+        return
+
+    def bump():
+        TriviaVersionService.bump(*trivia_ids)
+        AnswerKeyService.invalidate(*trivia_ids)
+        TriviaDetailCacheService.invalidate(*trivia_ids)
+
+    bump()
+    transaction.on_commit(bump)
+
+
+def _trivia_ids_for_question(question_id):
+    return TriviaQuestion.objects.filter(question_id=question_id).values_list(
+        "trivia_id", flat=True
+    )
+
+
+@receiver(post_save, sender=Trivia)
+def init_trivia_leaderboard(sender, instance, created, **kwargs):
+    """A brand-new trivia has an exact (empty) leaderboard."""
+    if created:
+        transaction.on_commit(lambda: LeaderboardService.mark_ready(instance.id))
+
+
+@receiver(post_save, sender=Trivia)
+@receiver(post_delete, sender=Trivia)
+def bump_version_on_trivia_change(sender, instance, **kwargs):
+    _bump_trivia_versions([instance.id])
+
+
+@receiver(post_delete, sender=Trivia)
+def drop_trivia_leaderboard(sender, instance, **kwargs):
+    transaction.on_commit(lambda: LeaderboardService.drop(instance.id))
+
+
+@receiver(post_save, sender=Participation)
+def sync_participation_leaderboard(sender, instance, created, **kwargs):
+    """
+    Finishing a session and admin edits of score, end time or duration
+    reach the board; the row is re-read on commit, as saves with
+    update_fields may carry a stale total_score.
+    """
+    if created and not instance.is_finished:
+        return
+    transaction.on_commit(
+        lambda: LeaderboardService.sync(instance.trivia_id, instance.id)
+    )
+
+
+@receiver(post_delete, sender=Participation)
+def remove_participation_from_leaderboard(sender, instance, **kwargs):
+    transaction.on_commit(
+        lambda: LeaderboardService.remove(instance.trivia_id, instance.id)
+    )
+
+
+@receiver(post_save, sender=TriviaQuestion)
+@receiver(post_delete, sender=TriviaQuestion)
+def bump_version_on_membership_change(sender, instance, **kwargs):
+    _bump_trivia_versions([instance.trivia_id])
+
+
+@receiver(trivia_questions_changed)
+def bump_version_on_bulk_membership_change(sender, trivia_id, **kwargs):
+    _bump_trivia_versions([trivia_id])
+
+
+@receiver(post_save, sender=Question)
+def bump_version_on_question_change(sender, instance, created, **kwargs):
+    if not created:
+        _bump_trivia_versions(_trivia_ids_for_question(instance.id))
+
+
+@receiver(post_save, sender=Choice)
+@receiver(post_delete, sender=Choice)
+def bump_version_on_choice_change(sender, instance, **kwargs):
+    _bump_trivia_versions(_trivia_ids_for_question(instance.question_id))
@@ -5,7 +5,9 @@ Provides reusable Trivia, Participation,
 and UserAnswer instances for testing game logic.
 """
 import pytest
+from django.core.cache import cache
 
+from apps.core.tiered_cache import clear_local_tiers
 from apps.trivias.tests.factories import (
     ParticipationFactory,
     TriviaFactory,
@@ -48,3 +50,19 @@ def user_answer(participation):
     Expected: A UserAnswer object with an associated question and choice.
     """
     return UserAnswerFactory(participation=participation)
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(settings):
+    """
+    Runs each test against a private in-memory cache and empty local
+    tiers, so cached answer keys and payloads never leak between tests (SQLite reuses
+    primary keys after rollback).
+    """
+    settings.CACHES = {
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+    }
+    clear_local_tiers()
+    cache.clear()
+    yield
+    clear_local_tiers()
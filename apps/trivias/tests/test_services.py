@@ -1,12 +1,41 @@
 # apps/trivias/tests/test_services.py
+import io
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
 import pytest
 from django.core.exceptions import ValidationError
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from prometheus_client import REGISTRY
+from redis.exceptions import RedisError
 
+from apps.core import metrics
 from apps.questions.enums.difficulty_level import DifficultyLevel
 from apps.questions.tests.factories import ChoiceFactory, QuestionFactory
+from apps.trivias import signals
+from apps.trivias.models.participation import Participation
 from apps.trivias.models.trivia_question import TriviaQuestion
 from apps.trivias.models.user_answer import UserAnswer
+from apps.trivias.serializers.ranking_serializer import RankingSerializer
+from apps.trivias.services import leaderboard_service
+from apps.trivias.services.answer_key_service import AnswerKeyService
+from apps.trivias.services.export_service import ExportService
+from apps.trivias.services.leaderboard_service import LeaderboardService
 from apps.trivias.services.participation_service import ParticipationService
+from apps.trivias.services.trivia_detail_cache_service import (
+    TriviaDetailCacheService,
+)
+from apps.trivias.services.trivia_question_service import TriviaQuestionService
+from apps.trivias.tests.factories import (
+    ParticipationFactory,
+    TriviaFactory,
+    UserAnswerFactory,
+)
 
 
 @pytest.mark.django_db
@@ -28,13 +57,42 @@ class TestParticipationService:
         choice = ChoiceFactory(question=question, is_correct=True)
 
         user_answer = service.submit_answer(
-            participation=participation, question=question, chosen_choice=choice
+            participation=participation, question_id=question.id, choice_id=choice.id
         )
 
         assert isinstance(user_answer, UserAnswer)
         assert user_answer.is_correct is True
         assert participation.total_score == 3
 
+    def test_submit_answer_records_metrics_on_commit(
+        self, participation, django_capture_on_commit_callbacks
+    ):
+        """
+        Test that accepted answers feed the Prometheus counters.
+        Expected: One more single-mode submission and one more correct outcome.
+        """
+        question = QuestionFactory()
+        TriviaQuestion.objects.create(
+            trivia=participation.trivia, question=question, order=1
+        )
+        choice = ChoiceFactory(question=question, is_correct=True)
+
+        def sample(name, **labels):
+            return REGISTRY.get_sample_value(name, labels) or 0
+
+        submitted = sample("trivia_answers_submitted_total", mode="single")
+        correct = sample("trivia_answer_outcomes_total", outcome="correct")
+
+        with django_capture_on_commit_callbacks(execute=True):
+            ParticipationService.submit_answer(
+                participation=participation,
+                question_id=question.id,
+                choice_id=choice.id,
+            )
+
+        assert sample("trivia_answers_submitted_total", mode="single") == submitted + 1
+        assert sample("trivia_answer_outcomes_total", outcome="correct") == correct + 1
+
     def test_submit_answer_invalid_question(self, participation):
         """
         Test that the service prevents answering a question not belonging
@@ -47,7 +105,7 @@ class TestParticipationService:
         choice = ChoiceFactory(question=question)
 
         with pytest.raises(ValidationError) as exc:
-            service.submit_answer(participation, question, choice)
+            service.submit_answer(participation, question.id, choice.id)
 
         assert "Question does not belong to this trivia" in str(exc.value)
 
@@ -66,7 +124,7 @@ class TestParticipationService:
         other_choice = ChoiceFactory()
 
         with pytest.raises(ValidationError) as exc:
-            service.submit_answer(participation, question, other_choice)
+            service.submit_answer(participation, question.id, other_choice.id)
 
         assert "Invalid choice for this question" in str(exc.value)
 
@@ -82,13 +140,129 @@ class TestParticipationService:
         )
         choice = ChoiceFactory(question=question)
 
-        service.submit_answer(participation, question, choice)
+        service.submit_answer(participation, question.id, choice.id)
 
         with pytest.raises(ValidationError) as exc:
-            service.submit_answer(participation, question, choice)
+            service.submit_answer(participation, question.id, choice.id)
 
         assert "Question already answered" in str(exc.value)
 
+    def test_duplicate_answer_leaves_enclosing_transaction_usable(self, participation):
+        """
+        Test that a caller in an enclosing transaction (the test's own) can
+        catch a duplicate and carry on.
+        Expected: The next answer is stored and earlier work is kept.
+        """
+        first, second = QuestionFactory.create_batch(
+            2, difficulty=DifficultyLevel.MEDIUM
+        )
+        for order, question in enumerate((first, second), start=1):
+            TriviaQuestion.objects.create(
+                trivia=participation.trivia, question=question, order=order
+            )
+        first_choice = ChoiceFactory(question=first, is_correct=True)
+        second_choice = ChoiceFactory(question=second, is_correct=True)
+        ParticipationService.submit_answer(participation, first.id, first_choice.id)
+
+        with pytest.raises(ValidationError):
+            ParticipationService.submit_answer(participation, first.id, first_choice.id)
+        ParticipationService.submit_answer(participation, second.id, second_choice.id)
+
+        participation.refresh_from_db()
+        assert participation.answers.count() == 2
+        assert participation.total_score == 2 * 2
+
+    def test_submit_answer_query_budget(self, participation):
+        """
+        Test that, with a warm answer key, a correct answer is validated
+        and scored with a fixed number of statements.
+        Expected: One INSERT and one UPDATE (savepoints excluded).
+        """
+        question = QuestionFactory(difficulty=DifficultyLevel.MEDIUM)
+        TriviaQuestion.objects.create(
+            trivia=participation.trivia, question=question, order=1
+        )
+        choice = ChoiceFactory(question=question, is_correct=True)
+        AnswerKeyService.get(participation.trivia_id)
+
+        with CaptureQueriesContext(connection) as ctx:
+            ParticipationService.submit_answer(participation, question.id, choice.id)
+
+        statements = [
+            q["sql"]
+            for q in ctx.captured_queries
+            if not q["sql"].upper().startswith(("SAVEPOINT", "RELEASE"))
+        ]
+        assert len(statements) == 2
+        assert participation.total_score == 2
+
+    def test_submit_answers_scores_batch_and_finishes(self, participation):
+        """
+        Test that a batch of answers is stored and scored in one pass.
+        Expected: All answers saved, points summed and the session closed.
+        """
+        answers = []
+        for order, difficulty in enumerate(["EASY", "MEDIUM", "HARD"]):
+            question = QuestionFactory(difficulty=difficulty)
+            TriviaQuestion.objects.create(
+                trivia=participation.trivia, question=question, order=order
+            )
+            choice = ChoiceFactory(question=question, is_correct=difficulty != "EASY")
+            answers.append((question.id, choice.id))
+
+        user_answers = ParticipationService.submit_answers(
+            participation, answers, finish=True
+        )
+        participation.refresh_from_db()
+
+        assert len(user_answers) == 3
+        assert UserAnswer.objects.filter(participation=participation).count() == 3
+        assert participation.total_score == 5
+        assert participation.is_finished is True
+        assert participation.duration is not None
+
+    def test_submit_answers_finish_reads_back_concurrent_points(self, participation):
+        """
+        Test that finishing re-reads the score another request committed
+        after this copy of the participation was loaded.
+        Expected: The in-memory total (recorded on the leaderboard) matches
+        the database.
+        """
+        question = QuestionFactory(difficulty="HARD")
+        TriviaQuestion.objects.create(
+            trivia=participation.trivia, question=question, order=1
+        )
+        choice = ChoiceFactory(question=question, is_correct=True)
+        Participation.objects.filter(pk=participation.pk).update(total_score=2)
+
+        ParticipationService.submit_answers(
+            participation, [(question.id, choice.id)], finish=True
+        )
+
+        assert participation.total_score == 5
+
+    def test_submit_answers_is_all_or_nothing(self, participation):
+        """
+        Test that one invalid pair rejects the whole batch.
+        Expected: Raises ValidationError and no answer is stored.
+        """
+        valid, invalid = QuestionFactory.create_batch(2)
+        for order, question in enumerate([valid, invalid]):
+            TriviaQuestion.objects.create(
+                trivia=participation.trivia, question=question, order=order
+            )
+        choice = ChoiceFactory(question=valid, is_correct=True)
+        foreign_choice = ChoiceFactory()
+
+        with pytest.raises(ValidationError) as exc:
+            ParticipationService.submit_answers(
+                participation,
+                [(valid.id, choice.id), (invalid.id, foreign_choice.id)],
+            )
+
+        assert "Invalid choice" in str(exc.value)
+        assert not UserAnswer.objects.filter(participation=participation).exists()
+
     def test_finish_participation_sets_end_time(self, participation):
         """
         Test that finishing a participation records the end time correctly.
@@ -102,3 +276,518 @@ class TestParticipationService:
 
         assert finished_p.end_time is not None
         assert finished_p.is_finished is True
+
+    def test_finish_participation_persists_duration(self, participation):
+        """
+        Test that finishing a participation materializes its duration.
+        Expected: duration equals end_time - start_time and is stored in the DB.
+        """
+        finished_p = ParticipationService.finish_participation(participation)
+        finished_p.refresh_from_db()
+
+        assert finished_p.duration == finished_p.end_time - finished_p.start_time
+
+    def test_get_ranking_breaks_ties_by_duration(self, trivia):
+        """
+        Test that the ranking orders by score and then by persisted duration.
+        Expected: Equal scores are ordered fastest first.
+        """
+        end = timezone.now()
+        slow = ParticipationFactory(
+            trivia=trivia,
+            total_score=5,
+            start_time=end - timedelta(minutes=9),
+            end_time=end,
+        )
+        fast = ParticipationFactory(
+            trivia=trivia,
+            total_score=5,
+            start_time=end - timedelta(minutes=2),
+            end_time=end,
+        )
+        best = ParticipationFactory(
+            trivia=trivia,
+            total_score=8,
+            start_time=end - timedelta(minutes=30),
+            end_time=end,
+        )
+
+        ranking = list(ParticipationService.get_ranking(trivia_id=trivia.id))
+
+        assert ranking == [best, fast, slow]
+
+
+@pytest.fixture
+def redis_board(monkeypatch):
+    """
+    Serves leaderboards from an in-memory Redis (with Lua support).
+    """
+    fakeredis = pytest.importorskip("fakeredis")
+    pytest.importorskip("lupa")
+    client = fakeredis.FakeRedis()
+    monkeypatch.setattr(leaderboard_service, "get_redis_client", lambda: client)
+    monkeypatch.setattr(leaderboard_service, "_scripts", {})
+    return client
+
+
+@pytest.mark.django_db
+class TestLeaderboardService:
+    """Tests for the Redis leaderboard encoding and cold-cache behaviour."""
+
+    def test_members_order_by_duration_then_id(self):
+        """
+        Test that members encode the SQL tie-breakers.
+        Expected: On equal scores the faster run, then the lower id, is the
+        higher member (ZREVRANGE returns it first).
+        """
+        encode = LeaderboardService.encode_member
+        fast = encode(7, timedelta(seconds=30, microseconds=1))
+        faster = encode(9, timedelta(seconds=30))
+        same_time_lower_id = encode(8, timedelta(seconds=30))
+
+        assert faster > fast
+        assert same_time_lower_id > faster
+        assert LeaderboardService.decode_member(fast.encode()) == 7
+
+    def test_get_top_is_cold_without_redis(self, trivia):
+        """
+        Test that a non-Redis cache backend is treated as a cold leaderboard.
+        Expected: None, signalling callers to fall back to SQL.
+        """
+        assert LeaderboardService.get_top(trivia.id) is None
+
+    def test_board_matches_sql_ranking(self, trivia, redis_board):
+        """
+        Test that the warm board ranks exactly like the SQL fallback,
+        including sub-millisecond and exact ties.
+        Expected: Same order from get_top and get_ranking; same rank from
+        get_around and get_rank_window.
+        """
+        end = timezone.now()
+        durations = [
+            timedelta(seconds=5, microseconds=900),
+            timedelta(seconds=5, microseconds=100),
+            timedelta(seconds=5),
+            timedelta(seconds=5),
+            timedelta(seconds=1),
+        ]
+        participations = [
+            ParticipationFactory(
+                trivia=trivia,
+                total_score=3,
+                start_time=end - duration,
+                end_time=end,
+            )
+            for duration in durations
+        ]
+        ParticipationFactory(trivia=trivia, total_score=1, end_time=end)
+
+        LeaderboardService.rebuild(trivia.id)
+
+        expected = RankingSerializer(
+            ParticipationService.get_ranking(trivia_id=trivia.id), many=True
+        ).data
+        assert LeaderboardService.get_top(trivia.id) == json.loads(json.dumps(expected))
+
+        target = participations[2]
+        standing = LeaderboardService.get_around(trivia.id, target.id, window=1)
+        rank, total, _, _ = ParticipationService.get_rank_window(target, 1)
+        assert (standing["rank"], standing["total"]) == (rank, total) == (2, 6)
+        assert len(standing["entries"]) == 3
+
+    def test_empty_ready_board_is_warm(self, trivia, redis_board):
+        """
+        Test that a ready board without finished participations is served.
+        Expected: An empty list rather than None.
+        """
+        LeaderboardService.mark_ready(trivia.id)
+
+        assert LeaderboardService.get_top(trivia.id) == []
+
+    def test_evicted_board_is_cold(self, finished_board, redis_board):
+        """
+        Test that losing the sorted set also loses the ready flag.
+        Expected: None, so the SQL ranking answers.
+        """
+        redis_board.delete(LeaderboardService._key(finished_board.trivia_id))
+
+        assert LeaderboardService.get_top(finished_board.trivia_id) is None
+
+    def test_failed_record_drops_board(self, finished_board, redis_board, monkeypatch):
+        """
+        Test that a board missing a write is not served anymore.
+        Expected: get_top returns None after a failed record.
+        """
+
+        def fail(*args, **kwargs):
+            raise RedisError("down")
+
+        monkeypatch.setattr(leaderboard_service, "_run", fail)
+        LeaderboardService.record(finished_board)
+
+        assert LeaderboardService.get_top(finished_board.trivia_id) is None
+
+    def test_cold_read_schedules_one_rebuild(self, trivia, redis_board, monkeypatch):
+        """
+        Test that SQL fallbacks are counted and start a background rebuild,
+        once per REBUILD_INTERVAL however many reads fall back.
+        Expected: One rebuild for two cold reads; both counted.
+        """
+        rebuilt = threading.Event()
+        calls = []
+
+        def rebuild(trivia_id):
+            calls.append(trivia_id)
+            rebuilt.set()
+
+        monkeypatch.setattr(LeaderboardService, "rebuild", rebuild)
+        fallbacks = metrics.LEADERBOARD_FALLBACKS.labels("top")
+        before = fallbacks._value.get()
+
+        assert LeaderboardService.report_cold(trivia.id, "top") is True
+        assert LeaderboardService.report_cold(trivia.id, "top") is False
+
+        assert rebuilt.wait(5)
+        assert calls == [trivia.id]
+        assert fallbacks._value.get() == before + 2
+
+    def test_writes_during_rebuild_survive_the_swap(
+        self, trivia, redis_board, monkeypatch
+    ):
+        """
+        Test records and removals racing a rebuild's scan.
+        Expected: The late finisher is on the rebuilt board and the row
+        deleted mid-scan is not resurrected.
+        """
+        end = timezone.now()
+        deleted = ParticipationFactory(trivia=trivia, total_score=5, end_time=end)
+        late = ParticipationFactory(trivia=trivia, total_score=9)
+        fields = LeaderboardService._fields
+
+        def racing_fields(participation):
+            # Runs mid-scan, after the row was read but before it is written
+            monkeypatch.setattr(LeaderboardService, "_fields", fields)
+            late.end_time = end
+            LeaderboardService.record(late)
+            LeaderboardService.remove(trivia.id, deleted.id)
+            return fields(participation)
+
+        monkeypatch.setattr(LeaderboardService, "_fields", racing_fields)
+        LeaderboardService.rebuild(trivia.id)
+
+        top = LeaderboardService.get_top(trivia.id)
+        assert [row["total_score"] for row in top] == [9]
+
+    def test_admin_edit_reaches_the_board(
+        self, finished_board, redis_board, django_capture_on_commit_callbacks
+    ):
+        """
+        Test that saving a finished participation re-syncs it.
+        Expected: The edited score is served, and reopening removes it.
+        """
+        with django_capture_on_commit_callbacks(execute=True):
+            finished_board.total_score = 42
+            finished_board.save()
+        assert (
+            LeaderboardService.get_top(finished_board.trivia_id)[0]["total_score"] == 42
+        )
+
+        with django_capture_on_commit_callbacks(execute=True):
+            finished_board.end_time = None
+            finished_board.save()
+        assert LeaderboardService.get_top(finished_board.trivia_id) == []
+
+
+@pytest.fixture
+def finished_board(trivia, redis_board):
+    """A finished participation on a freshly rebuilt board."""
+    participation = ParticipationFactory(
+        trivia=trivia, total_score=4, end_time=timezone.now()
+    )
+    LeaderboardService.rebuild(trivia.id)
+    return participation
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.skipif(
+    connection.vendor != "postgresql",
+    reason="Needs a database with real row-level concurrency.",
+)
+class TestParticipationServiceConcurrency:
+    """Hammers one participation from a thread pool to detect lost updates."""
+
+    @staticmethod
+    def _submit(participation_id, question, choice):
+        try:
+            # Every thread works on its own (stale) copy of the row
+            participation = Participation.objects.get(pk=participation_id)
+            ParticipationService.submit_answer(participation, question.id, choice.id)
+            return True
+        except ValidationError:
+            return False
+        finally:
+            connection.close()
+
+    def test_concurrent_correct_answers_do_not_lose_points(self):
+        """
+        Test that parallel correct answers to different questions all count.
+        Expected: The final score is the sum of every question's points.
+        """
+        trivia = TriviaFactory()
+        participation = ParticipationFactory(trivia=trivia)
+        answers = []
+        for order in range(20):
+            question = QuestionFactory(difficulty=DifficultyLevel.MEDIUM)
+            TriviaQuestion.objects.create(trivia=trivia, question=question, order=order)
+            answers.append(
+                (question, ChoiceFactory(question=question, is_correct=True))
+            )
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(
+                pool.map(lambda qa: self._submit(participation.id, *qa), answers)
+            )
+
+        participation.refresh_from_db()
+        assert all(results)
+        assert participation.total_score == 20 * 2
+
+    def test_concurrent_duplicate_answers_score_once(self):
+        """
+        Test that the same answer submitted in parallel is accepted only once.
+        Expected: Exactly one submission succeeds and points are added once.
+        """
+        trivia = TriviaFactory()
+        participation = ParticipationFactory(trivia=trivia)
+        question = QuestionFactory(difficulty=DifficultyLevel.HARD)
+        TriviaQuestion.objects.create(trivia=trivia, question=question, order=1)
+        choice = ChoiceFactory(question=question, is_correct=True)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(
+                pool.map(
+                    lambda _: self._submit(participation.id, question, choice),
+                    range(16),
+                )
+            )
+
+        participation.refresh_from_db()
+        assert results.count(True) == 1
+        assert participation.total_score == 3
+        assert UserAnswer.objects.filter(participation=participation).count() == 1
+
+
+@pytest.mark.django_db
+class TestAnswerKeyService:
+    """Tests for the cached per-trivia answer key."""
+
+    def test_answer_key_maps_questions_and_choices(self, trivia):
+        """
+        Test that the answer key captures correctness, points and membership.
+        Expected: Correct choice and HARD points per question, choice ownership.
+        """
+        question = QuestionFactory(difficulty=DifficultyLevel.HARD)
+        TriviaQuestion.objects.create(trivia=trivia, question=question, order=1)
+        wrong = ChoiceFactory(question=question, is_correct=False)
+        right = ChoiceFactory(question=question, is_correct=True)
+
+        answer_key = AnswerKeyService.get(trivia.id)
+
+        assert question.id in answer_key
+        assert answer_key.grade(question.id, right.id) == (True, 3)
+        assert answer_key.grade(question.id, wrong.id) == (False, 0)
+        assert answer_key.choices[wrong.id] == question.id
+
+    def test_answer_key_is_served_from_memory(self, trivia):
+        """
+        Test that a warm answer key needs no database access.
+        Expected: Zero queries on the second lookup.
+        """
+        AnswerKeyService.get(trivia.id)
+
+        with CaptureQueriesContext(connection) as ctx:
+            AnswerKeyService.get(trivia.id)
+
+        assert len(ctx.captured_queries) == 0
+
+    def test_answer_key_invalidated_when_correct_choice_changes(self, trivia):
+        """
+        Test that editing Choice.is_correct invalidates the cached key.
+        Expected: The next lookup grades against the new correct choice.
+        """
+        question = QuestionFactory()
+        TriviaQuestion.objects.create(trivia=trivia, question=question, order=1)
+        old = ChoiceFactory(question=question, is_correct=True)
+        new = ChoiceFactory(question=question, is_correct=False)
+        assert AnswerKeyService.get(trivia.id).grade(question.id, old.id)[0] is True
+
+        old.is_correct = False
+        old.save()
+        new.is_correct = True
+        new.save()
+
+        assert AnswerKeyService.get(trivia.id).grade(question.id, new.id)[0] is True
+
+
+@pytest.mark.django_db
+class TestTriviaDetailCacheService:
+    """Tests for the versioned trivia detail payload cache."""
+
+    def test_payload_is_rebuilt_after_version_bump(self, trivia):
+        """
+        Test that a stored payload is only served for the version it was
+        built from, and that hits and misses are counted.
+        Expected: build runs on the first lookup and again after an edit.
+        """
+        builds = []
+
+        def build():
+            builds.append(1)
+            return b"{}"
+
+        before = TriviaDetailCacheService.stats()
+        TriviaDetailCacheService.get_or_build(trivia.id, build)
+        _, _, hit = TriviaDetailCacheService.get_or_build(trivia.id, build)
+        assert hit is True
+
+        trivia.name = "Renamed"
+        trivia.save()
+        _, _, hit = TriviaDetailCacheService.get_or_build(trivia.id, build)
+
+        after = TriviaDetailCacheService.stats()
+        assert hit is False
+        assert len(builds) == 2
+        assert after["hits"] - before["hits"] == 1
+        assert after["misses"] - before["misses"] == 2
+
+
+@pytest.mark.django_db
+class TestTriviaQuestionService:
+    """Tests for the diff-based question set maintenance."""
+
+    def test_sync_applies_only_the_diff(self, trivia):
+        """
+        Test that syncing creates, deletes and reorders only what changed.
+        Expected: Untouched rows keep their primary key.
+        """
+        kept, moved, dropped, added = QuestionFactory.create_batch(4)
+        TriviaQuestionService.sync(trivia, {kept.id: 1, moved.id: 2, dropped.id: 3})
+        kept_row_id = TriviaQuestion.objects.get(trivia=trivia, question=kept).id
+
+        result = TriviaQuestionService.sync(
+            trivia, {kept.id: 1, moved.id: 3, added.id: 2}
+        )
+
+        assert result == {"created": 1, "deleted": 1, "reordered": 1}
+        rows = TriviaQuestion.objects.filter(trivia=trivia).order_by("order")
+        assert [row.question_id for row in rows] == [kept.id, added.id, moved.id]
+        assert TriviaQuestion.objects.get(trivia=trivia, question=kept).id == (
+            kept_row_id
+        )
+
+    def test_reorder_query_count_is_constant(self, trivia):
+        """
+        Test that moving one question in a large trivia is a bounded number
+        of statements.
+        Expected: At most a select, the bulk update and savepoint handling.
+        """
+        questions = QuestionFactory.create_batch(50)
+        TriviaQuestionService.sync(
+            trivia, {q.id: order for order, q in enumerate(questions, start=1)}
+        )
+        new_order = [q.id for q in questions]
+        new_order[0], new_order[1] = new_order[1], new_order[0]
+
+        with CaptureQueriesContext(connection) as ctx:
+            reordered = TriviaQuestionService.reorder(trivia, new_order)
+
+        statements = [
+            q["sql"]
+            for q in ctx.captured_queries
+            if not q["sql"].startswith(("SAVEPOINT", "RELEASE"))
+        ]
+        assert reordered == 2
+        assert len(statements) <= 3
+
+    def test_sync_deletes_without_per_row_signals(self, trivia, monkeypatch):
+        """
+        Test that dropping many questions invalidates the trivia once.
+        Expected: One version bump and one DELETE for three removed rows.
+        """
+        questions = QuestionFactory.create_batch(4)
+        TriviaQuestionService.sync(
+            trivia, {q.id: order for order, q in enumerate(questions, start=1)}
+        )
+        bumps = []
+        monkeypatch.setattr(signals, "_bump_trivia_versions", bumps.append)
+
+        with CaptureQueriesContext(connection) as ctx:
+            result = TriviaQuestionService.sync(trivia, {questions[0].id: 1})
+
+        deletes = [q for q in ctx.captured_queries if q["sql"].startswith("DELETE")]
+        assert result == {"created": 0, "deleted": 3, "reordered": 0}
+        assert bumps == [[trivia.id]]
+        assert len(deletes) == 1
+        assert TriviaQuestion.objects.filter(trivia=trivia).count() == 1
+
+    def test_reorder_rejects_foreign_question_ids(self, trivia):
+        """
+        Test that reorder requires a permutation of the current questions.
+        Expected: ValidationError when an id does not belong to the trivia.
+        """
+        question = QuestionFactory()
+        TriviaQuestionService.sync(trivia, {question.id: 1})
+
+        with pytest.raises(ValidationError, match="must match"):
+            TriviaQuestionService.reorder(trivia, [question.id, question.id + 1000])
+
+
+@pytest.mark.django_db
+class TestExportService:
+    """Tests for the streaming export."""
+
+    def test_stream_chunks_rows_and_filters_by_date(self):
+        """
+        Test that the export is produced in chunks and honours the range.
+        Expected: Header chunk plus row chunks of chunk_size; rows created
+        before 'since' are excluded.
+        """
+        old = ParticipationFactory()
+        Participation.objects.filter(pk=old.pk).update(
+            created_at=timezone.now() - timedelta(days=10)
+        )
+        ParticipationFactory.create_batch(3)
+
+        chunks = list(
+            ExportService.stream(
+                "participations",
+                chunk_size=2,
+                since=timezone.now() - timedelta(days=1),
+            )
+        )
+
+        assert chunks[0].startswith("id,trivia_id")
+        assert [chunk.count("\n") for chunk in chunks[1:]] == [2, 1]
+        assert f"\n{old.id}," not in "".join(chunks)
+
+    def test_export_results_command_writes_jsonl(self, tmp_path):
+        """
+        Test the export command writing answers of one trivia to a file.
+        Expected: One JSON line per answer of that trivia.
+        """
+        answer = UserAnswerFactory()
+        UserAnswerFactory()
+        output = tmp_path / "answers.jsonl"
+
+        call_command(
+            "export_results",
+            "answers",
+            trivia_id=answer.participation.trivia_id,
+            file_format="jsonl",
+            output=str(output),
+            stderr=io.StringIO(),
+        )
+
+        lines = output.read_text().splitlines()
+        assert len(lines) == 1
+        assert json.loads(lines[0])["id"] == answer.id
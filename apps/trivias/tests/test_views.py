@@ -3,15 +3,26 @@
 Integration tests for Trivia and Participation views.
 Verifies participation creation flow and data integrity.
 """
+import json
+from datetime import timedelta
+
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from django.utils import timezone
 from rest_framework import status
 from rest_framework.test import APIClient
 
 from apps.questions.tests.factories import ChoiceFactory, QuestionFactory
 from apps.trivias.models.trivia_question import TriviaQuestion
 from apps.trivias.models.user_answer import UserAnswer
-from apps.trivias.tests.factories import ParticipationFactory, TriviaFactory
+from apps.trivias.services.trivia_version_service import TriviaVersionService
+from apps.trivias.tests.factories import (
+    ParticipationFactory,
+    TriviaFactory,
+    UserAnswerFactory,
+)
 
 
 @pytest.mark.django_db
@@ -115,3 +126,404 @@ class TestTriviaViews:
         response = client.post(url, data, format="json")
 
         assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_ranking_falls_back_to_sql_when_leaderboard_is_cold(self, user):
+        """
+        Test that the ranking endpoint answers from the database when the
+        Redis leaderboard is not available.
+        Expected: 200 OK with finished participations ordered by score.
+        """
+        trivia = TriviaFactory()
+        finished = timezone.now()
+        ParticipationFactory(trivia=trivia, total_score=2, end_time=finished)
+        ParticipationFactory(trivia=trivia, total_score=5, end_time=finished)
+        ParticipationFactory(trivia=trivia, total_score=9)
+
+        client = APIClient()
+        client.force_authenticate(user=user)
+
+        url = reverse("v1:trivia-ranking", kwargs={"trivia_id": trivia.id})
+        response = client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [row["total_score"] for row in response.data] == [5, 2]
+
+    def test_my_ranking_returns_rank_percentile_and_neighbours(self, user):
+        """
+        Test that a player gets their own standing with a window of neighbours.
+        Expected: 200 OK with rank 3 of 5, percentile 60 and ranks 2..4.
+        """
+        trivia = TriviaFactory()
+        finished = timezone.now()
+        for score in (9, 7, 3, 1):
+            ParticipationFactory(trivia=trivia, total_score=score, end_time=finished)
+        ParticipationFactory(user=user, trivia=trivia, total_score=5, end_time=finished)
+
+        client = APIClient()
+        client.force_authenticate(user=user)
+
+        url = reverse("v1:trivia-ranking-me", kwargs={"trivia_id": trivia.id})
+        response = client.get(url, {"window": 1})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["rank"] == 3
+        assert response.data["total"] == 5
+        assert response.data["percentile"] == 60.0
+        assert [row["rank"] for row in response.data["entries"]] == [2, 3, 4]
+        assert [row["total_score"] for row in response.data["entries"]] == [7, 5, 3]
+
+    def test_my_ranking_requires_finished_participation(self, participation):
+        """
+        Test that players who have not finished the trivia get no standing.
+        Expected: 404 Not Found.
+        """
+        client = APIClient()
+        client.force_authenticate(user=participation.user)
+
+        url = reverse(
+            "v1:trivia-ranking-me", kwargs={"trivia_id": participation.trivia_id}
+        )
+        response = client.get(url)
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_participation_submit_answer_action(self, user):
+        """
+        Test that the participation submit-answer action scores by ids and
+        rejects a second answer to the same question.
+        Expected: 201 Created first, then 400 Bad Request.
+        """
+        trivia = TriviaFactory()
+        question = QuestionFactory(difficulty="MEDIUM")
+        choice = ChoiceFactory(question=question, is_correct=True)
+        TriviaQuestion.objects.create(trivia=trivia, question=question, order=1)
+        participation = ParticipationFactory(user=user, trivia=trivia)
+
+        client = APIClient()
+        client.force_authenticate(user=user)
+        url = reverse("v1:participation-submit-answer", kwargs={"pk": participation.id})
+        data = {"question_id": question.id, "choice_id": choice.id}
+
+        first = client.post(url, data, format="json")
+        second = client.post(url, data, format="json")
+
+        participation.refresh_from_db()
+        assert first.status_code == status.HTTP_201_CREATED
+        assert second.status_code == status.HTTP_400_BAD_REQUEST
+        assert participation.total_score == 2
+
+    def test_participation_submit_answers_batch(self, user):
+        """
+        Test that a client can submit every answer and finish in one request.
+        Expected: 201 Created with the answered count and the final score.
+        """
+        trivia = TriviaFactory()
+        participation = ParticipationFactory(user=user, trivia=trivia)
+        answers = []
+        for order in range(3):
+            question = QuestionFactory(difficulty="HARD")
+            choice = ChoiceFactory(question=question, is_correct=True)
+            TriviaQuestion.objects.create(trivia=trivia, question=question, order=order)
+            answers.append({"question_id": question.id, "choice_id": choice.id})
+
+        client = APIClient()
+        client.force_authenticate(user=user)
+        url = reverse(
+            "v1:participation-submit-answers", kwargs={"pk": participation.id}
+        )
+        response = client.post(url, {"answers": answers, "finish": True}, format="json")
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data["answered"] == 3
+        assert response.data["total_score"] == 9
+
+    def test_trivia_list_returns_summary(self, user):
+        """
+        Test that the list action returns annotated counters instead of
+        the nested question tree.
+        Expected: question_count and max_possible_score, no 'questions' key.
+        """
+        trivia = TriviaFactory()
+        for order, difficulty in enumerate(["EASY", "MEDIUM", "HARD", "HARD"]):
+            question = QuestionFactory(difficulty=difficulty)
+            TriviaQuestion.objects.create(trivia=trivia, question=question, order=order)
+        TriviaFactory()
+
+        client = APIClient()
+        client.force_authenticate(user=user)
+        response = client.get(reverse("v1:trivia-list"))
+
+        assert response.status_code == status.HTTP_200_OK
+        rows = {row["id"]: row for row in response.data["results"]}
+        assert "questions" not in rows[trivia.id]
+        assert rows[trivia.id]["question_count"] == 4
+        assert rows[trivia.id]["max_possible_score"] == 9
+
+    def test_list_endpoints_use_cursor_pagination(self, admin_user):
+        """
+        Test that list endpoints are keyset-paginated with a capped page size.
+        Expected: 'next' cursor and no 'count'; pages do not overlap and
+        page_size above the maximum is clamped.
+        """
+        participation = ParticipationFactory()
+        UserAnswerFactory.create_batch(3, participation=participation)
+
+        client = APIClient()
+        client.force_authenticate(user=admin_user)
+        url = reverse("v1:user-answer-list")
+
+        first = client.get(url, {"page_size": 2})
+        second = client.get(first.data["next"])
+        capped = client.get(url, {"page_size": 10_000})
+
+        assert "count" not in first.data
+        assert len(first.data["results"]) == 2
+        assert len(second.data["results"]) == 1
+        first_ids = {row["id"] for row in first.data["results"]}
+        assert first_ids.isdisjoint(row["id"] for row in second.data["results"])
+        assert capped.status_code == status.HTTP_200_OK
+
+    def test_trivia_detail_is_served_from_versioned_cache(self, user):
+        """
+        Test that the detail payload is cached and invalidated by content edits.
+        Expected: MISS then HIT with identical bytes; after a choice edit the
+        next request is a MISS carrying the new text.
+        """
+        trivia = TriviaFactory()
+        question = QuestionFactory()
+        choice = ChoiceFactory(question=question, text="Old text")
+        TriviaQuestion.objects.create(trivia=trivia, question=question, order=1)
+
+        client = APIClient()
+        client.force_authenticate(user=user)
+        url = reverse("v1:trivia-detail", args=[trivia.id])
+
+        first = client.get(url)
+        second = client.get(url)
+
+        assert first.status_code == status.HTTP_200_OK
+        assert first["X-Cache"] == "MISS"
+        assert second["X-Cache"] == "HIT"
+        assert second.content == first.content
+        assert "is_correct" not in first.content.decode()
+
+        choice.text = "New text"
+        choice.save()
+        third = client.get(url)
+
+        assert third["X-Cache"] == "MISS"
+        assert "New text" in third.content.decode()
+
+    def test_trivia_detail_unknown_id_returns_404(self, user):
+        """
+        Test that a cache miss for a missing trivia does not cache anything,
+        not even a content version.
+        Expected: 404 Not Found and no version key.
+        """
+        client = APIClient()
+        client.force_authenticate(user=user)
+
+        response = client.get(reverse("v1:trivia-detail", args=[999999]))
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert TriviaVersionService.peek(999999) is None
+
+    def test_trivia_detail_conditional_get(self, user):
+        """
+        Test that the trivia detail is validated by its content version.
+        Expected: 304 without body while unchanged, 200 after a rename.
+        """
+        trivia = TriviaFactory()
+        client = APIClient()
+        client.force_authenticate(user=user)
+        url = reverse("v1:trivia-detail", args=[trivia.id])
+
+        etag = client.get(url)["ETag"]
+        cached = client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert cached.status_code == status.HTTP_304_NOT_MODIFIED
+        assert not cached.content
+
+        trivia.name = "Renamed"
+        trivia.save()
+        refreshed = client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert refreshed.status_code == status.HTTP_200_OK
+        assert refreshed["ETag"] != etag
+
+    def test_trivia_detail_etag_matches_served_body(self, user):
+        """
+        Test that a body served from a worker's local tier after the
+        version moved on keeps the ETag of the version it was built from.
+        Expected: The old body with the old ETag, never the new ETag.
+        """
+        trivia = TriviaFactory()
+        client = APIClient()
+        client.force_authenticate(user=user)
+        url = reverse("v1:trivia-detail", args=[trivia.id])
+        first = client.get(url)
+
+        # Another worker's edit, whose invalidation has not arrived yet
+        TriviaVersionService.bump(trivia.id)
+        stale = client.get(url)
+
+        assert stale["X-Cache"] == "HIT"
+        assert stale.content == first.content
+        assert stale["ETag"] == first["ETag"]
+
+    def test_reorder_endpoint_updates_positions(self, admin_user):
+        """
+        Test that an admin can reorder questions with a list of ids, and that
+        the cached detail reflects the new order.
+        Expected: 200 OK with the number of moved rows; detail is a MISS.
+        """
+        trivia = TriviaFactory()
+        first, second = QuestionFactory.create_batch(2)
+        TriviaQuestion.objects.create(trivia=trivia, question=first, order=1)
+        TriviaQuestion.objects.create(trivia=trivia, question=second, order=2)
+
+        client = APIClient()
+        client.force_authenticate(user=admin_user)
+        detail_url = reverse("v1:trivia-detail", args=[trivia.id])
+        client.get(detail_url)
+
+        response = client.post(
+            reverse("v1:trivia-reorder", args=[trivia.id]),
+            {"question_ids": [second.id, first.id]},
+            format="json",
+        )
+        detail = client.get(detail_url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == {"reordered": 2}
+        assert detail["X-Cache"] == "MISS"
+        ids = [row["question"]["id"] for row in detail.json()["questions"]]
+        assert ids == [second.id, first.id]
+
+    def test_reorder_endpoint_is_admin_only(self, user, trivia):
+        """
+        Test that players cannot reorder a trivia.
+        Expected: 403 Forbidden.
+        """
+        client = APIClient()
+        client.force_authenticate(user=user)
+
+        response = client.post(
+            reverse("v1:trivia-reorder", args=[trivia.id]),
+            {"question_ids": [1]},
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_participation_export_streams_csv(self, admin_user):
+        """
+        Test that admins can stream participations of one trivia as CSV.
+        Expected: StreamingHttpResponse with a header row and one row per
+        participation of the requested trivia only.
+        """
+        participation = ParticipationFactory()
+        ParticipationFactory()
+
+        client = APIClient()
+        client.force_authenticate(user=admin_user)
+        response = client.get(
+            reverse("v1:export-participations"),
+            {"trivia": participation.trivia_id},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.streaming
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        assert lines[0].startswith("id,trivia_id,user_id")
+        assert len(lines) == 2
+        assert lines[1].startswith(f"{participation.id},{participation.trivia_id},")
+
+    def test_answer_export_jsonl_is_admin_only(self, user, admin_user):
+        """
+        Test that the answer export is restricted and supports JSONL.
+        Expected: 403 for players; one JSON object per line for admins.
+        """
+        answer = UserAnswerFactory()
+        url = reverse("v1:export-answers")
+        client = APIClient()
+
+        client.force_authenticate(user=user)
+        assert client.get(url).status_code == status.HTTP_403_FORBIDDEN
+
+        client.force_authenticate(user=admin_user)
+        response = client.get(url, {"file_format": "jsonl"})
+        rows = b"".join(response.streaming_content).decode().splitlines()
+
+        assert response["Content-Type"] == "application/x-ndjson"
+        assert json.loads(rows[0])["question_id"] == answer.question_id
+
+    def test_participation_list_returns_summary(self, user):
+        """
+        Test that the participation list carries aggregated counters
+        instead of nested answers.
+        Expected: answered_count/correct_count per row; correct_count is
+        hidden while the participation is in progress.
+        """
+        finished = ParticipationFactory(user=user, end_time=timezone.now())
+        UserAnswerFactory(participation=finished, is_correct=True)
+        UserAnswerFactory(participation=finished, is_correct=False)
+        in_progress = ParticipationFactory(user=user)
+        UserAnswerFactory(participation=in_progress, is_correct=True)
+
+        client = APIClient()
+        client.force_authenticate(user=user)
+        response = client.get(reverse("v1:participation-list"))
+
+        rows = {row["id"]: row for row in response.data["results"]}
+        assert "answers" not in rows[finished.id]
+        assert rows[finished.id]["answered_count"] == 2
+        assert rows[finished.id]["correct_count"] == 1
+        assert rows[in_progress.id]["answered_count"] == 1
+        assert "correct_count" not in rows[in_progress.id]
+
+    def test_participation_retrieve_paginates_answers(self, user):
+        """
+        Test that retrieve serves answers as a cursor page.
+        Expected: page_size answers plus a 'next' cursor, in answer order,
+        with a query count independent of the page size.
+        """
+        participation = ParticipationFactory(user=user)
+        answers = UserAnswerFactory.create_batch(3, participation=participation)
+
+        client = APIClient()
+        client.force_authenticate(user=user)
+        url = reverse("v1:participation-detail", args=[participation.id])
+
+        with CaptureQueriesContext(connection) as ctx:
+            first = client.get(url, {"page_size": 2})
+        second = client.get(first.data["answers"]["next"])
+
+        page = first.data["answers"]
+        assert [row["id"] for row in page["results"]] == [a.id for a in answers[:2]]
+        assert [row["id"] for row in second.data["answers"]["results"]] == [
+            answers[2].id
+        ]
+        assert len(ctx.captured_queries) <= 3
+
+    def test_patch_end_time_sets_duration(self, user):
+        """
+        Test that finishing a participation through PATCH persists the
+        duration used by the rankings.
+        Expected: duration equals end_time - start_time.
+        """
+        participation = ParticipationFactory(user=user)
+        end_time = participation.start_time + timedelta(seconds=42)
+
+        client = APIClient()
+        client.force_authenticate(user=user)
+        response = client.patch(
+            reverse("v1:participation-detail", args=[participation.id]),
+            {"end_time": end_time.isoformat()},
+            format="json",
+        )
+
+        participation.refresh_from_db()
+        assert response.status_code == status.HTTP_200_OK
+        assert participation.duration == timedelta(seconds=42)
+        assert response.data["duration"] == 42.0
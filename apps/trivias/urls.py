@@ -2,8 +2,9 @@
 from django.urls import include, path
 from rest_framework.routers import DefaultRouter
 
+from .views.export_view import ParticipationExportView, UserAnswerExportView
 from .views.participation_viewset import ParticipationViewSet
-from .views.ranking_view import TriviaRankingView
+from .views.ranking_view import MyTriviaRankingView, TriviaRankingView
 from .views.trivia_viewset import TriviaViewSet
 from .views.user_answer_viewset import UserAnswerViewSet
 
@@ -19,4 +20,19 @@ urlpatterns = [
         TriviaRankingView.as_view(),
         name="trivia-ranking",
     ),
+    path(
+        "trivias/<int:trivia_id>/ranking/me/",
+        MyTriviaRankingView.as_view(),
+        name="trivia-ranking-me",
+    ),
+    path(
+        "exports/participations/",
+        ParticipationExportView.as_view(),
+        name="export-participations",
+    ),
+    path(
+        "exports/answers/",
+        UserAnswerExportView.as_view(),
+        name="export-answers",
+    ),
 ]
@@ -0,0 +1,59 @@
+# apps/trivias/views/export_view.py
+import logging
+
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+from drf_spectacular.utils import OpenApiTypes, extend_schema
+from rest_framework import permissions
+from rest_framework.views import APIView
+
+from ..serializers.export_serializer import ExportQuerySerializer
+from ..services.export_service import ExportService
+
+logger = logging.getLogger(__name__)
+
+
+class BaseExportView(APIView):
+    """
+    Streams a dataset as a CSV/JSONL attachment (Admin only).
+    Bytes are sent as rows are fetched; nothing is buffered in memory.
+    """
+
+    permission_classes = [permissions.IsAdminUser]
+    dataset = None
+
+    @extend_schema(
+        parameters=[ExportQuerySerializer], responses={200: OpenApiTypes.BINARY}
+    )
+    def get(self, request):
+        params = ExportQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        file_format = params.validated_data["file_format"]
+
+        logger.info(
+            "Admin %s started %s export (%s)",
+            request.user.email,
+            self.dataset,
+            dict(params.validated_data),
+        )
+        response = StreamingHttpResponse(
+            ExportService.stream(
+                self.dataset,
+                file_format=file_format,
+                trivia_id=params.validated_data.get("trivia"),
+                since=params.validated_data.get("since"),
+                until=params.validated_data.get("until"),
+            ),
+            content_type=ExportService.CONTENT_TYPES[file_format],
+        )
+        filename = f"{self.dataset}-{timezone.now():%Y%m%d%H%M%S}.{file_format}"
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        return response
+
+
+class ParticipationExportView(BaseExportView):
+    dataset = "participations"
+
+
+class UserAnswerExportView(BaseExportView):
+    dataset = "answers"
@@ -1,18 +1,36 @@
 # apps/trivias/views/participation_viewset.py
 import logging
 
+from django.core.exceptions import ValidationError
+from django.db.models import Count, Q
 from rest_framework import permissions, status, viewsets
 from rest_framework.decorators import action
 from rest_framework.response import Response
 
+from apps.core import metrics
+from apps.core.pagination import StableCursorPagination
+
 from ..models.participation import Participation
-from ..serializers.answer_input_serializer import AnswerInputSerializer
-from ..serializers.participation_serializer import ParticipationSerializer
+from ..serializers.answer_input_serializer import (
+    AnswerInputSerializer,
+    BatchAnswerInputSerializer,
+)
+from ..serializers.participation_serializer import (
+    ParticipationSerializer,
+    ParticipationSummarySerializer,
+)
+from ..serializers.user_answer_serializer import UserAnswerSerializer
 from ..services.participation_service import ParticipationService
 
 logger = logging.getLogger(__name__)
 
 
+class ParticipationAnswerPagination(StableCursorPagination):
+    """Answers of one participation, in the order they were given."""
+
+    ordering = ("created_at", "id")
+
+
 class ParticipationViewSet(viewsets.ModelViewSet):
     """
     Handles the lifecycle of a trivia participation.
@@ -22,17 +40,55 @@ class ParticipationViewSet(viewsets.ModelViewSet):
     # queryset = Participation.objects.all()
     serializer_class = ParticipationSerializer
     permission_classes = [permissions.IsAuthenticated]
+    ordering_fields = ["created_at"]
+    throttle_scopes = {
+        "submit_answer": "submit-answer",
+        "submit_answers": "submit-answer",
+    }
+
+    def get_serializer_class(self):
+        if self.action == "list":
+            return ParticipationSummarySerializer
+        return ParticipationSerializer
 
     def get_queryset(self):
         """
-        Multi-level prefetching to avoid N+1 queries during
-        game progress review.
+        The list action aggregates answer counters in SQL instead of
+        loading answers; retrieve pages them separately.
+        Answer submission only needs the participation row itself.
         """
-        return (
-            Participation.objects.filter(user=self.request.user)
-            .select_related("user", "trivia")
-            .prefetch_related("answers__question", "answers__chosen_choice")
+        queryset = Participation.objects.filter(user=self.request.user)
+        if self.action in ("submit_answer", "submit_answers"):
+            return queryset
+
+        queryset = queryset.select_related("trivia")
+        if self.action == "list":
+            return queryset.annotate(
+                answered_count=Count("answers"),
+                correct_count=Count("answers", filter=Q(answers__is_correct=True)),
+            )
+        return queryset
+
+    def retrieve(self, request, *args, **kwargs):
+        """
+        Participation detail plus one cursor page of its answers.
+        """
+        participation = self.get_object()
+        data = self.get_serializer(participation).data
+
+        paginator = ParticipationAnswerPagination()
+        page = paginator.paginate_queryset(
+            participation.answers.select_related("question", "chosen_choice"),
+            request,
+            view=self,
         )
+        for answer in page:
+            # Avoids one query per answer in UserAnswerSerializer
+            answer.participation = participation
+        data["answers"] = paginator.get_paginated_response(
+            UserAnswerSerializer(page, many=True).data
+        ).data
+        return Response(data)
 
     def perform_create(self, serializer):
         """
@@ -71,9 +127,48 @@ class ParticipationViewSet(viewsets.ModelViewSet):
                 {"status": "Answer processed successfully"},
                 status=status.HTTP_201_CREATED,
             )
+        except ValidationError as e:
+            metrics.ANSWER_OUTCOMES.labels("rejected").inc()
+            return Response(
+                {"detail": e.messages[0]}, status=status.HTTP_400_BAD_REQUEST
+            )
         except Exception as e:
             logger.error(f"Unexpected error in submit_answer: {str(e)}", exc_info=True)
             return Response(
                 {"error": "An internal error occurred while processing your answer."},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
+
+    @action(detail=True, methods=["post"], url_path="submit-answers")
+    def submit_answers(self, request, pk=None):
+        """
+        Batch variant of submit-answer for clients on poor networks.
+        Accepts every answer of a session (and optionally finishes it)
+        in a single request and transaction.
+        """
+        participation = self.get_object()
+        serializer = BatchAnswerInputSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        answers = [
+            (item["question_id"], item["choice_id"])
+            for item in serializer.validated_data["answers"]
+        ]
+
+        try:
+            user_answers = ParticipationService.submit_answers(
+                participation=participation,
+                answers=answers,
+                finish=serializer.validated_data["finish"],
+            )
+        except ValidationError as e:
+            metrics.ANSWER_OUTCOMES.labels("rejected").inc()
+            return Response(
+                {"detail": e.messages[0]}, status=status.HTTP_400_BAD_REQUEST
+            )
+
+        data = {"answered": len(user_answers), "finished": participation.is_finished}
+        if participation.is_finished:
+            # Scores are only revealed once the session is closed
+            data["total_score"] = participation.total_score
+        return Response(data, status=status.HTTP_201_CREATED)
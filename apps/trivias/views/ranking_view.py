@@ -1,11 +1,17 @@
 # apps/trivias/views/ranking_view.py
 import logging
 
+from drf_spectacular.utils import extend_schema
 from rest_framework import permissions, status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from ..serializers.ranking_serializer import RankingSerializer
+from ..models.participation import Participation
+from ..serializers.ranking_serializer import (
+    RankingSerializer,
+    RankingWindowSerializer,
+)
+from ..services.leaderboard_service import LeaderboardService
 from ..services.participation_service import ParticipationService
 
 logger = logging.getLogger(__name__)
@@ -15,17 +21,25 @@ class TriviaRankingView(APIView):
     """
     Returns the leaderboard for a specific trivia.
     Uses Service Layer for tie-breaking logic (score + time).
+    Served from the Redis leaderboard when warm, from SQL otherwise
+    (which schedules a rebuild).
     """
 
     permission_classes = [permissions.IsAuthenticated]
+    throttle_scope = "ranking"
 
     def get(self, request, trivia_id):
         logger.info(
             f"User {request.user.email} requested ranking for trivia {trivia_id}"
         )
-        ranking_queryset = ParticipationService.get_ranking(trivia_id=trivia_id)
+        ranking = LeaderboardService.get_top(trivia_id, limit=10)
 
-        if not ranking_queryset.exists():
+        if ranking is None:
+            LeaderboardService.report_cold(trivia_id, "top")
+            ranking_queryset = ParticipationService.get_ranking(trivia_id=trivia_id)
+            ranking = RankingSerializer(ranking_queryset, many=True).data
+
+        if not ranking:
             logger.warning(
                 "Ranking requested for trivia %s but no finished participations found.",
                 trivia_id,
@@ -35,5 +49,49 @@ class TriviaRankingView(APIView):
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        serializer = RankingSerializer(ranking_queryset, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return Response(ranking, status=status.HTTP_200_OK)
+
+
+class MyTriviaRankingView(APIView):
+    """
+    Returns the caller's standing in a trivia: rank, percentile and a
+    window of neighbours above and below them.
+    Rank lookup is logarithmic on the Redis leaderboard; SQL is only used
+    while the board is cold, and triggers a rebuild.
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+    throttle_scope = "ranking"
+
+    @extend_schema(parameters=[RankingWindowSerializer])
+    def get(self, request, trivia_id):
+        params = RankingWindowSerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        window = params.validated_data["window"]
+
+        participation = Participation.objects.filter(
+            user=request.user, trivia_id=trivia_id, end_time__isnull=False
+        ).first()
+        if participation is None:
+            return Response(
+                {"detail": "You have not finished this trivia yet."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        standing = LeaderboardService.get_around(trivia_id, participation.id, window)
+
+        if standing is None:
+            LeaderboardService.report_cold(trivia_id, "around")
+            rank, total, first_rank, neighbours = ParticipationService.get_rank_window(
+                participation, window
+            )
+            entries = RankingSerializer(neighbours, many=True).data
+            for offset, entry in enumerate(entries):
+                entry["rank"] = first_rank + offset
+            standing = {"rank": rank, "total": total, "entries": entries}
+
+        # Share of finished players ranked at or below the caller.
+        standing["percentile"] = round(
+            100 * (standing["total"] - standing["rank"] + 1) / standing["total"], 2
+        )
+        return Response(standing, status=status.HTTP_200_OK)
@@ -1,47 +1,149 @@
 # apps/trivias/views/trivia_viewset.py
 import logging
 
-from rest_framework import permissions, viewsets
+from django.core.exceptions import ValidationError
+from django.db.models import Case, Count, IntegerField, Sum, Value, When
+from django.db.models.functions import Coalesce
+from django.http import HttpResponse
+from django.utils.cache import quote_etag
+from rest_framework import permissions, status, viewsets
+from rest_framework.decorators import action
+from rest_framework.generics import get_object_or_404
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+
+from apps.core.conditional import ConditionalGetMixin
 
 from ..models.trivia import Trivia
-from ..serializers.trivia_serializer import TriviaSerializer
+from ..serializers.trivia_serializer import (
+    TriviaReorderSerializer,
+    TriviaSerializer,
+    TriviaSummarySerializer,
+)
+from ..services.answer_key_service import AnswerKeyService
+from ..services.trivia_detail_cache_service import TriviaDetailCacheService
+from ..services.trivia_question_service import TriviaQuestionService
+from ..services.trivia_version_service import TriviaVersionService
 
 logger = logging.getLogger(__name__)
 
 
-class TriviaViewSet(viewsets.ModelViewSet):
+class TriviaViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     """
     ViewSet for listing and retrieving Trivias.
     Use ReadOnlyModelViewSet to prevent players from creating/deleting games.
     """
 
     serializer_class = TriviaSerializer
+    lookup_value_regex = r"\d+"
     # permission_classes = [permissions.IsAuthenticated]
 
     def get_permissions(self):
-        if self.action in ["create", "update", "partial_update", "destroy"]:
+        if self.action in ["create", "update", "partial_update", "destroy", "reorder"]:
             return [permissions.IsAdminUser()]
 
         return [permissions.IsAuthenticated()]
 
+    def get_serializer_class(self):
+        if self.action == "list":
+            return TriviaSummarySerializer
+        if self.action == "reorder":
+            return TriviaReorderSerializer
+        return TriviaSerializer
+
     def get_queryset(self):
         """
         Optimized query to avoid N+1 problem when fetching questions and choices.
+        The list action only needs aggregated counters, computed in SQL.
         """
+        if self.action == "list":
+            points = Case(
+                *[
+                    When(trivia_questions__question__difficulty=level, then=Value(pts))
+                    for level, pts in AnswerKeyService.DIFFICULTY_POINTS.items()
+                ],
+                default=Value(0),
+                output_field=IntegerField(),
+            )
+            return Trivia.objects.annotate(
+                question_count=Count("trivia_questions"),
+                max_possible_score=Coalesce(Sum(points), 0),
+            )
+
+        if self.action == "reorder":
+            return Trivia.objects.all()
+
         return Trivia.objects.prefetch_related(
             "trivia_questions__question__choices"
         ).all()
 
+    def get_etag_token(self):
+        """
+        The detail is validated by the trivia's content version, which
+        costs one cache GET and no query. A missing version is not minted
+        here, so unknown ids never create cache keys.
+        """
+        if self.action == "retrieve":
+            return TriviaVersionService.peek(self.kwargs[self.lookup_field])
+        return None
+
     def list(self, request, *args, **kwargs):
         logger.info(f"User {request.user.email} is listing available trivias.")
         return super().list(request, *args, **kwargs)
 
     def retrieve(self, request, *args, **kwargs):
-        instance = self.get_object()
+        return self.conditional(request, self._cached_detail, *args, **kwargs)
+
+    def _cached_detail(self, request, *args, **kwargs):
+        """
+        Serves the player-safe detail from the versioned payload cache.
+        The nested tree is only serialized on a miss. The ETag is the
+        version of the body served, which may be older than the current one.
+        """
+        trivia_id = self.kwargs[self.lookup_field]
+        if TriviaVersionService.peek(trivia_id) is None:
+            # Cold or unknown: 404 before get_or_build mints a version
+            get_object_or_404(Trivia.objects.only("pk"), pk=trivia_id)
+
+        def build():
+            instance = self.get_object()
+            return JSONRenderer().render(self.get_serializer(instance).data)
+
+        version, body, hit = TriviaDetailCacheService.get_or_build(trivia_id, build)
+        logger.info(
+            "User %s accessed trivia detail (ID: %s, cache %s)",
+            request.user.email,
+            trivia_id,
+            "hit" if hit else "miss",
+        )
+        response = HttpResponse(body, content_type="application/json")
+        response["X-Cache"] = "HIT" if hit else "MISS"
+        response["ETag"] = quote_etag(version)
+        return response
+
+    @action(detail=True, methods=["post"])
+    def reorder(self, request, pk=None):
+        """
+        Renumbers the questions of a trivia from a list of question ids.
+        Only rows whose position changed are written.
+        """
+        trivia = self.get_object()
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        try:
+            reordered = TriviaQuestionService.reorder(
+                trivia, serializer.validated_data["question_ids"]
+            )
+        except ValidationError as e:
+            return Response(
+                {"detail": e.messages[0]}, status=status.HTTP_400_BAD_REQUEST
+            )
+
         logger.info(
-            "User %s accessed trivia detail: %s (ID: %s)",
+            "Trivia %s reordered by %s (%s rows moved)",
+            trivia.id,
             request.user.email,
-            instance.name,
-            instance.id,
+            reordered,
         )
-        return super().retrieve(request, *args, **kwargs)
+        return Response({"reordered": reordered})
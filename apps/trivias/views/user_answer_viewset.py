@@ -4,6 +4,8 @@ import logging
 from rest_framework import permissions, status, viewsets
 from rest_framework.response import Response
 
+from apps.core import metrics
+
 from ..models.user_answer import UserAnswer
 from ..serializers.user_answer_serializer import UserAnswerSerializer
 from ..services.participation_service import ParticipationService
@@ -18,6 +20,8 @@ class UserAnswerViewSet(viewsets.ModelViewSet):
     """
 
     serializer_class = UserAnswerSerializer
+    ordering_fields = ["created_at"]
+    throttle_scopes = {"create": "submit-answer"}
 
     def get_permissions(self):
         if self.action in ["update", "partial_update", "destroy"]:
@@ -46,8 +50,8 @@ class UserAnswerViewSet(viewsets.ModelViewSet):
         try:
             user_answer = ParticipationService.submit_answer(
                 participation=participation,
-                question=question,
-                chosen_choice=chosen_choice,
+                question_id=question.id,
+                choice_id=chosen_choice.id,
             )
 
             logger.info(
@@ -62,6 +66,7 @@ class UserAnswerViewSet(viewsets.ModelViewSet):
             return Response(response_serializer.data, status=status.HTTP_201_CREATED)
 
         except Exception as e:
+            metrics.ANSWER_OUTCOMES.labels("rejected").inc()
             logger.error(
                 "Error submitting answer for user %s: %s", request.user.email, str(e)
             )
@@ -7,3 +7,6 @@ class UsersConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.users"
     verbose_name = _("Users")
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -0,0 +1,61 @@
+# apps/users/authentication.py
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+from .models.user import User
+from .services.user_cache_service import UserCacheService
+
+
+class ClaimsJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication that avoids the per-request user SELECT on reads.
+
+    - Safe methods: the user is built from the token claims (id, email,
+      role, is_staff) with every other field deferred. Tokens missing those
+      claims fall back to UserCacheService.
+    - Unsafe methods: full database load, including the is_active check.
+
+    Claims are re-stamped on every refresh, so a role change or
+    deactivation reaches reads within one access-token lifetime.
+    """
+
+    CLAIM_FIELDS = ("email", "role", "is_staff")
+
+    def authenticate(self, request):
+        header = self.get_header(request)
+        if header is None:
+            return None
+
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+
+        validated_token = self.get_validated_token(raw_token)
+        if request.method in SAFE_METHODS:
+            return self.get_read_user(validated_token), validated_token
+        return self.get_user(validated_token), validated_token
+
+    def get_read_user(self, validated_token) -> User:
+        try:
+            user_id = User._meta.pk.to_python(
+                validated_token[api_settings.USER_ID_CLAIM]
+            )
+        except KeyError as e:
+            raise InvalidToken(
+                _("Token contained no recognizable user identification")
+            ) from e
+
+        if all(claim in validated_token for claim in self.CLAIM_FIELDS):
+            values = {c: validated_token[c] for c in self.CLAIM_FIELDS}
+            return UserCacheService.build({"id": user_id, **values})
+
+        user = UserCacheService.get(user_id)
+        if user is None:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+        if not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+        return user
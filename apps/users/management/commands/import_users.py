@@ -0,0 +1,77 @@
+# apps/users/management/commands/import_users.py
+import json
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.users.services.user_import_service import UserImportService
+
+
+class Command(BaseCommand):
+    """
+    Provisions users from a JSONL or CSV file, hashing passwords in parallel.
+    Invalid and duplicate records are reported on stderr and skipped.
+    """
+
+    help = "Bulk import users from a JSONL or CSV file."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Input file, or '-' for stdin.")
+        parser.add_argument(
+            "--format",
+            dest="file_format",
+            choices=UserImportService.FORMATS,
+            help="Input format. Defaults to the file extension.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=UserImportService.DEFAULT_BATCH_SIZE,
+            help="Users inserted per bulk_create.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=UserImportService.default_workers(),
+            help="Password hashing processes (1 hashes in-process).",
+        )
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        file_format = options["file_format"] or (
+            "csv" if path.lower().endswith(".csv") else "jsonl"
+        )
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be positive.")
+        if options["workers"] < 1:
+            raise CommandError("--workers must be positive.")
+
+        def on_reject(rejection):
+            self.stderr.write(
+                f"Line {rejection['line']}: {json.dumps(rejection['errors'])}"
+            )
+
+        if path == "-":
+            result = self._import(sys.stdin, file_format, options, on_reject)
+        else:
+            try:
+                with open(path, encoding="utf-8", newline="") as stream:
+                    result = self._import(stream, file_format, options, on_reject)
+            except OSError as exc:
+                raise CommandError(str(exc)) from exc
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Imported {result.imported} user(s), "
+                f"rejected {result.rejected} in {result.elapsed:.2f}s "
+                f"({result.rows_per_second} rows/sec)."
+            )
+        )
+
+    def _import(self, stream, file_format, options, on_reject):
+        return UserImportService.run(
+            UserImportService.parse(stream, file_format),
+            batch_size=options["batch_size"],
+            workers=options["workers"],
+            on_reject=on_reject,
+        )
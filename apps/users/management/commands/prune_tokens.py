@@ -0,0 +1,42 @@
+# apps/users/management/commands/prune_tokens.py
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.users.services.token_blacklist_service import TokenBlacklistService
+
+
+class Command(BaseCommand):
+    """
+    Deletes expired refresh tokens from the outstanding/blacklist tables.
+    Meant to run on a schedule (e.g. daily cron); works in small chunks so
+    it is safe while serving traffic.
+    """
+
+    help = "Prune expired outstanding and blacklisted JWT refresh tokens."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=TokenBlacklistService.PRUNE_CHUNK_SIZE,
+            help="Rows deleted per transaction.",
+        )
+        parser.add_argument(
+            "--pause",
+            type=float,
+            default=0.0,
+            help="Seconds to sleep between chunks.",
+        )
+
+    def handle(self, *args, **options):
+        if options["chunk_size"] < 1:
+            raise CommandError("--chunk-size must be positive.")
+
+        totals = TokenBlacklistService.prune(
+            chunk_size=options["chunk_size"], pause=options["pause"]
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Pruned {totals['outstanding']} outstanding and "
+                f"{totals['blacklisted']} blacklisted token(s)."
+            )
+        )
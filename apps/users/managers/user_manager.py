@@ -1,14 +1,34 @@
 # apps/users/managers/user_manager.py
 from django.contrib.auth.models import BaseUserManager
+from django.db import models
+from django.db.models.functions import Lower
 
 from ..enums.user_role import UserRole
 
 
-class UserManager(BaseUserManager):
+class UserQuerySet(models.QuerySet):
+    def by_email(self, *emails):
+        """
+        Case-insensitive email match. Filters on LOWER(email), which the
+        users_email_ci_unique index answers in one probe; iexact compiles
+        to UPPER(...) on PostgreSQL and cannot use it.
+        """
+        return self.alias(email_lower=Lower("email")).filter(
+            email_lower__in=[email.lower() for email in emails]
+        )
+
+
+class UserManager(BaseUserManager.from_queryset(UserQuerySet)):
     """
     Custom manager for User model where email is the unique identifier.
     """
 
+    def get_by_natural_key(self, username):
+        """
+        Used by ModelBackend and createsuperuser; matches any email casing.
+        """
+        return self.by_email(username).get()
+
     def _create_user(self, email, password, **extra_fields):
         """
         Internal helper to handle core user creation logic.
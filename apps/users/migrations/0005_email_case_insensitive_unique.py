@@ -0,0 +1,61 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:41
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+MAX_REPORTED = 50
+
+
+def report_email_collisions(apps, schema_editor):
+    """
+    Refuses to build the index while emails collide case-insensitively,
+    listing the offending accounts so they can be merged or renamed first.
+    """
+    User = apps.get_model("users", "User")
+    collisions = (
+        User.objects.annotate(email_lower=django.db.models.functions.text.Lower("email"))
+        .values("email_lower")
+        .annotate(total=models.Count("id"))
+        .filter(total__gt=1)
+        .order_by("email_lower")
+    )
+    total = collisions.count()
+    if not total:
+        return
+
+    lines = []
+    for row in collisions[:MAX_REPORTED]:
+        accounts = (
+            User.objects.filter(email__iexact=row["email_lower"])
+            .order_by("id")
+            .values_list("id", "email")
+        )
+        lines.append(
+            ", ".join(f"#{user_id} {email}" for user_id, email in accounts)
+        )
+    if total > MAX_REPORTED:
+        lines.append(f"... and {total - MAX_REPORTED} more")
+
+    raise RuntimeError(
+        f"{total} email(s) collide case-insensitively; resolve them before "
+        "migrating:\n  " + "\n  ".join(lines)
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("auth", "0012_alter_user_first_name_max_length"),
+        ("users", "0004_pagination_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(report_email_collisions, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="user",
+            constraint=models.UniqueConstraint(
+                django.db.models.functions.text.Lower("email"),
+                name="users_email_ci_unique",
+            ),
+        ),
+    ]
@@ -1,6 +1,7 @@
 # apps/users/models/user.py
 from django.contrib.auth.models import AbstractUser
 from django.db import models
+from django.db.models.functions import Lower
 from django.utils.translation import gettext_lazy as _
 
 from ..enums.user_role import UserRole
@@ -41,6 +42,13 @@ class User(AbstractUser):
         verbose_name = _("user")
         verbose_name_plural = _("users")
         ordering = ["-date_joined"]
+        indexes = [
+            models.Index(fields=["-date_joined", "-id"]),
+        ]
+        constraints = [
+            # Backs UserQuerySet.by_email; emails are unique regardless of case
+            models.UniqueConstraint(Lower("email"), name="users_email_ci_unique"),
+        ]
 
     @property
     def short_name(self):
@@ -1,4 +1,5 @@
 # apps/users/serializers/user_serializer.py
+from django.conf import settings
 from rest_framework import serializers
 
 from ..enums.user_role import UserRole
@@ -35,6 +36,17 @@ class UserSerializer(serializers.ModelSerializer):
             "is_active": {"help_text": "Indicates if the user is active."},
         }
 
+    def validate_email(self, value):
+        """
+        Emails are unique regardless of case (users_email_ci_unique).
+        """
+        queryset = User.objects.by_email(value)
+        if self.instance:
+            queryset = queryset.exclude(pk=self.instance.pk)
+        if queryset.exists():
+            raise serializers.ValidationError("A user with this email already exists.")
+        return value
+
     def validate_role(self, value):
         """
         Business Rule: Only admins can change user roles.
@@ -67,3 +79,52 @@ class UserSerializer(serializers.ModelSerializer):
             instance.set_password(password)
 
         return super().update(instance, validated_data)
+
+
+class UserImportRecordSerializer(serializers.Serializer):
+    """
+    Validates one record of a bulk user import.
+    Email uniqueness is checked per batch by UserImportService.
+    """
+
+    email = serializers.EmailField(max_length=254)
+    full_name = serializers.CharField(max_length=255)
+    password = serializers.CharField(max_length=128)
+    role = serializers.ChoiceField(choices=UserRole.choices, default=UserRole.PLAYER)
+
+
+class UserImportSerializer(serializers.Serializer):
+    """
+    DTO for the bulk user import upload (JSONL or CSV).
+    """
+
+    file = serializers.FileField()
+    file_format = serializers.ChoiceField(
+        choices=["jsonl", "csv"],
+        required=False,
+        help_text="Defaults to the uploaded file extension.",
+    )
+
+    def validate(self, attrs):
+        """
+        Resolves the format and rejects files too large to import within a
+        request; those go through `manage.py import_users` instead.
+        """
+        upload = attrs["file"]
+        attrs["file_format"] = attrs.get("file_format") or (
+            "csv" if upload.name.lower().endswith(".csv") else "jsonl"
+        )
+
+        limit = settings.USER_IMPORT["UPLOAD_MAX_ROWS"]
+        rows = sum(1 for line in upload if line.strip())
+        if attrs["file_format"] == "csv":
+            rows -= 1  # header
+        upload.seek(0)
+        if rows > limit:
+            raise serializers.ValidationError(
+                {
+                    "file": f"Uploads are limited to {limit} users; import larger "
+                    "files with `manage.py import_users`."
+                }
+            )
+        return attrs
@@ -2,7 +2,9 @@
 from typing import Dict
 
 from django.contrib.auth import get_user_model
-from rest_framework_simplejwt.tokens import RefreshToken, TokenError
+from rest_framework_simplejwt.tokens import TokenError
+
+from ..tokens import CachedRefreshToken
 
 User = get_user_model()
 
@@ -13,16 +15,22 @@ class AuthService:
     using JWT tokens for the User model.
     """
 
+    @staticmethod
+    def _stamp_claims(token, user: User) -> None:
+        """
+        Claims read by ClaimsJWTAuthentication to skip the user lookup.
+        """
+        token["role"] = user.role
+        token["email"] = user.email
+        token["is_staff"] = user.is_staff
+
     @staticmethod
     def generate_tokens_for_user(user: User) -> Dict[str, str]:
         """
         Generates a new JWT token pair (access + refresh) for a user.
         """
-        refresh = RefreshToken.for_user(user)
-
-        # Optional: add custom claims
-        refresh["role"] = user.role
-        refresh["email"] = user.email
+        refresh = CachedRefreshToken.for_user(user)
+        AuthService._stamp_claims(refresh, user)
 
         return {
             "access": str(refresh.access_token),
@@ -33,23 +41,21 @@ class AuthService:
     def refresh_tokens(refresh_token: str) -> Dict[str, str]:
         """
         Rotates refresh tokens securely.
-        Returns a new pair of tokens.
+        Returns a new pair of tokens (fresh JTI) and blacklists the old one.
         """
         try:
-            refresh = RefreshToken(refresh_token)
-            data = {
-                "access": str(refresh.access_token),
-                "refresh": str(refresh),
-            }
+            refresh = CachedRefreshToken(refresh_token)
+            # Re-read the user so claims never outlive one access token
+            user = User.objects.get(pk=refresh["user_id"], is_active=True)
             refresh.blacklist()
-            return data
+            return AuthService.generate_tokens_for_user(user)
         except Exception:
             raise ValueError("Invalid refresh token")
 
     @staticmethod
     def logout(refresh_token: str) -> None:
         try:
-            token = RefreshToken(refresh_token)
+            token = CachedRefreshToken(refresh_token)
             token.blacklist()
         except (TokenError, AttributeError) as e:
             raise ValueError("Token is invalid or already blacklisted") from e
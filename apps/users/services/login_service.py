@@ -0,0 +1,164 @@
+# apps/users/services/login_service.py
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional, Tuple
+
+from django.conf import settings
+from django.contrib.auth.hashers import check_password, make_password
+
+from apps.core import metrics
+
+from ..models.user import User
+
+
+class LoginBusy(Exception):
+    """
+    Raised when a login cannot be verified within the configured limits.
+    """
+
+
+class LoginService:
+    """
+    Bounded credential verification.
+
+    The async variant hashes on a small per-process thread pool (hashlib
+    releases the GIL while hashing) and awaits it without holding a thread,
+    with the number of logins in flight capped so a storm is refused early.
+    The sync variant hashes inline, since its request thread would block
+    anyway; a semaphore one below the server threads bounds concurrent
+    hashes and refuses a login that cannot start within SYNC_WAIT.
+
+    Behaves like ModelBackend: unknown emails still pay one hash so timing
+    does not reveal which accounts exist, inactive users are refused and
+    outdated hashes are upgraded on success.
+    """
+
+    _executor: Optional[ThreadPoolExecutor] = None
+    _sync_slots: Optional[threading.BoundedSemaphore] = None
+    _pending = 0
+    _lock = threading.Lock()
+
+    @staticmethod
+    def _config(name):
+        return settings.LOGIN[name]
+
+    @staticmethod
+    def _get_executor() -> ThreadPoolExecutor:
+        with LoginService._lock:
+            if LoginService._executor is None:
+                LoginService._executor = ThreadPoolExecutor(
+                    max_workers=LoginService._config("WORKERS"),
+                    thread_name_prefix="login",
+                )
+            return LoginService._executor
+
+    @staticmethod
+    def _get_sync_slots() -> threading.BoundedSemaphore:
+        with LoginService._lock:
+            if LoginService._sync_slots is None:
+                LoginService._sync_slots = threading.BoundedSemaphore(
+                    LoginService._config("MAX_CONCURRENT_SYNC")
+                )
+            return LoginService._sync_slots
+
+    @staticmethod
+    def _verify(encoded, password) -> Tuple[bool, Optional[str]]:
+        """
+        Runs on the pool. Returns (is_valid, upgraded hash or None).
+        """
+        if encoded is None:
+            make_password(password)
+            return False, None
+
+        upgraded = []
+        is_valid = check_password(
+            password, encoded, setter=lambda raw: upgraded.append(make_password(raw))
+        )
+        return is_valid, upgraded[0] if upgraded else None
+
+    @staticmethod
+    def _release(future) -> None:
+        with LoginService._lock:
+            LoginService._pending -= 1
+        metrics.LOGIN_QUEUE_DEPTH.dec()
+
+    @staticmethod
+    def _submit(user, password) -> Future:
+        with LoginService._lock:
+            if LoginService._pending >= LoginService._config("MAX_PENDING"):
+                metrics.LOGIN_REJECTED.inc()
+                raise LoginBusy("Too many logins in progress.")
+            LoginService._pending += 1
+        metrics.LOGIN_QUEUE_DEPTH.inc()
+
+        encoded = user.password if user is not None else None
+        try:
+            future = LoginService._get_executor().submit(
+                LoginService._verify, encoded, password
+            )
+        except RuntimeError:
+            LoginService._release(None)
+            raise
+        future.add_done_callback(LoginService._release)
+        return future
+
+    @staticmethod
+    def _accept(user, verdict) -> Tuple[Optional[User], bool]:
+        """
+        Returns (user or None, whether the upgraded hash must be saved).
+        """
+        is_valid, upgraded = verdict
+        if user is None or not is_valid or not user.is_active:
+            return None, False
+        if upgraded is None:
+            return user, False
+        user.password = upgraded
+        return user, True
+
+    @staticmethod
+    def authenticate(email, password) -> Optional[User]:
+        """
+        Returns the active user matching the credentials, or None.
+        Raises LoginBusy when no hashing slot frees up within SYNC_WAIT.
+        """
+        user = User.objects.by_email(email).first()
+        slots = LoginService._get_sync_slots()
+        metrics.LOGIN_QUEUE_DEPTH.inc()
+        try:
+            if not slots.acquire(timeout=LoginService._config("SYNC_WAIT")):
+                metrics.LOGIN_REJECTED.inc()
+                raise LoginBusy("Too many logins in progress.")
+            try:
+                verdict = LoginService._verify(
+                    user.password if user is not None else None, password
+                )
+            finally:
+                slots.release()
+        finally:
+            metrics.LOGIN_QUEUE_DEPTH.dec()
+
+        user, upgraded = LoginService._accept(user, verdict)
+        if upgraded:
+            user.save(update_fields=["password"])
+        return user
+
+    @staticmethod
+    async def aauthenticate(email, password) -> Optional[User]:
+        """
+        Async variant of authenticate() for ASGI views.
+        """
+        user = await User.objects.by_email(email).afirst()
+        future = LoginService._submit(user, password)
+        try:
+            verdict = await asyncio.wait_for(
+                asyncio.wrap_future(future), LoginService._config("TIMEOUT")
+            )
+        except asyncio.TimeoutError as exc:
+            metrics.LOGIN_REJECTED.inc()
+            raise LoginBusy("Password verification timed out.") from exc
+
+        user, upgraded = LoginService._accept(user, verdict)
+        if upgraded:
+            await user.asave(update_fields=["password"])
+        return user
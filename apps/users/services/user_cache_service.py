@@ -0,0 +1,58 @@
+# apps/users/services/user_cache_service.py
+from typing import Optional
+
+from apps.core.tiered_cache import TieredCache
+
+from ..models.user import User
+
+_tier = TieredCache("auth_user", "AUTH_USER_CACHE")
+
+
+class UserCacheService:
+    """
+    Short-lived two-tier cache (see apps.core.tiered_cache) of the user
+    fields needed to authorize reads.
+
+    Instances are rebuilt with Model.from_db, so any field that is not
+    cached is deferred and loaded lazily instead of silently defaulting.
+    Entries are dropped in every worker on User save/delete (see signals).
+    """
+
+    FIELDS = (
+        "id",
+        "email",
+        "full_name",
+        "role",
+        "is_staff",
+        "is_superuser",
+        "is_active",
+    )
+
+    @staticmethod
+    @_tier.cached()
+    def _values(user_id):
+        return (
+            User.objects.filter(pk=user_id)
+            .values_list(*UserCacheService.FIELDS)
+            .first()
+        )
+
+    @staticmethod
+    def get(user_id) -> Optional[User]:
+        values = UserCacheService._values(user_id)
+        if values is None:
+            return None
+        return UserCacheService.build(dict(zip(UserCacheService.FIELDS, values)))
+
+    @staticmethod
+    def build(values: dict) -> User:
+        """
+        Builds a partially loaded User; missing fields stay deferred.
+        from_db expects the values in concrete field order.
+        """
+        names = [f.attname for f in User._meta.concrete_fields if f.attname in values]
+        return User.from_db(None, names, [values[name] for name in names])
+
+    @staticmethod
+    def invalidate(user_id) -> None:
+        UserCacheService._values.invalidate(user_id)
@@ -0,0 +1,199 @@
+# apps/users/services/user_import_service.py
+import csv
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Iterable, Iterator, Optional
+
+import django
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.db import DatabaseError, IntegrityError, transaction
+
+from apps.core.importing import ImportResult, ParsedRecord, parse_jsonl
+
+from ..enums.user_role import UserRole
+from ..models.user import User
+from ..serializers.user_serializer import UserImportRecordSerializer
+
+logger = logging.getLogger(__name__)
+
+
+class UserImportService:
+    """
+    Bulk provisioning of user accounts (JSONL or CSV).
+
+    Password hashing (PBKDF2) dominates the cost of creating a user, so
+    each batch is hashed across a process pool before a single bulk_create.
+    Emails are normalized like UserManager.normalize_email; addresses that
+    repeat within the file or already exist (in any casing) are rejected,
+    never aborting the batch.
+
+    JSONL: {"email": ..., "full_name": ..., "password": ..., "role": ...}
+    CSV: email, full_name, password, role (optional)
+    """
+
+    FORMATS = ("jsonl", "csv")
+    DEFAULT_BATCH_SIZE = 500
+    DUPLICATE_EMAIL = "A user with this email already exists."
+
+    @staticmethod
+    def default_workers() -> int:
+        return min(os.cpu_count() or 1, settings.USER_IMPORT["WORKERS"])
+
+    # ------------------------------------------------------------------
+    # Parsing
+    # ------------------------------------------------------------------
+    @staticmethod
+    def parse_csv(lines: Iterable[str]) -> Iterator[ParsedRecord]:
+        reader = csv.DictReader(lines)
+        for row in reader:
+            yield reader.line_num, {k: v for k, v in row.items() if v}, None
+
+    @staticmethod
+    def parse(lines: Iterable[str], file_format: str) -> Iterator[ParsedRecord]:
+        if file_format == "csv":
+            return UserImportService.parse_csv(lines)
+        return parse_jsonl(lines)
+
+    # ------------------------------------------------------------------
+    # Import
+    # ------------------------------------------------------------------
+    @staticmethod
+    def run(
+        records: Iterable[ParsedRecord],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        workers: Optional[int] = None,
+        on_reject: Optional[Callable[[dict], None]] = None,
+    ) -> ImportResult:
+        """
+        workers: hashing processes; 0 or 1 hashes in the current process.
+        """
+        result = ImportResult()
+        started = time.monotonic()
+        workers = UserImportService.default_workers() if workers is None else workers
+
+        def reject(line_number, errors):
+            rejection = result.reject(line_number, errors)
+            if on_reject is not None:
+                on_reject(rejection)
+
+        # spawn, not fork: children must not inherit open DB connections
+        pool = (
+            ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=django.setup,
+            )
+            if workers > 1
+            else None
+        )
+        try:
+            seen = set()
+            batch = []
+            for line_number, record, error in records:
+                if error is not None:
+                    reject(line_number, error)
+                    continue
+
+                serializer = UserImportRecordSerializer(data=record)
+                if not serializer.is_valid():
+                    reject(line_number, serializer.errors)
+                    continue
+
+                data = serializer.validated_data
+                data["email"] = User.objects.normalize_email(data["email"])
+                if data["email"].lower() in seen:
+                    reject(line_number, {"email": [UserImportService.DUPLICATE_EMAIL]})
+                    continue
+                seen.add(data["email"].lower())
+
+                batch.append((line_number, data))
+                if len(batch) >= batch_size:
+                    result.imported += UserImportService._flush(
+                        batch, pool, workers, reject
+                    )
+                    batch = []
+
+            if batch:
+                result.imported += UserImportService._flush(
+                    batch, pool, workers, reject
+                )
+        finally:
+            if pool is not None:
+                pool.shutdown()
+
+        result.elapsed = time.monotonic() - started
+        logger.info(
+            "User import: %s imported, %s rejected in %.2fs (%s rows/sec)",
+            result.imported,
+            result.rejected,
+            result.elapsed,
+            result.rows_per_second,
+        )
+        return result
+
+    @staticmethod
+    def _flush(batch, pool, workers, reject) -> int:
+        existing = {
+            email.lower()
+            for email in User.objects.by_email(
+                *[data["email"] for _, data in batch]
+            ).values_list("email", flat=True)
+        }
+        pending = []
+        for line_number, data in batch:
+            if data["email"].lower() in existing:
+                reject(line_number, {"email": [UserImportService.DUPLICATE_EMAIL]})
+            else:
+                pending.append((line_number, data))
+        if not pending:
+            return 0
+
+        hashes = UserImportService._hash(
+            [data.pop("password") for _, data in pending], pool, workers
+        )
+        users = [
+            UserImportService._build(data, password)
+            for (_, data), password in zip(pending, hashes)
+        ]
+        try:
+            with transaction.atomic():
+                User.objects.bulk_create(users)
+            return len(users)
+        except DatabaseError:
+            logger.warning("User import batch failed, retrying record by record")
+
+        # Concurrent signups may have claimed an email since the check above
+        inserted = 0
+        for (line_number, _), user in zip(pending, users):
+            user.pk = None
+            try:
+                with transaction.atomic():
+                    user.save(force_insert=True)
+                inserted += 1
+            except IntegrityError:
+                reject(line_number, {"email": [UserImportService.DUPLICATE_EMAIL]})
+            except DatabaseError as exc:
+                reject(line_number, str(exc))
+        return inserted
+
+    @staticmethod
+    def _hash(passwords, pool, workers):
+        if pool is None:
+            return [make_password(password) for password in passwords]
+        # A few chunks per worker keeps IPC overhead low and the load even
+        chunksize = max(len(passwords) // (workers * 4), 1)
+        return list(pool.map(make_password, passwords, chunksize=chunksize))
+
+    @staticmethod
+    def _build(data, password_hash) -> User:
+        is_admin = data["role"] == UserRole.ADMIN
+        return User(
+            **data,
+            password=password_hash,
+            is_staff=is_admin,
+            is_superuser=False,
+        )
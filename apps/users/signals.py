@@ -0,0 +1,12 @@
+# apps/users/signals.py
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models.user import User
+from .services.user_cache_service import UserCacheService
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_cached_user(sender, instance, **kwargs):
+    UserCacheService.invalidate(instance.pk)
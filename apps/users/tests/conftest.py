@@ -4,11 +4,26 @@ Pytest fixtures for the Users app.
 Provides reusable instances and API clients for integration testing.
 """
 import pytest
+from django.core.cache import cache
 from rest_framework.test import APIClient
 
+from apps.core.tiered_cache import clear_local_tiers
 from apps.users.tests.factories import AdminFactory, PlayerFactory
 
 
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """
+    Empties the cache and the local tiers around each test, so throttle
+    windows and cached users never leak between tests.
+    """
+    cache.clear()
+    clear_local_tiers()
+    yield
+    cache.clear()
+    clear_local_tiers()
+
+
 @pytest.fixture
 def api_client():
     """
@@ -1,11 +1,19 @@
 # apps/users/tests/test_auth_endpoints.py
+import json
+import threading
+
 import pytest
+from asgiref.sync import async_to_sync
+from django.contrib.auth.models import AnonymousUser
+from django.test import RequestFactory
 from django.urls import reverse
 from rest_framework import status
 from rest_framework_simplejwt.exceptions import TokenError
 from rest_framework_simplejwt.tokens import RefreshToken
 
 from apps.users.services.auth_service import AuthService
+from apps.users.services.login_service import LoginService
+from apps.users.views.async_login_view import AsyncLoginView
 
 
 @pytest.mark.django_db
@@ -114,3 +122,64 @@ class TestAuthEndpoints:
         response = api_client.post(self.REFRESH_URL, {"refresh": refresh_token})
 
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_login_refused_when_saturated(
+        self, api_client, user, settings, monkeypatch
+    ):
+        """
+        Test that a login that cannot get a hashing slot sheds load.
+        Expected: 429 Too Many Requests with a Retry-After header.
+        """
+        settings.LOGIN = dict(settings.LOGIN, SYNC_WAIT=0)
+        monkeypatch.setattr(LoginService, "_sync_slots", threading.BoundedSemaphore(0))
+        payload = {"email": user.email, "password": "password123"}
+
+        response = api_client.post(self.LOGIN_URL, payload)
+
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        assert response["Retry-After"] == "1"
+
+
+@pytest.mark.django_db
+class TestAsyncLoginView:
+    """
+    Tests for the ASGI login view.
+    """
+
+    view = staticmethod(AsyncLoginView.as_view())
+
+    def _post(self, payload):
+        request = RequestFactory().post(
+            "/", json.dumps(payload), content_type="application/json"
+        )
+        request.user = AnonymousUser()  # set by AuthenticationMiddleware
+        return async_to_sync(self.view)(request)
+
+    def test_login_success(self, user):
+        """
+        Test that valid credentials return a token pair.
+        Expected: 200 OK with access and refresh tokens.
+        """
+        response = self._post({"email": user.email, "password": "password123"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert {"access", "refresh"} <= set(json.loads(response.content))
+
+    def test_login_invalid_credentials(self, user):
+        """
+        Test that a wrong password is refused.
+        Expected: 401 Unauthorized.
+        """
+        response = self._post({"email": user.email, "password": "wrong"})
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_login_validation_error(self):
+        """
+        Test that malformed payloads are rejected before hashing.
+        Expected: 400 Bad Request with field errors.
+        """
+        response = self._post({"email": "not-an-email"})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "password" in json.loads(response.content)
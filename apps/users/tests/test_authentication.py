@@ -0,0 +1,142 @@
+# apps/users/tests/test_authentication.py
+import pytest
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIRequestFactory
+from rest_framework_simplejwt.tokens import AccessToken
+
+from apps.users.authentication import ClaimsJWTAuthentication
+from apps.users.services.auth_service import AuthService
+from apps.users.services.user_cache_service import UserCacheService
+
+
+@pytest.mark.django_db
+class TestClaimsJWTAuthentication:
+    """
+    Tests for claims-based authentication of read requests.
+    """
+
+    ME_URL = reverse("v1:auth-me")
+    LOGOUT_URL = reverse("v1:auth-logout")
+    REFRESH_URL = reverse("v1:auth-refresh")
+
+    @staticmethod
+    def _request(method, token):
+        factory = APIRequestFactory()
+        return getattr(factory, method)("/", HTTP_AUTHORIZATION=f"Bearer {token}")
+
+    def test_safe_method_builds_user_from_claims(self, user, django_assert_num_queries):
+        """
+        Test that GET requests are authenticated without touching the database.
+        Expected: No queries; id, email, role and is_staff taken from the token.
+        """
+        access = AuthService.generate_tokens_for_user(user)["access"]
+
+        with django_assert_num_queries(0):
+            authenticated, _ = ClaimsJWTAuthentication().authenticate(
+                self._request("get", access)
+            )
+
+        assert authenticated.pk == user.pk
+        assert authenticated.email == user.email
+        assert authenticated.role == user.role
+        assert authenticated.is_staff is user.is_staff
+
+    def test_unsafe_method_loads_user(self, user, django_assert_num_queries):
+        """
+        Test that write requests still load the user row.
+        Expected: One query.
+        """
+        access = AuthService.generate_tokens_for_user(user)["access"]
+
+        with django_assert_num_queries(1):
+            ClaimsJWTAuthentication().authenticate(self._request("post", access))
+
+    def test_token_without_claims_uses_user_cache(
+        self, user, django_assert_num_queries
+    ):
+        """
+        Test that tokens lacking the role claims fall back to the user cache.
+        Expected: One query on the first read, none on the second.
+        """
+        access = str(AccessToken.for_user(user))
+        UserCacheService.invalidate(user.pk)
+
+        with django_assert_num_queries(1):
+            ClaimsJWTAuthentication().authenticate(self._request("get", access))
+        with django_assert_num_queries(0):
+            authenticated, _ = ClaimsJWTAuthentication().authenticate(
+                self._request("get", access)
+            )
+
+        assert authenticated.full_name == user.full_name
+
+    def test_token_without_claims_rejects_inactive_user(self, api_client, user):
+        """
+        Test that the cached fallback enforces is_active.
+        Expected: 401 Unauthorized after deactivation.
+        """
+        access = str(AccessToken.for_user(user))
+        user.is_active = False
+        user.save()
+
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {access}")
+        response = api_client.get(self.ME_URL)
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_write_rejects_inactive_user(self, api_client, user):
+        """
+        Test that write requests enforce is_active even with claims present.
+        Expected: 401 Unauthorized.
+        """
+        tokens = AuthService.generate_tokens_for_user(user)
+        user.is_active = False
+        user.save()
+
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {tokens['access']}")
+        response = api_client.post(self.LOGOUT_URL, {"refresh": tokens["refresh"]})
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_refresh_rejects_inactive_user(self, api_client, user):
+        """
+        Test that claims cannot be renewed for a deactivated user.
+        Expected: 401 Unauthorized on refresh.
+        """
+        refresh = AuthService.generate_tokens_for_user(user)["refresh"]
+        user.is_active = False
+        user.save()
+
+        response = api_client.post(self.REFRESH_URL, {"refresh": refresh})
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_me_reflects_profile_changes(self, api_client, user):
+        """
+        Test that the cached profile is invalidated when the user is saved.
+        Expected: The new full name is returned.
+        """
+        access = AuthService.generate_tokens_for_user(user)["access"]
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {access}")
+        api_client.get(self.ME_URL)
+
+        user.full_name = "Renamed Player"
+        user.save()
+        response = api_client.get(self.ME_URL)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["full_name"] == "Renamed Player"
+
+    def test_me_rejects_deleted_user(self, api_client, user):
+        """
+        Test that a still-valid token of a deleted user gets no profile.
+        Expected: 401 Unauthorized instead of an empty 200.
+        """
+        access = AuthService.generate_tokens_for_user(user)["access"]
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {access}")
+        user.delete()
+
+        response = api_client.get(self.ME_URL)
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
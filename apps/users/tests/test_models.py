@@ -53,3 +53,22 @@ class TestUserModel:
         assert admin.is_superuser is True
         assert admin.is_staff is True
         assert admin.role == UserRole.ADMIN
+
+    def test_email_uniqueness_ignores_case(self):
+        """
+        Verifies the functional unique index on LOWER(email).
+        Expected: IntegrityError for an address differing only in case.
+        """
+        User.objects.create(email="Case@example.com", full_name="User 1")
+        with pytest.raises(IntegrityError):
+            User.objects.create(email="case@EXAMPLE.com", full_name="User 2")
+
+    def test_natural_key_lookup_ignores_case(self):
+        """
+        Verifies that ModelBackend's lookup matches any email casing.
+        Expected: The same user for mixed-case input.
+        """
+        user = UserFactory(email="mixed.Case@example.com")
+
+        assert User.objects.get_by_natural_key("MIXED.case@Example.com") == user
+        assert list(User.objects.by_email("MIXED.CASE@example.com")) == [user]
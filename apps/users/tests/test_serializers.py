@@ -66,3 +66,18 @@ class TestUserSerializer:
 
         assert serializer.is_valid() is False
         assert "email" in serializer.errors
+
+    def test_email_case_variant_rejected(self, user):
+        """
+        Test that an email differing only in case counts as taken.
+        Expected: is_valid() returns False with an email error.
+        """
+        data = {
+            "email": user.email.upper(),
+            "full_name": "Case Variant",
+            "password": "password123",
+        }
+        serializer = UserSerializer(data=data)
+
+        assert serializer.is_valid() is False
+        assert "email" in serializer.errors
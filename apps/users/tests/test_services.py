@@ -1,13 +1,31 @@
 # apps/users/tests/test_services.py
 """
-Unit tests for AuthService.
+Unit tests for the users services.
 Validates JWT lifecycle management: generation, rotation, and blacklisting.
 """
+import json
+import threading
+from datetime import timedelta
+
 import pytest
+from asgiref.sync import async_to_sync
+from django.core.cache import cache
+from django.utils import timezone
 from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.token_blacklist.models import (
+    BlacklistedToken,
+    OutstandingToken,
+)
 from rest_framework_simplejwt.tokens import RefreshToken
 
+from apps.core import metrics
+from apps.users.enums.user_role import UserRole
+from apps.users.models.user import User
 from apps.users.services.auth_service import AuthService
+from apps.users.services.login_service import LoginBusy, LoginService
+from apps.users.services.token_blacklist_service import TokenBlacklistService
+from apps.users.services.user_import_service import UserImportService
+from apps.users.tokens import CachedRefreshToken
 
 
 @pytest.mark.django_db
@@ -74,3 +92,217 @@ class TestAuthService:
         """
         with pytest.raises(Exception):
             AuthService.refresh_tokens("not.a.valid.token")
+
+    def test_rotated_refresh_token_is_usable(self, user):
+        """
+        Test that the refresh token returned by a rotation has a new JTI.
+        Expected: The rotated token can itself be refreshed.
+        """
+        tokens = AuthService.generate_tokens_for_user(user)
+
+        rotated = AuthService.refresh_tokens(tokens["refresh"])
+        again = AuthService.refresh_tokens(rotated["refresh"])
+
+        assert "refresh" in again
+
+
+@pytest.mark.django_db
+class TestTokenBlacklistService:
+    """
+    Tests for the cached blacklist and the expired-token pruning.
+    """
+
+    def test_blacklist_checks_are_cached(self, user, django_assert_num_queries):
+        """
+        Test that a blacklisted JTI is answered from the cache.
+        Expected: No queries when rejecting a revoked token.
+        """
+        refresh = AuthService.generate_tokens_for_user(user)["refresh"]
+        AuthService.logout(refresh)
+
+        with django_assert_num_queries(0):
+            with pytest.raises(TokenError):
+                CachedRefreshToken(refresh)
+
+    def test_cache_miss_falls_back_to_database(self, user):
+        """
+        Test that a token blacklisted outside the cache is still rejected.
+        Expected: TokenError once the cache entry is gone.
+        """
+        refresh = AuthService.generate_tokens_for_user(user)["refresh"]
+        AuthService.logout(refresh)
+        cache.delete(
+            TokenBlacklistService.key(RefreshToken(refresh, verify=False)["jti"])
+        )
+
+        with pytest.raises(TokenError):
+            CachedRefreshToken(refresh)
+
+    def test_prune_deletes_only_expired_tokens(self, user):
+        """
+        Test that pruning removes expired rows in chunks and keeps live ones.
+        Expected: Expired outstanding/blacklisted rows deleted, live row kept.
+        """
+        past = timezone.now() - timedelta(days=1)
+        for index in range(5):
+            token = OutstandingToken.objects.create(
+                user=user, jti=f"expired-{index}", token="t", expires_at=past
+            )
+            if index % 2 == 0:
+                BlacklistedToken.objects.create(token=token)
+        AuthService.generate_tokens_for_user(user)
+
+        totals = TokenBlacklistService.prune(chunk_size=2)
+
+        assert totals == {"outstanding": 2, "blacklisted": 3}
+        assert OutstandingToken.objects.count() == 1
+        assert not BlacklistedToken.objects.exists()
+
+
+@pytest.mark.django_db
+class TestUserImportService:
+    """
+    Tests for bulk user provisioning.
+    """
+
+    @staticmethod
+    def _records(*records):
+        return UserImportService.parse(
+            [json.dumps(record) + "\n" for record in records], "jsonl"
+        )
+
+    def test_import_normalizes_and_hashes(self):
+        """
+        Test that imported users get normalized emails and usable passwords.
+        Expected: One user created; the password checks out; admin gets is_staff.
+        """
+        result = UserImportService.run(
+            self._records(
+                {
+                    "email": "Ana@Example.COM",
+                    "full_name": "Ana",
+                    "password": "secret-pass",
+                    "role": UserRole.ADMIN,
+                }
+            ),
+            workers=1,
+        )
+
+        user = User.objects.get(email="Ana@example.com")
+        assert result.imported == 1
+        assert user.check_password("secret-pass")
+        assert user.is_staff
+
+    def test_duplicates_are_reported_without_aborting(self, user):
+        """
+        Test that existing and repeated emails are rejected individually.
+        Expected: Only the new email is imported; two duplicate rejections.
+        """
+        result = UserImportService.run(
+            self._records(
+                {"email": user.email, "full_name": "Dup", "password": "x"},
+                {"email": "new@example.com", "full_name": "New", "password": "x"},
+                {"email": "new@EXAMPLE.com", "full_name": "Again", "password": "x"},
+                {"email": "not-an-email", "full_name": "Bad", "password": "x"},
+            ),
+            workers=1,
+        )
+
+        assert result.imported == 1
+        assert result.rejected == 3
+        assert sorted(r["line"] for r in result.rejections) == [1, 3, 4]
+
+    def test_csv_import_hashes_in_process_pool(self):
+        """
+        Test that a CSV file is imported with passwords hashed by worker processes.
+        Expected: All users created with valid password hashes.
+        """
+        lines = ["email,full_name,password\n"] + [
+            f"player{i}@example.com,Player {i},pw-{i}\n" for i in range(4)
+        ]
+
+        result = UserImportService.run(
+            UserImportService.parse(lines, "csv"), batch_size=2, workers=2
+        )
+
+        assert result.imported == 4
+        assert User.objects.get(email="player3@example.com").check_password("pw-3")
+
+
+@pytest.mark.django_db
+class TestLoginService:
+    """
+    Tests for credential verification on the bounded login pool.
+    """
+
+    def test_authenticate_checks_credentials(self, user):
+        """
+        Test that verification accepts the right password only.
+        Expected: The user for the right password, None otherwise.
+        """
+        assert LoginService.authenticate(user.email, "password123") == user
+        assert LoginService.authenticate(user.email, "wrong") is None
+        assert LoginService.authenticate("nobody@example.com", "password123") is None
+
+    def test_authenticate_rejects_inactive_user(self, user):
+        """
+        Test that inactive accounts cannot log in.
+        Expected: None even with the right password.
+        """
+        user.is_active = False
+        user.save()
+
+        assert LoginService.authenticate(user.email, "password123") is None
+
+    def test_login_waits_for_a_hashing_slot(self, settings, monkeypatch, user):
+        """
+        Test that a login arriving while every slot is busy waits (within
+        SYNC_WAIT) instead of being refused, and is counted while waiting.
+        Expected: The user once the slot is released; queue depth 1 while
+        waiting and 0 afterwards.
+        """
+        settings.LOGIN = dict(settings.LOGIN, SYNC_WAIT=5)
+        slots = threading.BoundedSemaphore(1)
+        monkeypatch.setattr(LoginService, "_sync_slots", slots)
+        slots.acquire()
+        depth_while_waiting = []
+
+        def release():
+            depth_while_waiting.append(metrics.LOGIN_QUEUE_DEPTH._value.get())
+            slots.release()
+
+        threading.Timer(0.2, release).start()
+
+        assert LoginService.authenticate(user.email, "password123") == user
+        assert depth_while_waiting == [1]
+        assert metrics.LOGIN_QUEUE_DEPTH._value.get() == 0
+
+    def test_no_free_slot_refuses_login(self, settings, monkeypatch, user):
+        """
+        Test that a login that cannot start within SYNC_WAIT is refused.
+        Expected: LoginBusy and the rejection counter increases.
+        """
+        settings.LOGIN = dict(settings.LOGIN, SYNC_WAIT=0)
+        monkeypatch.setattr(LoginService, "_sync_slots", threading.BoundedSemaphore(0))
+        before = metrics.LOGIN_REJECTED._value.get()
+
+        with pytest.raises(LoginBusy):
+            LoginService.authenticate(user.email, "password123")
+
+        assert metrics.LOGIN_REJECTED._value.get() == before + 1
+        assert metrics.LOGIN_QUEUE_DEPTH._value.get() == 0
+
+    def test_async_authenticate(self, user):
+        """
+        Test the coroutine variant used by AsyncLoginView.
+        Expected: Same verdicts as the sync path.
+        """
+        assert async_to_sync(LoginService.aauthenticate)(user.email, "password123")
+        assert async_to_sync(LoginService.aauthenticate)(user.email, "nope") is None
+
+    def test_authenticate_ignores_email_case(self, user):
+        """
+        Test that login matches the email in any casing.
+        Expected: The user is returned for an upper-cased email.
+        """
+        assert LoginService.authenticate(user.email.upper(), "password123") == user
@@ -4,9 +4,13 @@ Integration tests for User and Auth API views.
 Verifies response structures and endpoint accessibility.
 """
 import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import override_settings
 from django.urls import reverse
 from rest_framework import status
 
+from apps.users.models.user import User
+
 
 @pytest.mark.django_db
 class TestUserViews:
@@ -73,3 +77,70 @@ class TestUserViews:
         response = api_client.get(url)
 
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_bulk_import_endpoint(self, api_client, admin_user):
+        """
+        Test that an admin can provision users from an uploaded CSV.
+        Expected: 200 OK with import counters; the user can log in.
+        """
+        upload = SimpleUploadedFile(
+            "users.csv",
+            b"email,full_name,password\nnew@example.com,New Player,pw-123\n",
+            "text/csv",
+        )
+        api_client.force_authenticate(user=admin_user)
+
+        response = api_client.post(
+            reverse("v1:user-import-users"), {"file": upload}, format="multipart"
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["imported"] == 1
+        assert response.data["rejected"] == 0
+
+    @override_settings(USER_IMPORT={"WORKERS": 1, "UPLOAD_MAX_ROWS": 1})
+    def test_bulk_import_endpoint_rejects_large_files(self, api_client, admin_user):
+        """
+        Test that uploads over the row cap are refused before importing.
+        Expected: 400 Bad Request pointing to the management command and no
+        user created.
+        """
+        upload = SimpleUploadedFile(
+            "users.jsonl",
+            b'{"email": "a@example.com", "full_name": "A", "password": "pw"}\n'
+            b'{"email": "b@example.com", "full_name": "B", "password": "pw"}\n',
+        )
+        api_client.force_authenticate(user=admin_user)
+
+        response = api_client.post(
+            reverse("v1:user-import-users"), {"file": upload}, format="multipart"
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "import_users" in str(response.data["file"])
+        assert not User.objects.filter(email="a@example.com").exists()
+
+    def test_bulk_import_requires_admin(self, api_client, user):
+        """
+        Test that players cannot provision users.
+        Expected: 403 Forbidden.
+        """
+        api_client.force_authenticate(user=user)
+
+        response = api_client.post(reverse("v1:user-import-users"), {})
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_user_list_filters_by_email(self, api_client, admin_user, user):
+        """
+        Test the admin lookup of a user by email in any casing.
+        Expected: Only the matching user is returned.
+        """
+        api_client.force_authenticate(user=admin_user)
+
+        response = api_client.get(
+            reverse("v1:user-list"), {"email": user.email.upper()}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [row["id"] for row in response.data["results"]] == [user.id]
@@ -0,0 +1,25 @@
+# apps/users/tokens.py
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from .services.token_blacklist_service import TokenBlacklistService
+
+
+class CachedRefreshToken(RefreshToken):
+    """
+    Refresh token whose blacklist lookups go through TokenBlacklistService.
+    """
+
+    def check_blacklist(self) -> None:
+        if TokenBlacklistService.is_blacklisted(
+            self.payload[api_settings.JTI_CLAIM], self.payload["exp"]
+        ):
+            raise TokenError("Token is blacklisted")
+
+    def blacklist(self):
+        result = super().blacklist()
+        TokenBlacklistService.mark_blacklisted(
+            self.payload[api_settings.JTI_CLAIM], self.payload["exp"]
+        )
+        return result
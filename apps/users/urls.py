@@ -1,21 +1,27 @@
 # apps/users/urls.py
+from django.conf import settings
 from django.urls import include, path
 from rest_framework.routers import DefaultRouter
 
+from apps.users.views.async_login_view import AsyncLoginView
 from apps.users.views.auth_viewset import AuthViewSet
 from apps.users.views.user_viewset import UserViewSet
 
 router = DefaultRouter()
 router.register(r"users", UserViewSet, basename="user")
 
+login_view = (
+    AsyncLoginView.as_view()
+    if settings.LOGIN["ASYNC_VIEW"]
+    else AuthViewSet.as_view({"post": "login"})
+)
+
 urlpatterns = [
     path(
         "auth/",
         include(
             [
-                path(
-                    "login/", AuthViewSet.as_view({"post": "login"}), name="auth-login"
-                ),
+                path("login/", login_view, name="auth-login"),
                 path(
                     "logout/",
                     AuthViewSet.as_view({"post": "logout"}),
@@ -0,0 +1,78 @@
+# apps/users/views/async_login_view.py
+import json
+import logging
+import math
+
+from asgiref.sync import sync_to_async
+from django.http import JsonResponse
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+
+from apps.core.throttling import ScopedRateThrottle
+
+from ..serializers.login_serializer import LoginSerializer
+from ..services.auth_service import AuthService
+from ..services.login_service import LoginBusy, LoginService
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncLoginView(View):
+    """
+    Native async login for ASGI deployments (LOGIN["ASYNC_VIEW"]).
+
+    Same contract as AuthViewSet.login, but the request awaits password
+    verification instead of blocking a thread. DRF views are sync-only,
+    hence a plain Django view.
+    """
+
+    http_method_names = ["post"]
+    throttle_scope = "login"
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        # Token endpoint: no session, so no CSRF (as with DRF's APIView)
+        return csrf_exempt(super().as_view(**initkwargs))
+
+    async def post(self, request):
+        throttle = ScopedRateThrottle()
+        if not await sync_to_async(throttle.allow_request)(request, self):
+            return self._retry_later(
+                "Request was throttled.", math.ceil(throttle.wait())
+            )
+
+        if request.content_type == "application/json":
+            try:
+                payload = json.loads(request.body or b"{}")
+            except ValueError:
+                return JsonResponse({"detail": "Invalid JSON."}, status=400)
+        else:
+            payload = request.POST
+
+        serializer = LoginSerializer(data=payload)
+        if not serializer.is_valid():
+            return JsonResponse(serializer.errors, status=400)
+
+        email = serializer.validated_data["email"]
+        try:
+            user = await LoginService.aauthenticate(
+                email, serializer.validated_data["password"]
+            )
+        except LoginBusy:
+            return self._retry_later("Too many logins in progress.", 1)
+
+        if user is None:
+            logger.warning(f"Unauthorized login attempt: {email}")
+            return JsonResponse(
+                {"detail": "Invalid credentials or inactive account"}, status=401
+            )
+
+        tokens = await sync_to_async(AuthService.generate_tokens_for_user)(user)
+        logger.info(f"User login successful: {user.email}")
+        return JsonResponse(tokens)
+
+    @staticmethod
+    def _retry_later(detail, wait):
+        response = JsonResponse({"detail": detail}, status=429)
+        response["Retry-After"] = str(wait)
+        return response
@@ -1,11 +1,10 @@
 # apps/users/views/auth_viewset.py
 import logging
 
-from django.contrib.auth import authenticate
 from drf_spectacular.utils import extend_schema
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
-from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.exceptions import AuthenticationFailed, Throttled
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 
@@ -17,6 +16,8 @@ from ..serializers.token_serializer import (
     TokenPairSerializer,
 )
 from ..services.auth_service import AuthService
+from ..services.login_service import LoginBusy, LoginService
+from ..services.user_cache_service import UserCacheService
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +28,8 @@ class AuthViewSet(viewsets.ViewSet):
     Includes login, token refresh, logout, and current user profile.
     """
 
+    throttle_scopes = {"login": "login"}
+
     permission_classes_by_action = {
         "login": [AllowAny],
         "refresh": [AllowAny],
@@ -49,16 +52,20 @@ class AuthViewSet(viewsets.ViewSet):
     def login(self, request):
         """
         Verifies credentials and issues a fresh JWT pair.
+        Password hashing is bounded by LoginService; a login that cannot
+        start within LOGIN["SYNC_WAIT"] is refused with 429.
         """
         serializer = LoginSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
-        user = authenticate(
-            request=request,
-            email=serializer.validated_data["email"],
-            password=serializer.validated_data["password"],
-        )
-        if not user or not user.is_active:
+        try:
+            user = LoginService.authenticate(
+                serializer.validated_data["email"],
+                serializer.validated_data["password"],
+            )
+        except LoginBusy:
+            raise Throttled(wait=1, detail="Too many logins in progress.")
+        if user is None:
             logger.warning(
                 f"Unauthorized login attempt: {serializer.validated_data['email']}"
             )
@@ -107,6 +114,11 @@ class AuthViewSet(viewsets.ViewSet):
     def me(self, request):
         """
         Return current authenticated user's data.
+        Served from the short-lived user cache, not the users table.
+        Reads trust the token's claims, so a user deleted while the token
+        is still valid is only detected here.
         """
-        serializer = MeSerializer(request.user)
-        return Response(serializer.data)
+        user = UserCacheService.get(request.user.pk)
+        if user is None:
+            raise AuthenticationFailed("User not found", code="user_not_found")
+        return Response(MeSerializer(user).data)
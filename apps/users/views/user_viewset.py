@@ -1,11 +1,16 @@
 # apps/users/views/user_viewset.py
+import codecs
 import logging
 
 from rest_framework import permissions, viewsets
+from rest_framework.decorators import action
+from rest_framework.parsers import MultiPartParser
+from rest_framework.response import Response
 
 from ..enums.user_role import UserRole
 from ..models.user import User
-from ..serializers.user_serializer import UserSerializer
+from ..serializers.user_serializer import UserImportSerializer, UserSerializer
+from ..services.user_import_service import UserImportService
 
 logger = logging.getLogger(__name__)
 
@@ -19,14 +24,19 @@ class UserViewSet(viewsets.ModelViewSet):
     """
 
     queryset = User.objects.all()
-    serializer_class = UserSerializer
+    ordering = ("-date_joined", "-id")
+
+    def get_serializer_class(self):
+        if self.action == "import_users":
+            return UserImportSerializer
+        return UserSerializer
 
     def get_permissions(self):
         """
         Instantiates and returns the list of permissions that this view requires.
         Allows any user to register, but requires authentication for other actions.
         """
-        if self.action in ["create", "destroy"]:
+        if self.action in ["create", "destroy", "import_users"]:
             return [permissions.IsAdminUser()]
 
         return [permissions.IsAuthenticated()]
@@ -36,11 +46,18 @@ class UserViewSet(viewsets.ModelViewSet):
         Filters the queryset based on user roles.
         Administrators can access all records, while regular players
         are restricted to their own profile.
+        ?email= matches one address in any casing (index-backed).
         """
         user = self.request.user
         if user.is_authenticated and (user.is_staff or user.role == UserRole.ADMIN):
-            return User.objects.all()
-        return User.objects.filter(pk=user.pk)
+            queryset = User.objects.all()
+        else:
+            queryset = User.objects.filter(pk=user.pk)
+
+        email = self.request.query_params.get("email")
+        if email:
+            queryset = queryset.by_email(email)
+        return queryset
 
     def perform_create(self, serializer):
         """
@@ -56,3 +73,38 @@ class UserViewSet(viewsets.ModelViewSet):
         user_email = instance.email
         logger.warning(f"User deleted: {user_email} by {self.request.user.email}")
         instance.delete()
+
+    @action(
+        detail=False,
+        methods=["post"],
+        url_path="import",
+        parser_classes=[MultiPartParser],
+    )
+    def import_users(self, request):
+        """
+        Provisions users from an uploaded JSONL/CSV file of at most
+        USER_IMPORT["UPLOAD_MAX_ROWS"] records, synchronously.
+        Invalid and duplicate records are reported in the response and skipped.
+        """
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        upload = serializer.validated_data["file"]
+        # Small uploads only (UPLOAD_MAX_ROWS): hashing in this worker is
+        # cheaper than spawning a process pool per request.
+        result = UserImportService.run(
+            UserImportService.parse(
+                codecs.iterdecode(upload, "utf-8-sig"),
+                serializer.validated_data["file_format"],
+            ),
+            workers=0,
+        )
+
+        logger.info(
+            "User file %s imported by Admin %s: %s imported, %s rejected",
+            upload.name,
+            request.user.email,
+            result.imported,
+            result.rejected,
+        )
+        return Response(result.as_dict())
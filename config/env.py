@@ -113,6 +113,28 @@ class LoggingConfig:
     LEVEL: str = _get("LOG_LEVEL", default="INFO")
 
 
+# ======================================================
+# Observability
+# ======================================================
+@dataclass(frozen=True)
+class ObservabilityConfig:
+    REQUEST_TIMING: bool = _get("REQUEST_TIMING_ENABLED", default="true", cast=_to_bool)
+    METRICS: bool = _get("METRICS_ENABLED", default="true", cast=_to_bool)
+    # Bearer token required by /metrics/ (empty: rely on network policy)
+    METRICS_TOKEN: str = _get("METRICS_TOKEN", default="")
+
+
+# ======================================================
+# Server
+# ======================================================
+@dataclass(frozen=True)
+class ServerConfig:
+    # Serve auth/login/ from the native async view (ASGI deployments only)
+    ASYNC_LOGIN: bool = _get("ASYNC_LOGIN_ENABLED", default="false", cast=_to_bool)
+    # Request threads per gunicorn worker (sizes per-process concurrency limits)
+    THREADS: int = _get("GUNICORN_THREADS", default=2, cast=int)
+
+
 # ======================================================
 # Public, immutable config instances
 # ======================================================
@@ -121,3 +143,5 @@ secrets = SecretsConfig()
 database = DatabaseConfig()
 redis = RedisConfig()
 logging = LoggingConfig()
+observability = ObservabilityConfig()
+server = ServerConfig()
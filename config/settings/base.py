@@ -62,6 +62,8 @@ INSTALLED_APPS = DJANGO_APPS + THIRD_PARTY_APPS + LOCAL_APPS
 # MIDDLEWARE
 # ======================================================
 MIDDLEWARE = [
+    "apps.core.middleware.RequestTimingMiddleware",
+    "apps.core.middleware.MetricsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.locale.LocaleMiddleware",
@@ -98,10 +100,12 @@ DATABASES = {
 # ======================================================
 CACHES = {
     "default": {
-        "BACKEND": "django_redis.cache.RedisCache",
+        "BACKEND": "apps.core.cache.InstrumentedRedisCache",
         "LOCATION": env.redis.URL,
         "OPTIONS": {
             "CLIENT_CLASS": "django_redis.client.DefaultClient",
+            "SOCKET_CONNECT_TIMEOUT": 2,  # seconds
+            "SOCKET_TIMEOUT": 2,
         },
         "TIMEOUT": 300,
         "KEY_PREFIX": env.project.SLUG,
@@ -109,6 +113,21 @@ CACHES = {
 }
 
 
+# In-process LRU in front of the shared cache for per-trivia answer keys
+ANSWER_KEY_CACHE = {
+    "MAX_ENTRIES": 512,
+    "LOCAL_TTL": 10,  # seconds a worker may serve a key without re-checking
+    "TIMEOUT": 60 * 60,
+}
+
+# Rendered player-safe trivia detail payloads (versioned, see signals)
+TRIVIA_DETAIL_CACHE = {
+    "MAX_ENTRIES": 256,
+    "LOCAL_TTL": 5,
+    "TIMEOUT": 60 * 60,
+}
+
+
 # ======================================================
 # USER MODEL
 # ======================================================
@@ -207,6 +226,33 @@ SIMPLE_JWT = {
     "TOKEN_TYPE_CLAIM": "token_type",
 }
 
+# User rows served from cache to authorize reads
+AUTH_USER_CACHE = {
+    "MAX_ENTRIES": 4096,
+    "LOCAL_TTL": 5,
+    "TIMEOUT": 60,
+}
+
+# Login password verification (apps.users.services.login_service)
+LOGIN = {
+    "ASYNC_VIEW": env.server.ASYNC_LOGIN,  # auth/login/ served by AsyncLoginView
+    "WORKERS": 2,  # password hashing threads per process, async view
+    "MAX_PENDING": 32,  # logins in flight per process, async view
+    # Sync view hashes inline; one request thread stays free for other work
+    "MAX_CONCURRENT_SYNC": max(env.server.THREADS - 1, 1),
+    "SYNC_WAIT": 0.25,  # seconds a sync login waits for a hashing slot
+    "TIMEOUT": 5,  # seconds an async login may wait for verification
+}
+
+# Bulk user provisioning (apps.users.services.user_import_service)
+USER_IMPORT = {
+    "WORKERS": 4,  # password hashing processes, capped at the CPU count
+    # Largest upload imported by the API, hashed in the request worker: at
+    # ~0.5s per PBKDF2 hash this stays well within GUNICORN_TIMEOUT. Larger
+    # files go through `manage.py import_users`.
+    "UPLOAD_MAX_ROWS": 50,
+}
+
 
 # ======================================================
 # DJANGO REST FRAMEWORK
@@ -216,7 +262,7 @@ REST_FRAMEWORK = {
     # AUTH
     # ------------------------------------------------------------------
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "apps.users.authentication.ClaimsJWTAuthentication",
     ),
     "DEFAULT_PERMISSION_CLASSES": ("rest_framework.permissions.IsAuthenticated",),
     # ------------------------------------------------------------------
@@ -232,15 +278,25 @@ REST_FRAMEWORK = {
         "rest_framework.filters.SearchFilter",
     ),
     # ------------------------------------------------------------------
+    # PAGINATION
+    # ------------------------------------------------------------------
+    "DEFAULT_PAGINATION_CLASS": "apps.core.pagination.StableCursorPagination",
+    "PAGE_SIZE": 20,
+    # ------------------------------------------------------------------
     # THROTTLING
     # ------------------------------------------------------------------
     "DEFAULT_THROTTLE_CLASSES": (
-        "rest_framework.throttling.UserRateThrottle",
-        "rest_framework.throttling.AnonRateThrottle",
+        "apps.core.throttling.UserRateThrottle",
+        "apps.core.throttling.AnonRateThrottle",
+        "apps.core.throttling.ScopedRateThrottle",
     ),
     "DEFAULT_THROTTLE_RATES": {
         "user": "1000/hour",
         "anon": "100/hour",
+        # ScopedRateThrottle, on top of user/anon
+        "submit-answer": "120/minute",
+        "login": "10/minute",
+        "ranking": "60/minute",
     },
     # ------------------------------------------------------------------
     # VERSIONING
@@ -249,6 +305,10 @@ REST_FRAMEWORK = {
 }
 
 
+# Upper bound for the client-provided ?page_size= parameter
+API_MAX_PAGE_SIZE = 100
+
+
 # ======================================================
 # DRF SPECTACULAR (SWAGGER/OPENAPI)
 # ======================================================
@@ -283,6 +343,29 @@ CORS_ALLOW_HEADERS = list(default_headers) + [
 ]
 
 
+# ======================================================
+# REQUEST TIMING
+# ======================================================
+# Server-Timing header + one JSON log line per request (apps.core.middleware)
+REQUEST_TIMING = {
+    "ENABLED": env.observability.REQUEST_TIMING,
+    "HEADER": True,
+    "LOG": True,
+}
+
+# /ready/ probe (apps.core.readiness)
+READINESS = {
+    "TIMEOUT_MS": 500,  # per-dependency budget; slower counts as failed
+    "RESULT_TTL": 2,  # seconds a worker reuses its last result
+}
+
+# Prometheus /metrics (apps.core.metrics); see PROMETHEUS_MULTIPROC_DIR
+METRICS = {
+    "ENABLED": env.observability.METRICS,
+    "TOKEN": env.observability.METRICS_TOKEN,
+}
+
+
 # ======================================================
 # LOGGING
 # ======================================================
@@ -12,7 +12,7 @@ from drf_spectacular.views import (
     SpectacularSwaggerView,
 )
 
-from apps.core.views import HealthCheckView
+from apps.core.views import HealthCheckView, MetricsView, ReadinessView
 
 # API V1
 api_v1_patterns = [
@@ -24,6 +24,8 @@ api_v1_patterns = [
 urlpatterns = [
     path("admin/", admin.site.urls),
     path("health/", HealthCheckView.as_view(), name="health-check"),
+    path("ready/", ReadinessView.as_view(), name="readiness-check"),
+    path("metrics", MetricsView.as_view(), name="metrics"),
     # --- DOCUMENTATION API V1 ---
     path(
         "api/v1/schema/", SpectacularAPIView.as_view(api_version="v1"), name="schema-v1"
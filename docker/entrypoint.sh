@@ -25,4 +25,10 @@ if [ "$DJANGO_SETTINGS_MODULE" = "config.settings.production" ]; then
     python manage.py collectstatic --noinput --clear
 fi
 
+# Prometheus multiprocess samples must not survive a restart
+if [ -n "$PROMETHEUS_MULTIPROC_DIR" ]; then
+    rm -rf "$PROMETHEUS_MULTIPROC_DIR"
+    mkdir -p "$PROMETHEUS_MULTIPROC_DIR"
+fi
+
 exec "$@"
@@ -0,0 +1,13 @@
+# gunicorn.conf.py
+"""
+Gunicorn hooks. Loaded automatically from the working directory.
+"""
+import os
+
+
+def child_exit(server, worker):
+    """Drops live-gauge samples of dead workers (Prometheus multiprocess)."""
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess
+
+        multiprocess.mark_process_dead(worker.pid)